@@ -0,0 +1,74 @@
+import collections as _collections
+import functools as _functools
+
+
+# Results each builder keeps, the least recently used go first.
+CACHE_SIZE = 32
+
+
+Info = _collections.namedtuple ('Info', [ 'hits', 'misses', 'size', 'limit' ])
+
+# Every memoized builder by module and name, in the order they were defined.
+builders = {}
+
+
+def _frozen (value):
+
+    # Arguments as a hashable key, lists and dictionaries become tuples.
+
+    if isinstance (value, ( list, tuple )):
+        return tuple (_frozen (item) for item in value)
+    if isinstance (value, dict):
+        return tuple (sorted (( key, _frozen (item) ) for key, item in value.items ()))
+    return value
+
+
+def memoized (builder = None, size = CACHE_SIZE):
+
+    # Builders called again with the same arguments return the object built
+    # the first time. The objects are shared, so the callers must combine
+    # them into new objects and never change them, which the operators and
+    # transforms of the libraries do anyway. Arguments that cannot be
+    # hashed skip the cache.
+
+    if builder is None:
+        return _functools.partial (memoized, size = size)
+
+    results = _collections.OrderedDict ()
+    counts = { 'hits': 0, 'misses': 0 }
+
+    @_functools.wraps (builder)
+    def wrapper (*arguments, **keywords):
+        key = ( _frozen (arguments), _frozen (keywords) )
+        try:
+            hash (key)
+        except TypeError:
+            counts ['misses'] += 1
+            return builder (*arguments, **keywords)
+
+        if key in results:
+            counts ['hits'] += 1
+            results.move_to_end (key)
+            return results [key]
+
+        counts ['misses'] += 1
+        result = results [key] = builder (*arguments, **keywords)
+        if len (results) > size:
+            results.popitem (last = False)
+        return result
+
+    def cache_info ():
+        return Info (counts ['hits'], counts ['misses'], len (results), size)
+
+    def cache_clear ():
+        results.clear ()
+        counts.update (hits = 0, misses = 0)
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    builders [f'{builder.__module__}.{builder.__qualname__}'] = wrapper
+    return wrapper
+
+
+def statistics ():
+    return { name: builder.cache_info () for name, builder in builders.items () }
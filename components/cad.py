@@ -0,0 +1,55 @@
+import importlib as _importlib
+
+
+# Modules providing the names, searched in this order. They are imported
+# together on the first lookup, so a model whose outputs are current never
+# imports BOSL2 at all, while every output of a model that builds anything
+# gets the same includes whichever of its parts are built.
+PROVIDERS = [
+    'solid2',
+    'solid2.extensions.bosl2' ]
+
+# BOSL2 extensions a model declares with require, each adds its include
+# to the outputs.
+EXTENSIONS = {
+    'threading': 'solid2.extensions.bosl2.threading',
+    'gears': 'solid2.extensions.bosl2.gears' }
+
+# Core names that BOSL2 replaces with its own versions.
+OVERRIDES = dict.fromkeys ([
+    'back', 'child', 'children', 'circle', 'color', 'cube', 'cylinder', 'difference',
+    'down', 'fwd', 'hull', 'import_dxf', 'import_stl', 'intersection', 'intersection_for',
+    'left', 'linear_extrude', 'minkowski', 'mirror', 'multmatrix', 'offset', 'polygon',
+    'polyhedron', 'projection', 'render', 'resize', 'right', 'rotate', 'rotate_extrude',
+    'scale', 'sphere', 'square', 'surface', 'text', 'translate', 'union', 'up' ], 'solid2.extensions.bosl2')
+
+
+def resolver (namespace, providers, overrides):
+
+    # Resolved names are stored in the namespace,
+    # later lookups do not come here at all.
+
+    def resolve (name):
+        if not name.startswith ('_'):
+            modules = { provider: _importlib.import_module (provider) for provider in providers }
+            candidates = [ overrides [name] ] if name in overrides else providers
+            for provider in candidates:
+                if hasattr (modules [provider], name):
+                    namespace [name] = getattr (modules [provider], name)
+                    return namespace [name]
+        raise AttributeError (f'module {namespace ["__name__"]!r} has no attribute {name!r}')
+
+    return resolve
+
+
+def require (*names):
+
+    # Called by a model right after the import, before it makes any object,
+    # the order of the names is the order of the includes.
+
+    for name in names:
+        if EXTENSIONS [name] not in PROVIDERS:
+            PROVIDERS.append (EXTENSIONS [name])
+
+
+__getattr__ = resolver (globals (), PROVIDERS, OVERRIDES)
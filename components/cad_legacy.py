@@ -0,0 +1,12 @@
+from components.cad import resolver as _resolver
+
+
+# The same lazy facade for the original SolidPython,
+# whose import alone takes longer than most models.
+PROVIDERS = [ 'solid', 'solid.utils' ]
+
+# Names that the utilities replace.
+OVERRIDES = { 'extrude_along_path': 'solid.utils' }
+
+
+__getattr__ = _resolver (globals (), PROVIDERS, OVERRIDES)
@@ -1,4 +1,6 @@
-from solid import *
+from components import cad_legacy as cad
+from components.cache import memoized
 
+@memoized
 def hexagon (radius, height):
-    return cylinder (r = radius, h = height, segments = 6)
+    return cad.cylinder (r = radius, h = height, segments = 6)
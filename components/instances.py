@@ -0,0 +1,92 @@
+import numpy as _numpy
+
+
+# Loop variable of the emitted loops. Nested loops may reuse it,
+# an inner loop only moves its own prototype.
+VARIABLE = 'instance'
+
+# Loop variables of the lattice axes.
+INDICES = [ 'i', 'j', 'k' ]
+
+# Matrix entries are rounded like the folded transforms.
+DECIMALS = 12
+
+
+class Expression:
+
+    # OpenSCAD text passed through as it is, both libraries
+    # print values of types they do not know with str.
+
+    def __init__ (self, text):
+        self.text = text
+
+    def __str__ (self):
+        return self.text
+
+    def __repr__ (self):
+        return self.text
+
+
+def _rotations (angles):
+
+    # Rotation about X first, then Y, then Z, as OpenSCAD does, for all rows at once.
+
+    x, y, z = _numpy.radians (angles).T
+    cx, cy, cz = _numpy.cos (x), _numpy.cos (y), _numpy.cos (z)
+    sx, sy, sz = _numpy.sin (x), _numpy.sin (y), _numpy.sin (z)
+
+    return _numpy.stack ([
+        _numpy.stack ([ cy*cz, sx*sy*cz - cx*sz, cx*sy*cz + sx*sz ], axis = -1),
+        _numpy.stack ([ cy*sz, sx*sy*sz + cx*cz, cx*sy*sz - sx*cz ], axis = -1),
+        _numpy.stack ([ -sy, sx*cy, cx*cy ], axis = -1) ], axis = 1)
+
+
+def matrices (offsets, rotations = None):
+
+    # The 3x4 matrices placing every instance, rotated first, then moved.
+
+    offsets = _numpy.asarray (offsets, dtype = float).reshape (-1, 3)
+    result = _numpy.zeros (( len (offsets), 3, 4 ))
+    result [:, :, :3] = _numpy.identity (3)
+    if rotations is not None:
+        result [:, :, :3] = _rotations (_numpy.broadcast_to (_numpy.asarray (rotations, dtype = float), offsets.shape))
+    result [:, :, 3] = offsets
+    return _numpy.round (result, DECIMALS) + 0.0
+
+
+def _loop (prototype, variables, name, parameters):
+
+    # The same node type as the prototype, so that the tree stays in one library.
+
+    if hasattr (prototype, 'save_as_scad'):
+        from solid2.core.object_base import OpenSCADObject
+        return OpenSCADObject ('for', variables) (OpenSCADObject (name, parameters) (prototype))
+
+    from solid.solidpython import OpenSCADObject
+    return OpenSCADObject ('for', variables).add (OpenSCADObject (name, parameters).add (prototype))
+
+
+def instances (prototype, offsets, rotations = None):
+
+    # One copy of the prototype per row of offsets, optionally rotated by the
+    # matching row of angles, emitted as a single loop over the matrices.
+    # The prototype is only built and emitted once.
+
+    placements = matrices (offsets, rotations).tolist ()
+    return _loop (prototype, { VARIABLE: placements }, 'multmatrix', { 'm': Expression (VARIABLE) })
+
+
+def _vector (values):
+    return '[' + ', '.join (repr (round (float (value), DECIMALS) + 0.0) for value in values) + ']'
+
+
+def lattice (prototype, counts, steps, origin = ( 0, 0, 0 )):
+
+    # Copies at the origin plus every combination of whole multiples of the
+    # steps, one count and one step per axis. The loop ranges are emitted
+    # instead of the offsets, so the output does not grow with the counts.
+
+    indices = INDICES [:len (counts)]
+    ranges = { index: Expression (f'[0 : {int (count) - 1}]' if count >= 1 else '[]') for index, count in zip (indices, counts) }
+    offset = ' + '.join ([ _vector (origin), *[ f'{index} * {_vector (step)}' for index, step in zip (indices, steps) ] ])
+    return _loop (prototype, ranges, 'translate', { 'v': Expression (offset) })
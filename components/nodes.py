@@ -0,0 +1,230 @@
+import importlib as _importlib
+
+
+# Library facades the nodes turn into when a library renders them.
+SOLID2 = 'components.cad'
+SOLID = 'components.cad_legacy'
+
+# OpenSCAD modules and their keywords, trees of nodes that use nothing else
+# need no library. BOSL2 redefines some of the modules with more keywords.
+OPENSCAD_MODULES = {
+    'cube', 'sphere', 'cylinder', 'polyhedron', 'square', 'circle', 'polygon', 'text', 'import', 'surface',
+    'union', 'difference', 'intersection', 'hull', 'minkowski', 'render', 'group',
+    'translate', 'rotate', 'scale', 'mirror', 'multmatrix', 'color', 'offset', 'resize',
+    'linear_extrude', 'rotate_extrude', 'projection' }
+OPENSCAD_KEYWORDS = {
+    'size', 'center', 'r', 'd', 'r1', 'r2', 'd1', 'd2', 'h', 'points', 'faces', 'paths', 'convexity',
+    'v', 'a', 'm', 'c', 'alpha', 'delta', 'chamfer', 'newsize', 'auto', 'height', 'twist', 'slices',
+    'scale', 'angle', 'cut', 'file', 'layer', 'origin', 'invert', 'text', 'font', 'halign', 'valign',
+    'spacing', 'direction', 'language', 'script', '$fn', '$fa', '$fs' }
+
+# Keyword names that are not valid Python identifiers.
+_ESCAPES = { '_fn': '$fn', '_fa': '$fa', '_fs': '$fs', 'segments': '$fn' }
+
+
+class Node:
+
+    # A geometry node without the weight of the library objects, a name,
+    # a tuple of parameter pairs with integer names for positional ones and
+    # a tuple of children, which may also be library objects. Nodes never
+    # change, the operators and transforms return new ones. The emitter
+    # reads them directly, library objects are only made when a library
+    # renders the tree.
+
+    __slots__ = ( 'name', 'parameters', 'children', 'modifier' )
+
+    def __init__ (self, name, parameters = (), children = (), modifier = ''):
+        self.name = name
+        self.parameters = parameters
+        self.children = children
+        self.modifier = modifier
+
+    def __repr__ (self):
+        return f'Node ({self.name!r}, {len (self.children)} children)'
+
+    def __call__ (self, *children):
+        if any (isinstance (child, ( list, tuple )) for child in children):
+            children = [ item for child in children for item in (child if isinstance (child, ( list, tuple )) else [ child ]) ]
+        return Node (self.name, self.parameters, self.children + tuple (children), self.modifier)
+
+    def _operation (self, name, other):
+
+        # Flattened like the library operators do it, a chain
+        # of additions gives one union and not a deep nest.
+
+        if self.name == name and not self.parameters and not self.modifier:
+            return self (other)
+        return Node (name, (), ( self, other ))
+
+    def __add__ (self, other):
+        return self._operation ('union', other)
+
+    def __sub__ (self, other):
+        return self._operation ('difference', other)
+
+    def __mul__ (self, other):
+        return self._operation ('intersection', other)
+
+    def __radd__ (self, other):
+        # Only the start of a sum gets here, library objects make their own unions.
+        return self if other == 0 else Node ('union', (), ( other, self ))
+
+    def _render (self):
+        # SolidPython 2 objects take nodes as children, its
+        # renderer gets them converted to its own objects.
+        return solid (self, SOLID2)._render ()
+
+    def _transform (self, name, parameters):
+        return Node (name, parameters, ( self, ))
+
+    def translate (self, v):
+        return self._transform ('translate', (( 'v', v ),))
+
+    def rotate (self, a, v = None):
+        return self._transform ('rotate', (( 'a', a ),) if v is None else (( 'a', a ), ( 'v', v )))
+
+    def scale (self, v):
+        return self._transform ('scale', (( 'v', v ),))
+
+    def mirror (self, v):
+        return self._transform ('mirror', (( 'v', v ),))
+
+    def color (self, c, alpha = None):
+        return self._transform ('color', (( 'c', c ),) if alpha is None else (( 'alpha', alpha ), ( 'c', c )))
+
+    def up (self, z):
+        return self.translate (( 0, 0, z ))
+
+    def down (self, z):
+        return self.translate (( 0, 0, - z ))
+
+    def right (self, x):
+        return self.translate (( x, 0, 0 ))
+
+    def left (self, x):
+        return self.translate (( - x, 0, 0 ))
+
+    def back (self, y):
+        return self.translate (( 0, y, 0 ))
+
+    def fwd (self, y):
+        return self.translate (( 0, - y, 0 ))
+
+
+def node (name, *arguments, **keywords):
+
+    # Positional arguments keep their order, keywords are sorted like the
+    # libraries sort them and unset ones are left out.
+
+    parameters = tuple (enumerate (arguments))
+    if keywords:
+        named = { _ESCAPES.get (key, key): value for key, value in keywords.items () if value is not None }
+        parameters += tuple (sorted (named.items ()))
+    return Node (name, parameters)
+
+
+def translate (v):
+    return node ('translate', v = v)
+
+
+def rotate (a, v = None):
+    return node ('rotate', a = a, v = v)
+
+
+def scale (v):
+    return node ('scale', v = v)
+
+
+def mirror (v):
+    return node ('mirror', v = v)
+
+
+def color (c, alpha = None):
+    return node ('color', c = c, alpha = alpha)
+
+
+def libraries (root):
+
+    # Library objects among the nodes, in the order they are met.
+
+    found = []
+    seen = set ()
+    pending = [ root ]
+    while pending:
+        item = pending.pop ()
+        if id (item) in seen:
+            continue
+        seen.add (id (item))
+        if isinstance (item, Node):
+            pending.extend (reversed (item.children))
+        else:
+            found.append (item)
+    return found
+
+
+def plain (root):
+
+    # Whether the nodes use only OpenSCAD itself.
+
+    seen = set ()
+    pending = [ root ]
+    while pending:
+        item = pending.pop ()
+        if id (item) in seen or not isinstance (item, Node):
+            continue
+        seen.add (id (item))
+        if item.name not in OPENSCAD_MODULES:
+            return False
+        if any (not isinstance (key, int) and key not in OPENSCAD_KEYWORDS for key, value in item.parameters):
+            return False
+        pending.extend (item.children)
+    return True
+
+
+def library (root):
+
+    # The facade of the library objects in the tree. Nodes alone need
+    # no library when they are plain OpenSCAD, which is None, and
+    # SolidPython 2 with BOSL2 otherwise.
+
+    for item in libraries (root):
+        return SOLID2 if hasattr (item, 'save_as_scad') else SOLID
+    return None if plain (root) else SOLID2
+
+
+def _keyword (key, facade):
+    if key == '$fn' and facade == SOLID:
+        return 'segments'
+    return key.replace ('$', '_')
+
+
+def solid (root, facade = None):
+
+    # The same tree made of library objects, shared nodes become shared objects.
+
+    # Plain nodes render the same in both, SolidPython adds no includes.
+    facade = facade or library (root) or SOLID
+    cad = _importlib.import_module (facade)
+    memo = {}
+
+    def convert (item):
+        if not isinstance (item, Node):
+            return item
+        if id (item) not in memo:
+            arguments = [ value for key, value in item.parameters if isinstance (key, int) ]
+            keywords = { _keyword (key, facade): value for key, value in item.parameters if not isinstance (key, int) }
+            children = [ convert (child) for child in item.children ]
+            object = getattr (cad, item.name) (*arguments, **keywords)
+            memo [id (item)] = object (*children) if children else object
+        return memo [id (item)]
+
+    return convert (root)
+
+
+def __getattr__ (name):
+
+    # Any other OpenSCAD or BOSL2 module, taking the same arguments as in the libraries.
+
+    if name.startswith ('_'):
+        raise AttributeError (f'module {__name__!r} has no attribute {name!r}')
+    return lambda *arguments, **keywords: node (name, *arguments, **keywords)
@@ -0,0 +1,447 @@
+import math as _math
+
+import numpy as _numpy
+
+from helpers import emit as _emit
+from helpers import optimize as _optimize
+
+
+# Bounds are arrays of the lowest and the highest corner, None stands for
+# no geometry at all. They are conservative, the shape may be smaller but
+# is never larger. Anything not understood is unbounded.
+UNBOUNDED = _numpy.array ([ [ -_math.inf ] * 3, [ _math.inf ] * 3 ])
+
+# Slack for comparisons, generated coordinates carry rounding errors.
+EPSILON = 1e-9
+
+# BOSL2 anchor constants.
+ANCHORS = {
+    'CENTER': ( 0, 0, 0 ), 'CTR': ( 0, 0, 0 ),
+    'UP': ( 0, 0, 1 ), 'TOP': ( 0, 0, 1 ),
+    'DOWN': ( 0, 0, -1 ), 'BOTTOM': ( 0, 0, -1 ), 'BOT': ( 0, 0, -1 ),
+    'LEFT': ( -1, 0, 0 ), 'RIGHT': ( 1, 0, 0 ),
+    'FWD': ( 0, -1, 0 ), 'FRONT': ( 0, -1, 0 ), 'FORWARD': ( 0, -1, 0 ),
+    'BACK': ( 0, 1, 0 ),
+    'ALLNEG': ( -1, -1, -1 ), 'ALLPOS': ( 1, 1, 1 ) }
+
+# Parameter names in positional order.
+_PRIMITIVES = {
+    'cube': [ 'size', 'center' ],
+    'cuboid': [ 'size', 'p1', 'p2' ],
+    'square': [ 'size', 'center' ],
+    'sphere': [ 'r' ],
+    'circle': [ 'r' ],
+    'cylinder': [ 'h', 'r1', 'r2', 'center' ],
+    'cyl': [ 'h', 'r', 'center' ],
+    'threaded_rod': [ 'd', 'l', 'pitch' ],
+    'trapezoidal_threaded_rod': [ 'd', 'l', 'pitch' ],
+    'generic_threaded_rod': [ 'd', 'l', 'pitch', 'profile' ],
+    'rotate_sweep': [ 'shape', 'angle' ],
+    'polygon': [ 'points' ],
+    'polyhedron': [ 'points' ],
+    'linear_extrude': [ 'height', 'center' ],
+    'rotate_extrude': [ 'angle' ],
+    'offset': [ 'r' ],
+    'projection': [ 'cut' ],
+    'zrot_copies': [ 'rots', 'cp', 'n' ],
+    'xcopies': [ 'spacing', 'n', 'l', 'sp' ],
+    'ycopies': [ 'spacing', 'n', 'l', 'sp' ],
+    'zcopies': [ 'spacing', 'n', 'l', 'sp' ] }
+
+# Axes of the BOSL2 linear copies.
+_COPIES = { 'xcopies': 0, 'ycopies': 1, 'zcopies': 2 }
+
+# BOSL2 threads, bounded like cylinders.
+_RODS = [ 'threaded_rod', 'trapezoidal_threaded_rod', 'generic_threaded_rod' ]
+
+# Shear factors of skew by matrix position.
+_SKEWS = { 'sxy': ( 0, 1 ), 'sxz': ( 0, 2 ), 'syx': ( 1, 0 ), 'syz': ( 1, 2 ), 'szx': ( 2, 0 ), 'szy': ( 2, 1 ) }
+
+# BOSL2 arguments of primitives that the bounds do not account for.
+_UNMODELED = [ 'align', 'shift', 'extra', 'extra1', 'extra2', 'texture', 'tex_depth' ]
+
+# Nodes whose shape is the union of their children.
+_GROUPS = [ 'union', 'group', 'color', 'render', 'hull' ]
+
+
+def _arguments (node):
+    names = _PRIMITIVES.get (node.name, [])
+    return { names [key] if isinstance (key, int) and key < len (names) else key: value for key, value in node.parameters }
+
+
+def _first (arguments, *names, default = None):
+    for name in names:
+        if arguments.get (name) is not None:
+            return arguments [name]
+    return default
+
+
+def _radius (arguments, radius, diameter, default = 1):
+    if arguments.get (radius) is not None:
+        return float (arguments [radius])
+    if arguments.get (diameter) is not None:
+        return float (arguments [diameter]) / 2
+    return None if default is None else float (default)
+
+
+def _box (low, high):
+    return _numpy.array ([ low, high ], dtype = float)
+
+
+def _corners (box):
+    # The eight corners as homogeneous rows.
+    x, y, z = _numpy.meshgrid (box [:, 0], box [:, 1], box [:, 2], indexing = 'ij')
+    return _numpy.stack ([ x.ravel (), y.ravel (), z.ravel (), _numpy.ones (8) ], axis = 1)
+
+
+def transformed (box, matrix):
+    if box is None:
+        return None
+    if not _numpy.isfinite (box).all () or not _numpy.array_equal (matrix [3], ( 0, 0, 0, 1 )):
+        return UNBOUNDED
+    points = _corners (box) @ matrix.T
+    return _box (points [:, :3].min (axis = 0), points [:, :3].max (axis = 0))
+
+
+def merged (boxes):
+    boxes = [ box for box in boxes if box is not None ]
+    if not boxes:
+        return None
+    return _box (_numpy.min ([ box [0] for box in boxes ], axis = 0), _numpy.max ([ box [1] for box in boxes ], axis = 0))
+
+
+def overlap (boxes):
+    if any (box is None for box in boxes):
+        return None
+    box = _box (_numpy.max ([ box [0] for box in boxes ], axis = 0), _numpy.min ([ box [1] for box in boxes ], axis = 0))
+    return None if (box [0] > box [1] + EPSILON).any () else box
+
+
+def disjoint (first, second):
+    # Touching boxes are not disjoint, the shapes may share a face.
+    if first is None or second is None:
+        return True
+    return bool ((first [1] < second [0] - EPSILON).any () or (second [1] < first [0] - EPSILON).any ())
+
+
+def contains (outer, inner):
+    if inner is None:
+        return True
+    if outer is None:
+        return False
+    return bool ((outer [0] <= inner [0] + EPSILON).all () and (inner [1] <= outer [1] + EPSILON).all ())
+
+
+def pairwise_disjoint (boxes):
+
+    # Sorted by the low X, every box is only compared with the boxes
+    # that start before it ends, the others are apart along X.
+
+    boxes = _numpy.array ([ box for box in boxes if box is not None ]).reshape (-1, 2, 3)
+    boxes = boxes [_numpy.argsort (boxes [:, 0, 0], kind = 'stable')]
+    low, high = boxes [:, 0], boxes [:, 1]
+    ends = _numpy.searchsorted (low [:, 0], high [:, 0] + EPSILON, side = 'right')
+    for index, end in enumerate (ends):
+        others = slice (index + 1, end)
+        apart = (high [index] < low [others] - EPSILON).any (axis = 1) | (high [others] < low [index] - EPSILON).any (axis = 1)
+        if not apart.all ():
+            return False
+    return True
+
+
+def size (box):
+    return None if box is None else box [1] - box [0]
+
+
+# Primitives
+
+
+def _anchor (value):
+
+    # Anchors are vectors or BOSL2 constant expressions such as BOTTOM + LEFT.
+
+    if value is None:
+        return _numpy.zeros (3)
+    if isinstance (value, (list, tuple)):
+        return _numpy.asarray (value, dtype = float)
+    text = str (value)
+    if not set (text) <= set ('ABCDEFGHIJKLMNOPQRSTUVWXYZ_0123456789.+-*() '):
+        raise ValueError (text)
+    return _numpy.asarray (eval (text, { '__builtins__': {} }, { name: _numpy.array (vector, dtype = float) for name, vector in ANCHORS.items () }), dtype = float)
+
+
+def _attached (box, arguments, center, round, spherical = False):
+
+    # Where BOSL2 places a shape centered at the origin. The anchor point moves
+    # to the origin, then the shape spins about Z and turns towards orient.
+    # Round shapes have their anchors on the circle around Z, spheres on the
+    # sphere itself.
+
+    anchor = _anchor (arguments.get ('anchor', center))
+    half = (box [1] - box [0]) / 2
+    if spherical and anchor.any ():
+        anchor = anchor / _numpy.linalg.norm (anchor)
+    elif round and anchor [:2].any ():
+        anchor [:2] = anchor [:2] / _numpy.linalg.norm (anchor [:2])
+    box = box - anchor * half
+
+    spin = _math.radians (float (arguments.get ('spin') or 0))
+    if spin:
+        matrix = _numpy.identity (4)
+        matrix [:2, :2] = [ [ _math.cos (spin), -_math.sin (spin) ], [ _math.sin (spin), _math.cos (spin) ] ]
+        box = transformed (box, matrix)
+
+    orient = arguments.get ('orient')
+    if orient is not None and not _numpy.allclose (_anchor (orient), ( 0, 0, 1 )):
+        reach = _numpy.abs (box).max (axis = 0)
+        reach = _numpy.linalg.norm (reach)
+        box = _box ([ -reach ] * 3, [ reach ] * 3)
+
+    return box
+
+
+def _flare (arguments):
+
+    # Negative roundings and chamfers flare outwards.
+
+    values = [ value for key, value in arguments.items () if key.startswith (( 'rounding', 'chamfer' )) and isinstance (value, (int, float)) ]
+    return max ([ 0, *[ -value for value in values ] ])
+
+
+def _sized (arguments, dimensions):
+    size = arguments.get ('size', 1)
+    if _numpy.ndim (size):
+        return _numpy.asarray (size, dtype = float) [:dimensions]
+    return _numpy.full (dimensions, float (size))
+
+
+def _centered (size, arguments, default):
+    # Core semantics, or BOSL2 ones when an anchor is given.
+    if 'anchor' in arguments or 'spin' in arguments or 'orient' in arguments:
+        return _attached (_box (-size / 2, size / 2), arguments, default, False)
+    if arguments.get ('center'):
+        return _box (-size / 2, size / 2)
+    return _box (_numpy.zeros (3), size)
+
+
+def _circumscribed (arguments):
+
+    # Polygons around the circle instead of inside it reach further by the
+    # number of sides, three sides when the number is not given here.
+
+    if not arguments.get ('circum'):
+        return 1
+    sides = int (arguments.get ('$fn') or 0)
+    return 1 / _math.cos (_math.pi / max (sides, 3))
+
+
+def _primitive (node, arguments):
+
+    name = node.name
+
+    # Arguments that move or grow the shape in ways not modelled here.
+    if any (arguments.get (key) is not None for key in _UNMODELED):
+        return UNBOUNDED
+
+    if name == 'cube':
+        size = _sized (arguments, 3)
+        return _centered (size, arguments, None if arguments.get ('center') else 'ALLNEG')
+
+    if name == 'square':
+        size = _numpy.append (_sized (arguments, 2), 0)
+        return _centered (size, arguments, None if arguments.get ('center') else 'ALLNEG')
+
+    if name == 'cuboid':
+        if arguments.get ('p1') is not None and arguments.get ('p2') is not None:
+            return _box (_numpy.minimum (arguments ['p1'], arguments ['p2']), _numpy.maximum (arguments ['p1'], arguments ['p2']))
+        size = _sized (arguments, 3)
+        flare = _flare (arguments)
+        size = size + ( 2 * flare, 2 * flare, 0 )
+        box = _attached (_box (-size / 2, size / 2), arguments, None, False)
+        if arguments.get ('p1') is not None:
+            box = box - box [0] + _numpy.asarray (arguments ['p1'], dtype = float)
+        return box
+
+    if name in [ 'sphere', 'circle' ]:
+        radius = _radius (arguments, 'r', 'd') * _circumscribed (arguments)
+        box = _box ([ -radius, -radius, -radius if name == 'sphere' else 0 ], [ radius, radius, radius if name == 'sphere' else 0 ])
+        return _attached (box, arguments, None, True, name == 'sphere') if 'anchor' in arguments else box
+
+    if name in [ 'cylinder', 'cyl' ]:
+        height = float (_first (arguments, 'h', 'l', 'height', 'length', default = 1))
+        radius = _radius (arguments, 'r', 'd')
+        radii = [ _radius (arguments, 'r1', 'd1', default = radius), _radius (arguments, 'r2', 'd2', default = radius) ]
+        radius = max (radii) * _circumscribed (arguments) + (_flare (arguments) if name == 'cyl' else 0)
+        box = _box ([ -radius, -radius, -height / 2 ], [ radius, radius, height / 2 ])
+        if name == 'cyl' or 'anchor' in arguments or 'spin' in arguments or 'orient' in arguments:
+            default = 'BOTTOM' if name == 'cylinder' and not arguments.get ('center') else None
+            if name == 'cyl' and arguments.get ('center') is False:
+                default = 'BOTTOM'
+            return _attached (box, arguments, default, True)
+        return box if arguments.get ('center') else box + ( 0, 0, height / 2 )
+
+    if name in _RODS:
+        height = float (_first (arguments, 'l', 'h', 'length', 'height'))
+        radius = _numpy.max (_first (arguments, 'd', 'd1', 'd2')) / 2
+        if arguments.get ('d1') is not None and arguments.get ('d2') is not None:
+            radius = max (arguments ['d1'], arguments ['d2']) / 2
+        # Internal threads are enlarged by the clearance.
+        if arguments.get ('internal'):
+            radius += float (arguments.get ('pitch', 0))
+        box = _box ([ -radius, -radius, -height / 2 ], [ radius, radius, height / 2 ])
+        return _attached (box, arguments, None, True)
+
+    if name == 'rotate_sweep':
+        points = _numpy.asarray (arguments ['shape'], dtype = float)
+        reach = _numpy.abs (points [:, 0]).max ()
+        return _box ([ -reach, -reach, points [:, 1].min () ], [ reach, reach, points [:, 1].max () ])
+
+    if name in [ 'polygon', 'polyhedron' ]:
+        points = _numpy.asarray (arguments ['points'], dtype = float)
+        if not len (points):
+            return None
+        points = _numpy.pad (points, (( 0, 0 ), ( 0, 3 - points.shape [1] )))
+        return _box (points.min (axis = 0), points.max (axis = 0))
+
+    raise ValueError (name)
+
+
+# Operations
+
+
+def _operation (node, arguments, children):
+
+    name = node.name
+
+    if name == 'difference':
+        return children [0] if children else None
+
+    if name == 'intersection':
+        return overlap (children) if children else None
+
+    if name == 'minkowski':
+        if any (child is None for child in children):
+            return merged (children)
+        return _box (sum (child [0] for child in children), sum (child [1] for child in children))
+
+    box = merged (children)
+    if box is None or not _numpy.isfinite (box).all ():
+        return box
+
+    if name == 'linear_extrude':
+        if 'v' in arguments or 'anchor' in arguments:
+            raise ValueError (name)
+        height = float (arguments.get ('height', 100))
+        # The top is scaled about the origin, the sides stay in between.
+        scale = _numpy.broadcast_to (_numpy.asarray (arguments.get ('scale', 1), dtype = float), 2)
+        low = _numpy.minimum (box [0, :2], box [0, :2] * scale)
+        high = _numpy.maximum (box [1, :2], box [1, :2] * scale)
+        if arguments.get ('twist'):
+            reach = _numpy.linalg.norm (_numpy.maximum (-low, high))
+            low, high = ( -reach, -reach ), ( reach, reach )
+        bottom = -height / 2 if arguments.get ('center') else 0
+        return _box ([ low [0], low [1], bottom ], [ high [0], high [1], bottom + height ])
+
+    if name == 'rotate_extrude':
+        reach = _numpy.abs (box [:, 0]).max ()
+        return _box ([ -reach, -reach, box [0, 1] ], [ reach, reach, box [1, 1] ])
+
+    if name == 'offset':
+        grow = max (0, float (_first (arguments, 'r', 'delta', default = 0)))
+        return box + _numpy.array ([ [ -grow, -grow, 0 ], [ grow, grow, 0 ] ])
+
+    if name == 'skew':
+        matrix = _numpy.identity (4)
+        for key, value in arguments.items ():
+            matrix [_SKEWS [key]] = float (value)
+        return transformed (box, matrix)
+
+    if name == 'zrot_copies':
+        if set (arguments) - { 'rots', 'n', 'sa', 'r', 'd', 'subrot' }:
+            raise ValueError (name)
+        shift = _radius (arguments, 'r', 'd', default = 0)
+        reach = _math.hypot (_numpy.abs (box [:, 0] + shift).max (), _numpy.abs (box [:, 1]).max ())
+        return _box ([ -reach, -reach, box [0, 2] ], [ reach, reach, box [1, 2] ])
+
+    if name in _COPIES:
+        if set (arguments) - { 'spacing', 'n', 'sp' }:
+            raise ValueError (name)
+        axis = _COPIES [name]
+        spread = (int (arguments.get ('n', 2)) - 1) * float (arguments.get ('spacing', 1))
+        start = -spread / 2
+        if arguments.get ('sp') is not None:
+            start = arguments ['sp']
+            start = float (start [axis] if _numpy.ndim (start) else start)
+        box = box.copy ()
+        box [:, axis] += ( min (start, start + spread), max (start, start + spread) )
+        return box
+
+    if name == 'projection':
+        box = box.copy ()
+        box [:, 2] = 0
+        return box
+
+    raise ValueError (name)
+
+
+def _instances (node, memo):
+
+    # A loop over placement matrices, as components.instances emits it,
+    # all the corners of all the instances are transformed at once.
+
+    ( variable, placements ), = node.parameters
+    child, = node.children
+    if child.name != 'multmatrix' or [ ( key, str (value) ) for key, value in child.parameters ] != [ ( 'm', variable ) ]:
+        raise ValueError (node.name)
+
+    box = merged ([ node_bounds (grandchild, memo) for grandchild in child.children ])
+    if box is None or not _numpy.isfinite (box).all ():
+        return box
+
+    matrices = _numpy.asarray (placements, dtype = float).reshape (-1, 3, 4)
+    if not len (matrices):
+        return None
+    points = _numpy.einsum ('nij,kj->nki', matrices, _corners (box))
+    return _box (points.min (axis = ( 0, 1 )), points.max (axis = ( 0, 1 )))
+
+
+def node_bounds (node, memo = None):
+
+    memo = {} if memo is None else memo
+    if id (node) in memo:
+        return memo [id (node)]
+
+    # Background and disabled shapes are not part of the result.
+    if node.modifier in [ '%', '*' ]:
+        memo [id (node)] = None
+        return None
+
+    if node.name == 'for':
+        try:
+            result = _instances (node, memo)
+        except (TypeError, ValueError):
+            result = UNBOUNDED
+        memo [id (node)] = result
+        return result
+
+    children = [ node_bounds (child, memo) for child in node.children ]
+
+    try:
+        matrix = _optimize.matrix (node)
+        if matrix is not None:
+            result = transformed (merged (children), matrix)
+        elif node.name in _GROUPS:
+            result = merged (children)
+        elif not node.children:
+            result = _primitive (node, _arguments (node))
+        else:
+            result = _operation (node, _arguments (node), children)
+    except (TypeError, ValueError, KeyError, IndexError, SyntaxError, NameError, ZeroDivisionError):
+        result = UNBOUNDED
+
+    memo [id (node)] = result
+    return result
+
+
+def bounds (object):
+    return node_bounds (_emit.tree (object))
@@ -0,0 +1,389 @@
+import collections as _collections
+import importlib as _importlib
+import math as _math
+import numbers as _numbers
+
+from components import nodes as _nodes
+
+
+# Shared subtrees whose text is shorter than this stay inline,
+# a module call would not save much.
+MODULE_MINIMUM = 80
+
+MODULE_PREFIX = 'shared_'
+
+# Pieces of text emitted together.
+BLOCK_LINES = 4096
+
+# Subtrees with less text than this are emitted as one piece.
+TEXT_MAXIMUM = 4096
+
+# A root with this name stands for its children, each becomes
+# a separate object at the top level of the file.
+TOP_LEVEL = ''
+
+
+# A library independent copy of the tree. Parameters are pairs of name
+# and value, integer names are positional. The values keep their Python
+# form so that passes can reason about them.
+Node = _collections.namedtuple ('Node', [ 'name', 'parameters', 'children', 'modifier' ])
+
+# Everything else that ends up in the file besides the tree.
+Program = _collections.namedtuple ('Program', [ 'header', 'root', 'footer', 'format' ])
+
+
+class Unsupported (Exception):
+    pass
+
+
+# SolidPython 2
+
+
+_SOLID2_MODIFIERS = { 'debug': '#', 'background': '%', 'root': '!', 'disable': '*' }
+
+
+def _solid2_node (object, memo):
+
+    from solid2.core.object_base.object_base_impl import BareOpenSCADObject
+    from solid2.core.utils import unescape_openscad_identifier
+
+    if id (object) in memo:
+        return memo [id (object)]
+
+    modifier = _SOLID2_MODIFIERS.get (type (object).__name__)
+    if modifier:
+        if len (object._children) != 1:
+            raise Unsupported (f'{type (object).__name__} with {len (object._children)} children')
+        child = _library_node (object._children [0], memo)
+        if child.modifier:
+            raise Unsupported ('nested modifiers')
+        memo [id (object)] = child._replace (modifier = modifier)
+        return memo [id (object)]
+
+    if not isinstance (object, BareOpenSCADObject) or type (object)._render is not BareOpenSCADObject._render:
+        raise Unsupported (type (object).__name__)
+
+    parameters = tuple (( unescape_openscad_identifier (key), object._params [key] ) for key in sorted (object._params) if object._params [key] is not None)
+    children = tuple (_library_node (child, memo) for child in object._children)
+
+    memo [id (object)] = Node (unescape_openscad_identifier (object._name), parameters, children, '')
+    return memo [id (object)]
+
+
+def _solid2_program (object, file_header):
+
+    from solid2.config import config
+    from solid2.core.extension_manager import default_extension_manager
+    from solid2.core.scad_render import get_include_string
+    from solid2.core.utils import py2openscad
+
+    if config.use_implicit_builtins:
+        raise Unsupported ('implicit builtins')
+
+    # The same steps the library renderer takes around the tree.
+    header = default_extension_manager.call_pre_render (object)
+    header = header + '\n\n' if header else ''
+    object = default_extension_manager.wrap_root_node (object)
+    footer = default_extension_manager.call_post_render (object)
+    footer = footer + '\n' if footer else ''
+
+    return Program (file_header + get_include_string () + header, _solid2_node (object, {}), footer, py2openscad)
+
+
+# SolidPython
+
+
+def _solid_node (object, memo):
+
+    from solid.solidpython import _unsubbed_keyword, non_rendered_classes
+
+    if id (object) in memo:
+        return memo [id (object)]
+
+    if object.is_hole or object.is_part_root or object.name in non_rendered_classes:
+        raise Unsupported ('holes and parts')
+
+    parameters = { _unsubbed_keyword (key): value for key, value in object.params.items () }
+    if 'segments' in parameters:
+        parameters ['$fn'] = parameters.pop ('segments')
+
+    parameters = tuple (( key, parameters [key] ) for key in sorted (parameters) if parameters [key] is not None)
+    children = tuple (_solid_node (child, memo) for child in object.children)
+
+    memo [id (object)] = Node (_unsubbed_keyword (object.name), parameters, children, object.modifier)
+    return memo [id (object)]
+
+
+def _solid_program (object, file_header):
+
+    from solid.solidpython import _find_include_strings, py2openscad
+
+    if file_header and not file_header.endswith ('\n'):
+        file_header += '\n'
+
+    return Program (file_header + ''.join (_find_include_strings (object)) + '\n', _solid_node (object, {}), '', py2openscad)
+
+
+# Lightweight nodes
+
+
+def _nodes_node (item, memo):
+    if id (item) not in memo:
+        children = tuple (_library_node (child, memo) for child in item.children)
+        memo [id (item)] = Node (item.name, item.parameters, children, item.modifier)
+    return memo [id (item)]
+
+
+def _nodes_program (object, file_header):
+
+    # The library program of a stand in root holding the library objects
+    # found among the nodes, which gives the includes, with the nodes
+    # read directly in place of the stand in.
+
+    facade = _nodes.library (object)
+    if facade is None:
+        return _plain_program (object, file_header)
+
+    cad = _importlib.import_module (facade)
+    stand_in = cad.union () (*_nodes.libraries (object))
+
+    result = _solid2_program (stand_in, file_header) if facade == _nodes.SOLID2 else _solid_program (stand_in, file_header)
+    return result._replace (root = _library_node (object, {}))
+
+
+def _plain_program (object, file_header):
+
+    # Plain OpenSCAD nodes written the way SolidPython writes them,
+    # without importing it.
+
+    if file_header and not file_header.endswith ('\n'):
+        file_header += '\n'
+
+    return Program (file_header + '\n', _library_node (object, {}), '', literal)
+
+
+def literal (value):
+
+    # The values of the nodes in the SolidPython format.
+
+    if type (value) == bool:
+        return str (value).lower ()
+    if type (value) == float:
+        return f'{value:.10f}'
+    if type (value) == str:
+        return f'"{value}"'
+    if hasattr (value, 'tolist'):
+        return literal (value.tolist ())
+    if hasattr (value, '__iter__'):
+        return '[' + ', '.join (literal (item) for item in value) + ']'
+    return str (value)
+
+
+def _library_node (object, memo):
+    if hasattr (object, 'save_as_scad'):
+        return _solid2_node (object, memo)
+    if isinstance (object, _nodes.Node):
+        return _nodes_node (object, memo)
+    return _solid_node (object, memo)
+
+
+def program (object, file_header = '', decimals = None):
+
+    # Numbers are rounded to the given decimals when there are any,
+    # otherwise they are written the way the library writes them.
+
+    if hasattr (object, 'save_as_scad'):
+        result = _solid2_program (object, file_header)
+    elif isinstance (object, _nodes.Node):
+        result = _nodes_program (object, file_header)
+    else:
+        result = _solid_program (object, file_header)
+
+    if decimals is not None:
+        result = result._replace (format = compact (result.format, decimals))
+    return result
+
+
+def tree (object):
+
+    # The bare tree, without what the libraries add around it.
+
+    return _library_node (object, {})
+
+
+# Numbers
+
+
+def number (value, decimals):
+
+    # The shortest text that reads back as the rounded value,
+    # whole numbers without a fraction and no negative zero.
+
+    value = round (float (value), decimals) + 0.0
+    if value.is_integer ():
+        return str (int (value))
+    return repr (value)
+
+
+def compact (format, decimals):
+
+    # Numbers anywhere in the values are rounded, everything else
+    # is left to the library format.
+
+    def write (value):
+        if isinstance (value, _numbers.Real) and not isinstance (value, bool) and _math.isfinite (value):
+            return number (value, decimals)
+        if isinstance (value, ( list, tuple )):
+            return '[' + ', '.join (write (item) for item in value) + ']'
+        if hasattr (value, 'tolist') and not isinstance (value, _numbers.Number):
+            return write (value.tolist ())
+        return format (value)
+
+    return write
+
+
+# Emission
+
+
+def head (node, format):
+    arguments = ', '.join (format (value) if isinstance (key, int) else f'{key} = {format (value)}' for key, value in node.parameters)
+    return f'{node.modifier}{node.name}({arguments})'
+
+
+def _intern (root, format):
+
+    # Hash consing, structurally equal subtrees get the same number.
+    # Nodes are numbered children first, so a parent always comes later.
+
+    numbers = {}
+    heads = []
+    sizes = []
+    children = []
+    known = {}
+
+    def visit (node):
+        number = known.get (id (node))
+        if number is not None:
+            return number
+        numbers_of_children = tuple (visit (child) for child in node.children)
+        text = head (node, format)
+        key = ( text, numbers_of_children )
+        number = numbers.get (key)
+        if number is None:
+            number = len (heads)
+            numbers [key] = number
+            heads.append (text)
+            children.append (numbers_of_children)
+            sizes.append (len (text) + sum (sizes [child] for child in numbers_of_children))
+        known [id (node)] = number
+        return number
+
+    return visit (root), heads, children, sizes
+
+
+def _shared (root, children, sizes):
+
+    # Count how many times each subtree would be emitted. Parents come after
+    # their children, so walking the numbers backwards sees every parent
+    # first. A subtree that becomes a module is emitted only once.
+
+    uses = [ 0 ] * len (children)
+    uses [root] = 1
+    shared = []
+
+    for number in range (len (children) - 1, -1, -1):
+        emitted = uses [number]
+        if number != root and uses [number] > 1 and sizes [number] >= MODULE_MINIMUM:
+            shared.append (number)
+            emitted = 1
+        for child in children [number]:
+            uses [child] += emitted
+
+    return shared
+
+
+def _text (number, depth, heads, children, names, texts):
+
+    # Equal subtrees at equal depth have equal text, it is kept for reuse.
+
+    indent = '\t' * depth
+    if number in names:
+        return f'{indent}{names [number]}();\n'
+
+    key = ( number, depth )
+    text = texts.get (key)
+    if text is None:
+        if not children [number]:
+            text = f'{indent}{heads [number]};\n'
+        else:
+            nested = ''.join ([ _text (child, depth + 1, heads, children, names, texts) for child in children [number] ])
+            text = f'{indent}{heads [number]} {{\n{nested}{indent}}}\n'
+        texts [key] = text
+    return text
+
+
+def _lines (numbers, heads, children, sizes, names, texts, depth):
+
+    # Large subtrees are walked with an explicit stack, so that only the
+    # path to the current node is kept, small ones come from _text. Closing
+    # braces go on the stack as finished text. The lines are handed out in
+    # blocks, a generator step per line would cost more than the writing.
+
+    block = []
+    pending = [ ( number, depth ) for number in reversed (numbers) ]
+
+    while pending:
+        item = pending.pop ()
+        if item.__class__ is str:
+            block.append (item)
+            continue
+
+        number, depth = item
+        nested = children [number]
+
+        if number not in names and nested and sizes [number] > TEXT_MAXIMUM:
+            indent = '\t' * depth
+            block.append (f'{indent}{heads [number]} {{\n')
+            pending.append (f'{indent}}}\n')
+            pending.extend ([ ( child, depth + 1 ) for child in reversed (nested) ])
+        else:
+            block.append (_text (number, depth, heads, children, names, texts))
+
+        if len (block) >= BLOCK_LINES:
+            yield ''.join (block)
+            block = []
+
+    yield ''.join (block)
+
+
+def chunks (program):
+
+    # Every shared subtree is emitted once as a module,
+    # so that OpenSCAD also evaluates it only once.
+
+    root, heads, children, sizes = _intern (program.root, program.format)
+    shared = sorted (_shared (root, children, sizes))
+    names = { number: f'{MODULE_PREFIX}{index}' for index, number in enumerate (shared) }
+    texts = {}
+
+    yield program.header
+    for number in shared:
+        # The body itself is not a call, it never occurs inside itself.
+        body = { key: name for key, name in names.items () if key != number }
+        yield f'module {names [number]} () {{\n'
+        yield from _lines ([ number ], heads, children, sizes, body, texts, 1)
+        yield '}\n\n'
+    yield from _lines (children [root] if program.root.name == TOP_LEVEL else [ root ], heads, children, sizes, names, texts, 0)
+    yield program.footer
+
+
+def emit (program):
+    return ''.join (chunks (program))
+
+
+def write (program, file):
+    file.writelines (chunks (program))
+
+
+def render (object, file_header = ''):
+    return emit (program (object, file_header))
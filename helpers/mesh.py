@@ -0,0 +1,282 @@
+import collections as _collections
+import os as _os
+import pathlib as _pathlib
+import subprocess as _subprocess
+import tempfile as _tempfile
+import zipfile as _zipfile
+
+import numpy as _numpy
+
+from helpers import output as _output
+
+
+OPENSCAD = _os.environ.get ('OPENSCAD', 'openscad')
+
+# Vertices closer than this are the same vertex.
+DECIMALS = 9
+
+# Largest distance of a warped edge from the curve it stands for.
+TOLERANCE = 0.001
+
+# Refinement stops after this many passes even when edges are still too long.
+REFINE_PASSES = 12
+
+
+# Vertices as rows of coordinates, faces as rows of three vertex
+# indices, counterclockwise when seen from outside.
+Mesh = _collections.namedtuple ('Mesh', [ 'vertices', 'faces' ])
+
+
+# Binary STL records, a normal and three corners followed by an attribute.
+STL_RECORD = _numpy.dtype ([ ( 'normal', '<f4', ( 3, ) ), ( 'corners', '<f4', ( 3, 3 ) ), ( 'attribute', '<u2' ) ])
+
+# Bytes before the records of binary STL files, free text and the triangle count.
+STL_HEADER = 84
+
+# Triangles whose records are computed together, which bounds the temporaries.
+STL_CHUNK = 1 << 18
+
+# Vertices or triangles whose text is generated and compressed together.
+THREEMF_CHUNK = 1 << 16
+
+# Fast deflate, the repetitive text compresses well at any level.
+THREEMF_COMPRESSION = 1
+
+# Nine significant digits, better than a micrometre on a metre.
+THREEMF_VERTEX = '<vertex x="%.9g" y="%.9g" z="%.9g"/>\n'
+THREEMF_TRIANGLE = '<triangle v1="%d" v2="%d" v3="%d"/>\n'
+
+# The parts of a 3MF package besides the model.
+THREEMF_CONTENT_TYPES = '''<?xml version="1.0" encoding="UTF-8"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="model" ContentType="application/vnd.ms-package.3dmanufacturing-3dmodel+xml"/>
+</Types>
+'''
+THREEMF_RELATIONSHIPS = '''<?xml version="1.0" encoding="UTF-8"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Target="/3D/3dmodel.model" Id="rel0" Type="http://schemas.microsoft.com/3dmanufacturing/2013/01/3dmodel"/>
+</Relationships>
+'''
+
+
+def welded (corners):
+
+    # Triangles given by their corners become shared vertices,
+    # triangles that collapse to a line or a point are dropped.
+
+    corners = _numpy.asarray (corners, dtype = float).reshape (-1, 3)
+    vertices, faces = _numpy.unique (_numpy.round (corners, DECIMALS) + 0.0, axis = 0, return_inverse = True)
+    faces = faces.reshape (-1, 3)
+    proper = (faces [:, 0] != faces [:, 1]) & (faces [:, 1] != faces [:, 2]) & (faces [:, 2] != faces [:, 0])
+    return Mesh (vertices, faces [proper])
+
+
+def read_stl (path):
+
+    # Binary files have exactly the size their triangle count says,
+    # anything else is read as text.
+
+    data = _pathlib.Path (path).read_bytes ()
+    if len (data) >= STL_HEADER:
+        count = int (_numpy.frombuffer (data, '<u4', 1, STL_HEADER - 4) [0])
+        if len (data) == STL_HEADER + count * STL_RECORD.itemsize:
+            return welded (_numpy.frombuffer (data, STL_RECORD, count, STL_HEADER) ['corners'])
+
+    lines = [ line.split () [1:] for line in data.decode ('ascii', 'replace').splitlines () if line.strip ().startswith ('vertex') ]
+    return welded (_numpy.array (lines, dtype = float))
+
+
+def _normals (corners):
+    normal = _numpy.cross (corners [:, 1] - corners [:, 0], corners [:, 2] - corners [:, 0])
+    length = _numpy.sqrt (_numpy.einsum ('ij,ij->i', normal, normal)) [:, None]
+    return _numpy.divide (normal, length, out = _numpy.zeros_like (normal), where = length > 0)
+
+
+def normals (mesh):
+
+    # Unit normals of the faces, zero for faces without area.
+
+    return _normals (mesh.vertices [mesh.faces])
+
+
+def write_stl (mesh, path):
+
+    # The file is sized up front and mapped, the normals and corners are
+    # computed straight into the records with no copy held in memory.
+
+    count = len (mesh.faces)
+    with open (path, 'wb') as file:
+        file.write (bytes (STL_HEADER - 4))
+        file.write (_numpy.uint32 (count).tobytes ())
+        file.truncate (STL_HEADER + count * STL_RECORD.itemsize)
+    if not count:
+        return
+
+    records = _numpy.memmap (path, STL_RECORD, 'r+', STL_HEADER, ( count, ))
+    for start in range (0, count, STL_CHUNK):
+        corners = mesh.vertices [mesh.faces [start:start + STL_CHUNK]]
+        records ['normal'] [start:start + STL_CHUNK] = _normals (corners)
+        records ['corners'] [start:start + STL_CHUNK] = corners
+    records.flush ()
+    del records
+
+
+def _xml_rows (format, rows):
+
+    # Rows of numbers as text, one format with every row of a chunk
+    # filled in by a single operation.
+
+    for start in range (0, len (rows), THREEMF_CHUNK):
+        chunk = rows [start:start + THREEMF_CHUNK]
+        yield ((format * len (chunk)) % tuple (chunk.ravel ().tolist ())).encode ()
+
+
+def write_3mf (mesh, path):
+
+    # A package with a single object, in millimetres like OpenSCAD writes it.
+    # The model is compressed while its text is generated in chunks.
+
+    with _zipfile.ZipFile (path, 'w', _zipfile.ZIP_DEFLATED, compresslevel = THREEMF_COMPRESSION) as package:
+        package.writestr ('[Content_Types].xml', THREEMF_CONTENT_TYPES)
+        package.writestr ('_rels/.rels', THREEMF_RELATIONSHIPS)
+        with package.open ('3D/3dmodel.model', 'w', force_zip64 = True) as model:
+            model.write (
+                b'<?xml version="1.0" encoding="UTF-8"?>\n'
+                b'<model unit="millimeter" xml:lang="en-US" xmlns="http://schemas.microsoft.com/3dmanufacturing/core/2015/02">\n'
+                b'<resources>\n<object id="1" type="model">\n<mesh>\n<vertices>\n')
+            for text in _xml_rows (THREEMF_VERTEX, _numpy.asarray (mesh.vertices, dtype = float)):
+                model.write (text)
+            model.write (b'</vertices>\n<triangles>\n')
+            for text in _xml_rows (THREEMF_TRIANGLE, _numpy.asarray (mesh.faces, dtype = _numpy.int64)):
+                model.write (text)
+            model.write (b'</triangles>\n</mesh>\n</object>\n</resources>\n<build>\n<item objectid="1"/>\n</build>\n</model>\n')
+
+
+class Unavailable (RuntimeError):
+    pass
+
+
+def evaluate (object, file_header = ''):
+
+    # The triangle mesh OpenSCAD computes for the object. Unavailable is
+    # raised when OpenSCAD cannot be run at all, RuntimeError when it fails.
+
+    with _tempfile.TemporaryDirectory () as directory:
+        source = _pathlib.Path (directory) / 'object.scad'
+        target = source.with_suffix ('.stl')
+        source.write_text (_output.render_scad (object, file_header), encoding = 'utf-8')
+        try:
+            process = _subprocess.run ([ OPENSCAD, '-o', str (target), str (source) ], capture_output = True, text = True)
+        except OSError as error:
+            raise Unavailable (f'OpenSCAD could not be run as {OPENSCAD!r}, set OPENSCAD to its path: {error}') from error
+        if process.returncode != 0 or not target.exists ():
+            raise RuntimeError (f'OpenSCAD failed to evaluate the object:\n{process.stdout}{process.stderr}')
+        return read_stl (target)
+
+
+def edges (faces):
+
+    # The distinct edges as sorted vertex pairs, and the edge of
+    # every face side, side k going from corner k to corner k + 1.
+
+    sides = _numpy.stack ([ faces, _numpy.roll (faces, -1, axis = 1) ], axis = -1).reshape (-1, 2)
+    unique, index = _numpy.unique (_numpy.sort (sides, axis = 1), axis = 0, return_inverse = True)
+    return unique, index.reshape (-1, 3)
+
+
+def closed (mesh):
+
+    # Every edge is used once in each direction, the mesh bounds a solid.
+
+    sides = _numpy.stack ([ mesh.faces, _numpy.roll (mesh.faces, -1, axis = 1) ], axis = -1).reshape (-1, 2)
+    forward, counts = _numpy.unique (sides, axis = 0, return_counts = True)
+    backward = _numpy.unique (sides [:, ::-1], axis = 0)
+    return bool ((counts == 1).all () and _numpy.array_equal (forward, backward))
+
+
+def stl_closed (mesh):
+
+    # Readers find the shared vertices of STL files by their coordinates,
+    # which are single precision, so vertices closer than that merge.
+
+    return closed (welded (mesh.vertices [mesh.faces].astype ('<f4')))
+
+
+def _split (faces, middles):
+
+    # Every face with marked sides is split by a fixed pattern, so that both
+    # faces along a marked edge use its middle vertex and no cracks appear.
+    # Faces are rotated first, so that one marked side comes first, or with
+    # two marked sides, the unmarked one comes last.
+
+    marked = middles >= 0
+    count = marked.sum (axis = 1)
+    first = _numpy.argmax (marked, axis = 1)
+    last = _numpy.argmin (marked, axis = 1)
+    shift = _numpy.where (count == 2, (last + 1) % 3, first)
+    order = (_numpy.arange (3) + shift [:, None]) % 3
+    a, b, c = _numpy.take_along_axis (faces, order, axis = 1).T
+    ab, bc, ca = _numpy.take_along_axis (middles, order, axis = 1).T
+
+    one, two, three = count == 1, count == 2, count == 3
+    pieces = [
+        faces [count == 0],
+        _numpy.stack ([ a, ab, c ], axis = 1) [one],
+        _numpy.stack ([ ab, b, c ], axis = 1) [one],
+        _numpy.stack ([ ab, b, bc ], axis = 1) [two],
+        _numpy.stack ([ a, ab, bc ], axis = 1) [two],
+        _numpy.stack ([ a, bc, c ], axis = 1) [two],
+        _numpy.stack ([ a, ab, ca ], axis = 1) [three],
+        _numpy.stack ([ ab, b, bc ], axis = 1) [three],
+        _numpy.stack ([ ca, bc, c ], axis = 1) [three],
+        _numpy.stack ([ ab, bc, ca ], axis = 1) [three] ]
+    return _numpy.concatenate (pieces)
+
+
+def refine (mesh, too_long, passes = REFINE_PASSES):
+
+    # Edges for which the test says they are too long are halved until none
+    # is. The test gets the start and end points of all edges at once.
+
+    vertices, faces = mesh
+    for _ in range (passes):
+        unique, sides = edges (faces)
+        marked = too_long (vertices [unique [:, 0]], vertices [unique [:, 1]])
+        if not marked.any ():
+            break
+        numbers = _numpy.full (len (unique), -1)
+        numbers [marked] = len (vertices) + _numpy.arange (marked.sum ())
+        vertices = _numpy.concatenate ([ vertices, (vertices [unique [marked, 0]] + vertices [unique [marked, 1]]) / 2 ])
+        faces = _split (faces, numbers [sides])
+    return Mesh (vertices, faces)
+
+
+def warp (mesh, displacement, tolerance = TOLERANCE):
+
+    # The mesh with every vertex moved by the displacement, which takes
+    # arrays of X, Y and Z and returns them moved. Edges whose moved middle
+    # lands further than the tolerance from the middle of the moved ends
+    # would not follow the curve they become, they are split first.
+
+    def moved (points):
+        return _numpy.column_stack (displacement (points [:, 0], points [:, 1], points [:, 2]))
+
+    def too_long (start, end):
+        error = moved ((start + end) / 2) - (moved (start) + moved (end)) / 2
+        return _numpy.linalg.norm (error, axis = 1) > tolerance
+
+    vertices, faces = refine (mesh, too_long)
+    return Mesh (moved (vertices), faces)
+
+
+def polyhedron (mesh, like = None):
+
+    # A polyhedron of the library the other object comes from. OpenSCAD
+    # wants the faces clockwise when seen from outside.
+
+    if like is not None and _output._library (like) == 'solidpython':
+        from components import cad_legacy as cad
+    else:
+        from components import cad
+    return cad.polyhedron (points = mesh.vertices.tolist (), faces = mesh.faces [:, ::-1].tolist ())
@@ -0,0 +1,579 @@
+import math as _math
+import numbers as _numbers
+import re as _re
+
+import numpy as _numpy
+
+from helpers import bounds as _bounds
+from helpers import emit as _emit
+from helpers import mesh as _mesh
+from helpers import optimize as _optimize
+
+
+# Special variables as OpenSCAD starts with them.
+SPECIALS = { '$fn': 0, '$fa': 12, '$fs': 2 }
+
+# Circles smaller than this get three fragments, as in OpenSCAD.
+GRID_FINE = 0.00000095367431640625
+
+# Special variables assigned at the top of the file.
+_ASSIGNMENT = _re.compile (r'^\s*(\$f[nas])\s*=\s*([-+0-9.eE]+)\s*;', _re.M)
+
+# Parameter names in positional order.
+_PARAMETERS = {
+    'cube': [ 'size', 'center' ],
+    'cuboid': [ 'size', 'p1', 'p2' ],
+    'square': [ 'size', 'center' ],
+    'sphere': [ 'r' ],
+    'circle': [ 'r' ],
+    'cylinder': [ 'h', 'r1', 'r2', 'center' ],
+    'cyl': [ 'h', 'r', 'center' ],
+    'polygon': [ 'points', 'paths' ],
+    'polyhedron': [ 'points', 'faces' ],
+    'linear_extrude': [ 'height', 'center', 'convexity', 'twist', 'slices', 'scale' ],
+    'rotate_extrude': [ 'angle' ] }
+
+# Nodes whose shape is the union of their children.
+_GROUPS = [ _emit.TOP_LEVEL, 'union', 'group', 'color', 'render' ]
+
+# Modifiers of shapes that are not part of the result.
+_IGNORED = [ '%', '*' ]
+
+# BOSL2 arguments of primitives that move or change them in ways not covered here.
+_UNCOVERED = [ 'align', 'shift', 'extra', 'extra1', 'extra2', 'texture' ]
+
+# BOSL2 cuboid arguments that change the shape in ways not covered here.
+_FINISHES = [ 'rounding', 'teardrop' ]
+
+
+# Shapes are meshes in 3D and lists of point rings in 2D, None is empty.
+
+
+def _arguments (node):
+    names = _PARAMETERS.get (node.name, [])
+    arguments = {}
+    for key, value in node.parameters:
+        if isinstance (key, int):
+            if key >= len (names):
+                raise _emit.Unsupported (f'{node.name} with {key + 1} positional arguments')
+            key = names [key]
+        arguments [key] = value
+    return arguments
+
+
+def _first (arguments, *names, default = None):
+    for name in names:
+        if arguments.get (name) is not None:
+            return arguments [name]
+    return default
+
+
+def _radius (arguments, radius, diameter, default = None):
+    if arguments.get (radius) is not None:
+        return float (arguments [radius])
+    if arguments.get (diameter) is not None:
+        return float (arguments [diameter]) / 2
+    return default
+
+
+def fragments (radius, specials):
+
+    # The number of sides OpenSCAD gives a circle of the radius.
+
+    if radius < GRID_FINE:
+        return 3
+    if specials ['$fn'] > 0:
+        return max (int (specials ['$fn']), 3)
+    return int (_math.ceil (max (min (360 / specials ['$fa'], radius * 2 * _math.pi / specials ['$fs']), 5)))
+
+
+def _circle (radius, count):
+    angles = _numpy.radians (360 * _numpy.arange (count) / count)
+    return _numpy.column_stack ([ radius * _numpy.cos (angles), radius * _numpy.sin (angles) ])
+
+
+def _fan (ring, reverse = False):
+
+    # A convex ring of vertex numbers as triangles, counterclockwise unless reversed.
+
+    ring = _numpy.asarray (ring)
+    faces = _numpy.column_stack ([ _numpy.full (len (ring) - 2, ring [0]), ring [1:-1], ring [2:] ])
+    return faces [:, ::-1] if reverse else faces
+
+
+def _band (lower, upper):
+
+    # Quads between two rings of vertex numbers, facing outwards
+    # when both rings run counterclockwise seen from above.
+
+    lower, upper = _numpy.asarray (lower), _numpy.asarray (upper)
+    after_lower, after_upper = _numpy.roll (lower, -1), _numpy.roll (upper, -1)
+    return _numpy.concatenate ([
+        _numpy.column_stack ([ lower, after_lower, after_upper ]),
+        _numpy.column_stack ([ lower, after_upper, upper ]) ])
+
+
+def _box (low, high):
+    corners = _numpy.array ([ [ x, y, z ] for z in ( 0, 1 ) for y in ( 0, 1 ) for x in ( 0, 1 ) ], dtype = float)
+    faces = _numpy.array ([
+        [ 0, 2, 3 ], [ 0, 3, 1 ], [ 4, 5, 7 ], [ 4, 7, 6 ],
+        [ 0, 1, 5 ], [ 0, 5, 4 ], [ 2, 6, 7 ], [ 2, 7, 3 ],
+        [ 0, 4, 6 ], [ 0, 6, 2 ], [ 1, 3, 7 ], [ 1, 7, 5 ] ])
+    low, high = _numpy.asarray (low, dtype = float), _numpy.asarray (high, dtype = float)
+    return _mesh.Mesh (low + corners * (high - low), faces)
+
+
+def _lathe (profile, count):
+
+    # A solid of rings about Z, given as pairs of height and radius from the
+    # bottom up. A zero radius at either end closes it in a single point.
+
+    vertices = []
+    rings = []
+    for height, radius in profile:
+        start = sum (len (ring) for ring in vertices)
+        points = _circle (radius, count) if radius > 0 else _numpy.zeros (( 1, 2 ))
+        vertices.append (_numpy.column_stack ([ points, _numpy.full (len (points), height) ]))
+        rings.append (_numpy.arange (start, start + len (points)))
+
+    faces = []
+    for lower, upper in zip (rings, rings [1:]):
+        if len (lower) == 1:
+            faces.append (_numpy.column_stack ([ _numpy.full (count, lower [0]), _numpy.roll (upper, -1), upper ]))
+        elif len (upper) == 1:
+            faces.append (_numpy.column_stack ([ lower, _numpy.roll (lower, -1), _numpy.full (count, upper [0]) ]))
+        else:
+            faces.append (_band (lower, upper))
+    if len (rings [0]) > 1:
+        faces.append (_fan (rings [0], True))
+    if len (rings [-1]) > 1:
+        faces.append (_fan (rings [-1]))
+    return _mesh.Mesh (_numpy.concatenate (vertices), _numpy.concatenate (faces))
+
+
+def _edge_profile (radius, chamfer, rounding, steps):
+
+    # The rings of a BOSL2 cylinder end as pairs of the distance from
+    # the end and the radius. Negative chamfers and roundings flare out.
+
+    if chamfer:
+        return [ ( 0, radius - chamfer ), ( abs (chamfer), radius ) ]
+    if rounding:
+        size = abs (rounding)
+        angles = _numpy.linspace (0, _math.pi / 2, steps + 1)
+        if rounding > 0:
+            return [ ( size * (1 - _math.cos (angle)), radius - size + size * _math.sin (angle) ) for angle in angles ]
+        return [ ( size * (1 - _math.cos (angle)), radius + size - size * _math.sin (angle) ) for angle in angles ]
+    return [ ( 0, radius ) ]
+
+
+def _sphere (radius, count):
+
+    # Rings of latitude between the poles, as OpenSCAD places them.
+
+    rings = (count + 1) // 2
+    vertices = []
+    for index in range (rings):
+        angle = _math.radians (180 * (index + 0.5) / rings)
+        points = _circle (radius * _math.sin (angle), count)
+        vertices.append (_numpy.column_stack ([ points, _numpy.full (count, radius * _math.cos (angle)) ]))
+
+    numbers = _numpy.arange (rings * count).reshape (rings, count)
+    faces = [ _fan (numbers [0]), _fan (numbers [-1], True) ]
+    faces += [ _band (numbers [index + 1], numbers [index]) for index in range (rings - 1) ]
+    return _mesh.Mesh (_numpy.concatenate (vertices), _numpy.concatenate (faces))
+
+
+def _transformed (shape, matrix):
+
+    # Mirrored shapes turn inside out, their faces are reversed.
+
+    if shape is None:
+        return None
+    flip = _numpy.linalg.det (matrix [:3, :3]) < 0
+    if isinstance (shape, _mesh.Mesh):
+        vertices = shape.vertices @ matrix [:3, :3].T + matrix [:3, 3]
+        return _mesh.Mesh (vertices, shape.faces [:, ::-1] if flip else shape.faces)
+    rings = [ ring @ matrix [:2, :2].T + matrix [:2, 3] for ring in shape ]
+    return [ ring [::-1] for ring in rings ] if _numpy.linalg.det (matrix [:2, :2]) < 0 else rings
+
+
+def _translation (offset):
+    matrix = _numpy.identity (4)
+    matrix [:3, 3] = offset
+    return matrix
+
+
+def _round_anchor (anchor, bottom, top, height):
+
+    # Anchors of cylinders lie on the circle of the end they point to.
+
+    side = bottom if anchor [2] < 0 else top if anchor [2] > 0 else (bottom + top) / 2
+    across = anchor [:2] / _numpy.linalg.norm (anchor [:2]) * side if anchor [:2].any () else ( 0, 0 )
+    return _numpy.array ([ *across, anchor [2] * height / 2 ])
+
+
+def _attached (shape, arguments, anchor_point, default):
+
+    # BOSL2 placement, the anchor point moves to the origin, the shape
+    # spins about Z and then turns from pointing up towards orient.
+
+    anchor = _bounds._anchor (arguments.get ('anchor', default))
+    shape = _transformed (shape, _translation (-_numpy.asarray (anchor_point (anchor))))
+
+    spin = _math.radians (float (arguments.get ('spin') or 0))
+    if spin:
+        matrix = _numpy.identity (4)
+        matrix [:2, :2] = [ [ _math.cos (spin), -_math.sin (spin) ], [ _math.sin (spin), _math.cos (spin) ] ]
+        shape = _transformed (shape, matrix)
+
+    orient = _bounds._anchor (arguments.get ('orient', 'UP'))
+    orient = orient / _numpy.linalg.norm (orient)
+    axis = _numpy.cross (( 0, 0, 1 ), orient)
+    if not isinstance (shape, _mesh.Mesh) and not _numpy.allclose (axis, 0):
+        raise _emit.Unsupported ('orient of a flat shape')
+    if _numpy.allclose (axis, 0):
+        if orient [2] < 0:
+            # BOSL2 picks its own axis for turning upside down.
+            raise _emit.Unsupported ('orient')
+        return shape
+
+    # Rodrigues' formula for the turn about the axis.
+    sine, cosine = _numpy.linalg.norm (axis), orient [2]
+    axis = axis / sine
+    cross = _numpy.array ([ [ 0, -axis [2], axis [1] ], [ axis [2], 0, -axis [0] ], [ -axis [1], axis [0], 0 ] ])
+    matrix = _numpy.identity (4)
+    matrix [:3, :3] = _numpy.identity (3) + sine * cross + (1 - cosine) * cross @ cross
+    return _transformed (shape, matrix)
+
+
+def _sized (arguments, dimensions):
+    size = arguments.get ('size', 1)
+    if _numpy.ndim (size):
+        return _numpy.asarray (size, dtype = float) [:dimensions]
+    return _numpy.full (dimensions, float (size))
+
+
+def _edges (value):
+
+    # BOSL2 edge sets as triples of the axis along the edge and the signs
+    # across it. Faces stand for their four edges, corners for the three
+    # meeting there and the zero vector, or ALL, for every edge.
+
+    if value is None:
+        return set ()
+    if isinstance (value, str) and value.strip ('"') == 'ALL':
+        value = ( 0, 0, 0 )
+    if not isinstance (value, ( list, tuple )) or all (isinstance (item, _numbers.Number) for item in value):
+        value = [ value ]
+
+    edges = set ()
+    for item in value:
+        vector = _bounds._anchor (item)
+        corner = _numpy.count_nonzero (vector) == 3
+        for axis in range (3):
+            across = [ other for other in range (3) if other != axis ]
+            for first in ( -1, 1 ):
+                for second in ( -1, 1 ):
+                    edge = _numpy.zeros (3)
+                    edge [across] = first, second
+                    if corner:
+                        found = (edge [across] == vector [across]).all ()
+                    else:
+                        found = ((vector == 0) | (edge == vector)).all ()
+                    if found:
+                        edges.add (( axis, first, second ))
+    return edges
+
+
+def _chamfered (size, arguments):
+
+    # A box with chamfered edges stays convex, each chamfer trims
+    # the box by a plane cutting the given depth off both faces.
+
+    chamfer = float (arguments.get ('chamfer') or 0)
+    box = _box (-size / 2, size / 2)
+    if not chamfer:
+        return box
+    if chamfer < 0:
+        raise _emit.Unsupported ('flared chamfers')
+
+    edges = _edges (arguments.get ('edges', 'ALL')) - _edges (_first (arguments, 'except', '_except', 'except_edges'))
+    if not edges:
+        return box
+
+    solid = _manifold (box)
+    for axis, first, second in sorted (edges):
+        across = [ other for other in range (3) if other != axis ]
+        normal = _numpy.zeros (3)
+        normal [across] = first, second
+        reach = size [across].sum () / 2 - chamfer
+        solid = solid.trim_by_plane (-normal / _math.sqrt (2), -reach / _math.sqrt (2))
+
+    # Corners where three chamfers meet get a triangle of their own.
+    if arguments.get ('trimcorners', True):
+        for signs in _numpy.ndindex (2, 2, 2):
+            normal = _numpy.array (signs) * 2 - 1.0
+            meeting = [ ( axis, *normal [[ other for other in range (3) if other != axis ]].astype (int) ) for axis in range (3) ]
+            if all (edge in edges for edge in meeting):
+                reach = size.sum () / 2 - 2 * chamfer
+                solid = solid.trim_by_plane (-normal / _math.sqrt (3), -reach / _math.sqrt (3))
+    return _from_manifold (solid)
+
+
+def _primitive (node, arguments, specials):
+
+    name = node.name
+
+    if any (arguments.get (key) is not None for key in _UNCOVERED):
+        raise _emit.Unsupported (f'{name} placement')
+
+    if name in [ 'cube', 'square' ]:
+        size = _sized (arguments, 3) if name == 'cube' else _numpy.append (_sized (arguments, 2), 0)
+        default = None if arguments.get ('center') else 'ALLNEG'
+        if name == 'cube':
+            shape = _box (-size / 2, size / 2)
+        else:
+            shape = [ size [:2] * _numpy.array ([ [ -1, -1 ], [ 1, -1 ], [ 1, 1 ], [ -1, 1 ] ]) / 2 ]
+        return _attached (shape, arguments, lambda anchor: anchor * size / 2, default)
+
+    if name == 'sphere':
+        radius = _radius (arguments, 'r', 'd', 1)
+        shape = _sphere (radius, fragments (radius, specials))
+        return _attached (shape, arguments, lambda anchor: anchor / _numpy.linalg.norm (anchor) * radius if anchor.any () else anchor, None)
+
+    if name == 'circle':
+        radius = _radius (arguments, 'r', 'd', 1)
+        shape = [ _circle (radius, fragments (radius, specials)) ]
+        return _attached (shape, arguments, lambda anchor: _round_anchor (anchor, radius, radius, 0), None)
+
+    if name == 'cylinder':
+        height = float (_first (arguments, 'h', default = 1))
+        radius = _radius (arguments, 'r', 'd', 1)
+        radii = _radius (arguments, 'r1', 'd1', radius), _radius (arguments, 'r2', 'd2', radius)
+        shape = _lathe ([ ( -height / 2, radii [0] ), ( height / 2, radii [1] ) ], fragments (max (radii), specials))
+        default = None if arguments.get ('center') else 'BOTTOM'
+        return _attached (shape, arguments, lambda anchor: _round_anchor (anchor, *radii, height), default)
+
+    if name == 'cyl':
+        if any (arguments.get (key) for key in [ 'chamfang', 'chamfang1', 'chamfang2', 'from_end', 'realign', 'texture' ]):
+            raise _emit.Unsupported ('cyl finishes')
+        height = float (_first (arguments, 'h', 'l', 'height', 'length', default = 1))
+        radius = _radius (arguments, 'r', 'd', 1)
+        radii = _radius (arguments, 'r1', 'd1', radius), _radius (arguments, 'r2', 'd2', radius)
+        count = fragments (max (radii), specials)
+        if arguments.get ('circum'):
+            radii = tuple (radius / _math.cos (_math.pi / count) for radius in radii)
+
+        ends = []
+        for index in range (2):
+            chamfer = float (_first (arguments, f'chamfer{index + 1}', 'chamfer', default = 0))
+            rounding = float (_first (arguments, f'rounding{index + 1}', 'rounding', default = 0))
+            if (chamfer or rounding) and radii [0] != radii [1]:
+                raise _emit.Unsupported ('finishes of cones')
+            ends.append (_edge_profile (radii [index], chamfer, rounding, max (1, fragments (abs (rounding), specials) // 4)))
+        profile = [ ( -height / 2 + step, radius ) for step, radius in ends [0] ]
+        profile += [ ( height / 2 - step, radius ) for step, radius in reversed (ends [1]) ]
+        shape = _lathe (profile, count)
+
+        default = 'BOTTOM' if arguments.get ('center') is False else None
+        return _attached (shape, arguments, lambda anchor: _round_anchor (anchor, *radii, height), default)
+
+    if name == 'cuboid':
+        if any (arguments.get (key) for key in _FINISHES):
+            raise _emit.Unsupported ('cuboid finishes')
+        if arguments.get ('p1') is not None:
+            low = _numpy.asarray (arguments ['p1'], dtype = float)
+            high = _numpy.asarray (arguments ['p2'], dtype = float) if arguments.get ('p2') is not None else low + _sized (arguments, 3)
+            size = _numpy.abs (high - low)
+            return _transformed (_chamfered (size, arguments), _translation ((low + high) / 2))
+        size = _sized (arguments, 3)
+        return _attached (_chamfered (size, arguments), arguments, lambda anchor: anchor * size / 2, None)
+
+    if name == 'polygon':
+        points = _numpy.asarray (arguments ['points'], dtype = float) [:, :2]
+        paths = arguments.get ('paths') or [ range (len (points)) ]
+        return [ points [list (path)] for path in paths ]
+
+    if name == 'polyhedron':
+        points = _numpy.asarray (arguments ['points'], dtype = float)
+        faces = arguments.get ('faces', arguments.get ('triangles'))
+        # OpenSCAD faces run clockwise, larger ones are fanned into triangles.
+        triangles = [ _fan (list (face) [::-1]) for face in faces ]
+        return _mesh.Mesh (points, _numpy.concatenate (triangles))
+
+    raise _emit.Unsupported (name)
+
+
+# Operations
+
+
+def _manifold (shape):
+
+    # Meshes and rings as manifold3d objects, which do the booleans.
+
+    try:
+        import manifold3d
+    except ImportError:
+        raise _emit.Unsupported ('booleans and extrusions need manifold3d')
+
+    if isinstance (shape, _mesh.Mesh):
+        mesh = manifold3d.Mesh64 (vert_properties = _numpy.ascontiguousarray (shape.vertices, dtype = _numpy.float64), tri_verts = _numpy.ascontiguousarray (shape.faces, dtype = _numpy.uint64))
+        return manifold3d.Manifold (mesh)
+    return manifold3d.CrossSection ([ _numpy.ascontiguousarray (ring, dtype = _numpy.float64) for ring in shape ], manifold3d.FillRule.EvenOdd)
+
+
+def _from_manifold (solid):
+    if hasattr (solid, 'to_polygons'):
+        rings = [ _numpy.array (ring) for ring in solid.to_polygons () ]
+        return rings or None
+    mesh = solid.to_mesh64 ()
+    if not len (mesh.tri_verts):
+        return None
+    # The arrays manifold3d returns are read only, copies can go back in.
+    return _mesh.Mesh (_numpy.array (mesh.vert_properties [:, :3]), _numpy.array (mesh.tri_verts, dtype = _numpy.int64))
+
+
+def _extent (shape):
+    points = shape.vertices if isinstance (shape, _mesh.Mesh) else _numpy.concatenate (shape)
+    points = _numpy.pad (points, (( 0, 0 ), ( 0, 3 - points.shape [1] )))
+    return _numpy.array ([ points.min (axis = 0), points.max (axis = 0) ])
+
+
+def _joined (shapes):
+
+    # Shapes that do not touch are simply put together,
+    # others need a proper union.
+
+    shapes = [ shape for shape in shapes if shape is not None ]
+    if len (shapes) <= 1:
+        return shapes [0] if shapes else None
+
+    if _bounds.pairwise_disjoint ([ _extent (shape) for shape in shapes ]):
+        if isinstance (shapes [0], _mesh.Mesh):
+            offsets = _numpy.cumsum ([ 0, *[ len (shape.vertices) for shape in shapes [:-1] ] ])
+            return _mesh.Mesh (_numpy.concatenate ([ shape.vertices for shape in shapes ]), _numpy.concatenate ([ shape.faces + offset for shape, offset in zip (shapes, offsets) ]))
+        return [ ring for shape in shapes for ring in shape ]
+
+    solids = [ _manifold (shape) for shape in shapes ]
+    return _from_manifold (type (solids [0]).batch_boolean (solids, _operation_type ('Add')))
+
+
+def _operation_type (name):
+    import manifold3d
+    return getattr (manifold3d.OpType, name)
+
+
+def _operation (node, arguments, children, specials):
+
+    name = node.name
+
+    if name in _GROUPS:
+        return _joined (children)
+
+    if name == 'difference':
+        if not children or children [0] is None:
+            return None
+        body = children [0]
+        tools = [ tool for tool in children [1:] if tool is not None and not _bounds.disjoint (_extent (body), _extent (tool)) ]
+        if not tools:
+            return body
+        solids = [ _manifold (body), *[ _manifold (tool) for tool in tools ] ]
+        return _from_manifold (type (solids [0]).batch_boolean (solids, _operation_type ('Subtract')))
+
+    if name == 'intersection':
+        if not children or any (child is None for child in children):
+            return None
+        solids = [ _manifold (child) for child in children ]
+        return _from_manifold (type (solids [0]).batch_boolean (solids, _operation_type ('Intersect')))
+
+    if name == 'hull':
+        shapes = [ child for child in children if child is not None ]
+        if not shapes:
+            return None
+        solids = [ _manifold (shape) for shape in shapes ]
+        return _from_manifold (type (solids [0]).batch_hull (solids))
+
+    if name == 'linear_extrude':
+        shape = _joined (children)
+        if shape is None:
+            return None
+        import manifold3d
+        height = float (arguments.get ('height', 100))
+        twist = float (arguments.get ('twist') or 0)
+        slices = arguments.get ('slices')
+        if slices is None:
+            slices = max (1, int (fragments (_numpy.abs (_extent (shape)).max (), specials) * abs (twist) / 360)) if twist else 1
+        scale = _numpy.broadcast_to (_numpy.asarray (arguments.get ('scale', 1), dtype = float), 2)
+        # OpenSCAD twists clockwise.
+        solid = manifold3d.Manifold.extrude (_manifold (shape), height, int (slices) - 1, -twist, tuple (scale))
+        result = _from_manifold (solid)
+        return _transformed (result, _translation (( 0, 0, -height / 2 ))) if arguments.get ('center') else result
+
+    if name == 'rotate_extrude':
+        shape = _joined (children)
+        if shape is None:
+            return None
+        import manifold3d
+        angle = float (arguments.get ('angle', 360))
+        count = fragments (_numpy.abs (_extent (shape) [:, 0]).max (), specials)
+        return _from_manifold (manifold3d.Manifold.revolve (_manifold (shape), count, angle))
+
+    raise _emit.Unsupported (name)
+
+
+def _specials (node, specials):
+    changed = { key: float (value) for key, value in node.parameters if key in SPECIALS }
+    return { **specials, **changed } if changed else specials
+
+
+def shape (node, specials = SPECIALS, memo = None):
+
+    # The shape of an emitter tree node, with the special variables in
+    # effect where the node is. Shared subtrees are evaluated once.
+
+    memo = {} if memo is None else memo
+    key = ( id (node), tuple (sorted (specials.items ())) )
+    if key not in memo:
+        memo [key] = _shape (node, specials, memo)
+    return memo [key]
+
+
+def _shape (node, specials, memo):
+
+    if node.modifier in _IGNORED:
+        return None
+    if node.modifier == '!':
+        raise _emit.Unsupported ('root modifier')
+
+    specials = _specials (node, specials)
+    children = [ shape (child, specials, memo) for child in node.children ]
+
+    # Highlighted shapes are part of the result like any other.
+    matrix = _optimize.matrix (node._replace (modifier = ''))
+    if matrix is not None:
+        return _transformed (_joined (children), matrix)
+
+    arguments = _arguments (node)
+    if not node.children and node.name in _PARAMETERS and node.name not in [ 'linear_extrude', 'rotate_extrude' ]:
+        return _primitive (node, arguments, specials)
+    return _operation (node, arguments, children, specials)
+
+
+def mesh (object, file_header = ''):
+
+    # The triangle mesh of a model object without OpenSCAD, empty when the
+    # object has no volume. Special variables set at the top of the file
+    # apply. Unsupported is raised for anything this backend does not cover.
+
+    program = _emit.program (object, file_header)
+    specials = dict (SPECIALS)
+    for name, value in _ASSIGNMENT.findall (program.header):
+        specials [name] = float (value)
+
+    result = shape (program.root, specials)
+    if result is None:
+        return _mesh.Mesh (_numpy.zeros (( 0, 3 )), _numpy.zeros (( 0, 3 ), dtype = int))
+    if not isinstance (result, _mesh.Mesh):
+        raise _emit.Unsupported ('two dimensional result')
+    return result
@@ -0,0 +1,351 @@
+import math as _math
+
+import numpy as _numpy
+
+from helpers import bounds as _bounds
+from helpers import emit as _emit
+
+
+# Matrix entries are rounded so that the sines and cosines
+# of right angles come out as exact zeros and ones.
+DECIMALS = 12
+
+# Unions with more operands than this are split into a balanced tree,
+# OpenSCAD then merges operands of similar size.
+UNION_FANOUT = 8
+
+
+# Transforms
+
+
+# Parameter names in positional order.
+_TRANSFORMS = {
+    'translate': [ 'v' ],
+    'rotate': [ 'a', 'v' ],
+    'scale': [ 'v' ],
+    'mirror': [ 'v' ],
+    'multmatrix': [ 'm' ],
+    # BOSL2 shortcuts.
+    'move': [ 'v' ],
+    'up': [ 'z' ], 'down': [ 'z' ],
+    'left': [ 'x' ], 'right': [ 'x' ],
+    'fwd': [ 'y' ], 'back': [ 'y' ],
+    'xrot': [ 'a' ], 'yrot': [ 'a' ], 'zrot': [ 'a' ] }
+
+_SHIFTS = {
+    'up': ( 2, +1 ), 'down': ( 2, -1 ),
+    'left': ( 0, -1 ), 'right': ( 0, +1 ),
+    'fwd': ( 1, -1 ), 'back': ( 1, +1 ) }
+
+_AXES = { 'xrot': ( 1, 0, 0 ), 'yrot': ( 0, 1, 0 ), 'zrot': ( 0, 0, 1 ) }
+
+
+def _vector (value, size, fill):
+    vector = _numpy.asarray (value, dtype = float).reshape (-1) [:size]
+    return _numpy.concatenate ([ vector, _numpy.full (size - len (vector), fill) ])
+
+
+def _translation (offset):
+    matrix = _numpy.identity (4)
+    matrix [:3, 3] = _vector (offset, 3, 0)
+    return matrix
+
+
+def _linear (block):
+    matrix = _numpy.identity (4)
+    matrix [:3, :3] = block
+    return matrix
+
+
+def _axis_rotation (axis, angle):
+
+    # Rodrigues formula, the axis need not be normalized.
+
+    axis = _vector (axis, 3, 0)
+    length = _numpy.linalg.norm (axis)
+    if length == 0:
+        return None
+    x, y, z = axis / length
+    cosine = _math.cos (_math.radians (angle))
+    sine = _math.sin (_math.radians (angle))
+    cross = _numpy.array ([ [ 0, -z, y ], [ z, 0, -x ], [ -y, x, 0 ] ])
+    return _linear (cosine * _numpy.identity (3) + sine * cross + (1 - cosine) * _numpy.outer (( x, y, z ), ( x, y, z )))
+
+
+def _rotation (angle, axis):
+
+    angles = _numpy.asarray (angle, dtype = float)
+    if angles.ndim == 0:
+        return _axis_rotation (( 0, 0, 1 ) if axis is None else axis, float (angles))
+
+    # Rotation about X first, then Y, then Z.
+    x, y, z = _vector (angles, 3, 0)
+    return _axis_rotation (( 0, 0, 1 ), z) @ _axis_rotation (( 0, 1, 0 ), y) @ _axis_rotation (( 1, 0, 0 ), x)
+
+
+def _mirror (normal):
+    normal = _vector (normal, 3, 0)
+    length = _numpy.linalg.norm (normal)
+    if length == 0:
+        return _numpy.identity (4)
+    normal = normal / length
+    return _linear (_numpy.identity (3) - 2 * _numpy.outer (normal, normal))
+
+
+def _padded (value):
+    rows = _numpy.asarray (value, dtype = float)
+    matrix = _numpy.identity (4)
+    matrix [:rows.shape [0], :rows.shape [1]] = rows
+    return matrix
+
+
+def _arguments (node):
+
+    # Positional and named arguments by name, None when there are unknown ones.
+
+    names = _TRANSFORMS [node.name]
+    arguments = {}
+    for key, value in node.parameters:
+        if isinstance (key, int) and key < len (names):
+            key = names [key]
+        if key not in names:
+            return None
+        arguments [key] = value
+    return arguments
+
+
+def matrix (node):
+
+    # The affine matrix of a transform node, None for anything else
+    # or for parameters that are not plain numbers.
+
+    if node.name not in _TRANSFORMS or node.modifier or not node.children:
+        return None
+
+    arguments = _arguments (node)
+    if arguments is None:
+        return None
+
+    try:
+        if node.name in [ 'translate', 'move' ]:
+            return _translation (arguments.get ('v', 0))
+        if node.name == 'rotate':
+            return _rotation (arguments.get ('a', 0), arguments.get ('v'))
+        if node.name == 'scale':
+            factors = arguments.get ('v', 1)
+            factors = _vector (factors, 3, 1) if _numpy.ndim (factors) else [ float (factors) ] * 3
+            return _linear (_numpy.diag (factors))
+        if node.name == 'mirror':
+            return _mirror (arguments.get ('v', 0))
+        if node.name == 'multmatrix':
+            return _padded (arguments ['m'])
+        if node.name in _SHIFTS:
+            axis, sign = _SHIFTS [node.name]
+            offset = [ 0, 0, 0 ]
+            offset [axis] = sign * float (arguments.get (_TRANSFORMS [node.name] [0], 0))
+            return _translation (offset)
+        if node.name in _AXES:
+            return _axis_rotation (_AXES [node.name], float (arguments.get ('a', 0)))
+    except (TypeError, ValueError, KeyError, IndexError):
+        return None
+
+
+def _number (value):
+    return int (value) if value.is_integer () else value
+
+
+def _multmatrix (matrix, children):
+
+    # The last row is implied, whole numbers are kept short.
+
+    rows = (_numpy.round (matrix [:3], DECIMALS) + 0.0).tolist ()
+    rows = [ [ _number (value) for value in row ] for row in rows ]
+    return _emit.Node ('multmatrix', (( 'm', rows ),), children, '')
+
+
+def fold_transforms (node, memo = None):
+
+    # Consecutive transforms become one multmatrix, identities disappear.
+    # Children are folded first, so a chain collapses from the bottom up.
+
+    memo = {} if memo is None else memo
+    if id (node) in memo:
+        return memo [id (node)]
+
+    children = tuple (fold_transforms (child, memo) for child in node.children)
+    result = node._replace (children = children)
+
+    outer = matrix (result)
+    if outer is not None:
+        combined = outer
+        if len (children) == 1 and matrix (children [0]) is not None:
+            combined = outer @ matrix (children [0])
+            children = children [0].children
+
+        if _numpy.allclose (combined, _numpy.identity (4), rtol = 0, atol = 10 ** - DECIMALS):
+            result = children [0] if len (children) == 1 else _emit.Node ('union', (), children, '')
+        elif combined is not outer:
+            result = _multmatrix (combined, children)
+
+    memo [id (node)] = result
+    return result
+
+
+# Booleans
+
+
+def _plain (node, name):
+    return node.name == name and not node.parameters and not node.modifier
+
+
+def _operands (name, children):
+
+    # Operands of nested booleans of the same kind join the outer one.
+
+    operands = []
+    for child in children:
+        if _plain (child, name):
+            operands.extend (child.children)
+        else:
+            operands.append (child)
+    return operands
+
+
+def _balanced (operands):
+    if len (operands) <= UNION_FANOUT:
+        return tuple (operands)
+    size = _math.ceil (len (operands) / UNION_FANOUT)
+    groups = [ operands [start:start + size] for start in range (0, len (operands), size) ]
+    return tuple (group [0] if len (group) == 1 else _emit.Node ('union', (), _balanced (group), '') for group in groups)
+
+
+def normalize_booleans (node, memo = None):
+
+    # Nested unions and intersections become one node with many operands,
+    # large unions are balanced. A chain of differences subtracts one union
+    # of all the tools, so that the body is only cut once.
+
+    memo = {} if memo is None else memo
+    if id (node) in memo:
+        return memo [id (node)]
+
+    children = tuple (normalize_booleans (child, memo) for child in node.children)
+    result = node._replace (children = children)
+
+    if _plain (result, 'union'):
+        operands = _operands ('union', children)
+        result = operands [0] if len (operands) == 1 else result._replace (children = _balanced (operands))
+
+    elif _plain (result, 'intersection'):
+        result = result._replace (children = tuple (_operands ('intersection', children)))
+
+    elif _plain (result, 'difference') and len (children) > 1:
+        body, tools = children [0], list (children [1:])
+        if _plain (body, 'difference') and len (body.children) > 1:
+            body, tools = body.children [0], [ *body.children [1:], *tools ]
+        tools = _operands ('union', tools)
+        if len (tools) > 1:
+            tools = [ _emit.Node ('union', (), _balanced (tools), '') ]
+        result = result._replace (children = ( body, *tools ))
+
+    memo [id (node)] = result
+    return result
+
+
+# Culling
+
+
+# Parameters of boxes that fill their bounds exactly.
+_BOX_PARAMETERS = {
+    'cube': { 'size', 'center', 'anchor' },
+    'square': { 'size', 'center', 'anchor' },
+    'cuboid': { 'size', 'anchor', 'p1', 'p2' } }
+
+
+def _box_shaped (node):
+
+    # Boxes, also moved, scaled or turned by right angles,
+    # where the bounds are the shape itself.
+
+    if node.modifier:
+        return False
+    if node.name in _BOX_PARAMETERS:
+        return not node.children and { key for key, value in node.parameters } <= _BOX_PARAMETERS [node.name]
+    outer = matrix (node)
+    if outer is None or len (node.children) != 1:
+        return False
+    linear = _numpy.round (outer [:3, :3], DECIMALS)
+    if not ((_numpy.count_nonzero (linear, axis = 0) == 1).all () and (_numpy.count_nonzero (linear, axis = 1) == 1).all ()):
+        return False
+    return _box_shaped (node.children [0])
+
+
+def _terms (node):
+
+    # Operands of a union, through any nesting.
+
+    terms = []
+    pending = [ node ]
+    while pending:
+        node = pending.pop ()
+        if _plain (node, 'union'):
+            pending.extend (reversed (node.children))
+        else:
+            terms.append (node)
+    return terms
+
+
+def cull_booleans (node, memo = None, boxes = None):
+
+    # Bounds tell when a boolean does nothing. A tool that does not reach the
+    # body cuts nothing, and a box around all other operands of an intersection
+    # removes nothing. Tools with modifiers stay, they are meant to be seen.
+
+    memo = {} if memo is None else memo
+    boxes = {} if boxes is None else boxes
+    if id (node) in memo:
+        return memo [id (node)]
+
+    children = tuple (cull_booleans (child, memo, boxes) for child in node.children)
+    result = node._replace (children = children)
+
+    if _plain (result, 'difference') and len (children) > 1:
+        body = _bounds.node_bounds (children [0], boxes)
+        tools = [ tool for child in children [1:] for tool in _terms (child) ]
+        tools = [ tool for tool in tools if tool.modifier or not _bounds.disjoint (body, _bounds.node_bounds (tool, boxes)) ]
+        result = result._replace (children = ( children [0], *tools )) if tools else children [0]
+
+    elif _plain (result, 'intersection') and len (children) > 1:
+        operands = list (children)
+        for operand in children:
+            others = [ other for other in operands if other is not operand ]
+            if others and _box_shaped (operand):
+                if _bounds.contains (_bounds.node_bounds (operand, boxes), _bounds.overlap ([ _bounds.node_bounds (other, boxes) for other in others ])):
+                    operands = others
+        result = operands [0] if len (operands) == 1 else result._replace (children = tuple (operands))
+
+    memo [id (node)] = result
+    return result
+
+
+def split_disjoint (node):
+
+    # A union of disjoint shapes at the top becomes separate top level
+    # objects, which OpenSCAD with lazy union exports without merging.
+
+    if not _plain (node, 'union') or len (node.children) < 2:
+        return node
+    boxes = {}
+    if not _bounds.pairwise_disjoint ([ _bounds.node_bounds (child, boxes) for child in node.children ]):
+        return node
+    return node._replace (name = _emit.TOP_LEVEL)
+
+
+PASSES = [ fold_transforms, cull_booleans, normalize_booleans, split_disjoint ]
+
+
+def optimize (program):
+    root = program.root
+    for apply in PASSES:
+        root = apply (root)
+    return program._replace (root = root)
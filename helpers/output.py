@@ -0,0 +1,338 @@
+import filecmp as _filecmp
+import fnmatch as _fnmatch
+import hashlib as _hashlib
+import importlib.metadata as _metadata
+import json as _json
+import os as _os
+import pathlib as _pathlib
+import shutil as _shutil
+import sys as _sys
+import time as _time
+
+from components import nodes as _nodes
+from helpers import emit as _emit
+from helpers import optimize as _optimize
+from helpers import tree as _tree
+
+
+CACHE_FILE = '.scad-cache.json'
+
+# Comma separated patterns of part names to build, all parts when empty.
+PARTS_VARIABLE = 'SCAD_PARTS'
+
+# Set to 0 to emit the outputs with the library renderers, without optimizations.
+OPTIMIZE_VARIABLE = 'SCAD_OPTIMIZE'
+
+# Decimals of the numbers in optimized outputs, set to full to keep every digit.
+PRECISION_VARIABLE = 'SCAD_PRECISION'
+
+# Nanometres, well below the overlaps and tolerances the models use.
+PRECISION = 6
+
+# Comma separated mesh formats written next to each output without OpenSCAD,
+# stl and 3mf. Outputs the native evaluation does not cover are skipped.
+EXPORT_VARIABLE = 'SCAD_EXPORT'
+
+EXPORT_FORMATS = [ 'stl', '3mf' ]
+
+# Set to build every output even when the cache says it is current.
+FORCE_VARIABLE = 'SCAD_FORCE'
+
+LIBRARIES = [ 'solidpython', 'solidpython2' ]
+
+# Outputs are written in pieces, collected into blocks of this size.
+BUFFER_SIZE = 1 << 20
+
+# Modules whose source determines the output besides the model itself.
+SOURCE_PACKAGES = [ 'components', 'helpers' ]
+
+# Files next to a model that it may read, which determine its outputs too.
+INPUT_SUFFIXES = [ '.svg', '.dxf', '.csv', '.dat', '.png' ]
+
+
+# Digests of the sources, by the file of the model.
+_source_digests = {}
+
+# Every part registered by the model, selected or not.
+parts = {}
+
+# Measurements of every output the model saved, in order.
+report = []
+
+
+def _inputs (main):
+
+    # Data files next to the model, such as the drawings it imports.
+    # Outputs are left out, they must not invalidate themselves.
+
+    if not main:
+        return []
+    return [ str (path) for path in _pathlib.Path (main).parent.iterdir () if path.suffix.lower () in INPUT_SUFFIXES and path.is_file () ]
+
+
+def _sources (main):
+    shared = [ module.__file__ for name, module in list (_sys.modules.items ()) if name.split ('.') [0] in SOURCE_PACKAGES and getattr (module, '__file__', None) ]
+    return sorted ({ *shared, *([ main ] if main else []), *_inputs (main) })
+
+
+def sources_digest (main = None):
+
+    # Computed once per run, the sources do not change while a model executes.
+
+    if main not in _source_digests:
+        digest = _hashlib.sha256 ()
+        for path in _sources (main):
+            digest.update (path.encode ())
+            digest.update (_pathlib.Path (path).read_bytes ())
+        _source_digests [main] = digest.hexdigest ()
+    return _source_digests [main]
+
+
+def _caller_file ():
+
+    # The model that calls part or save_scad, whether it runs as the main
+    # module, through runpy or is imported by another one.
+
+    return _sys._getframe (2).f_globals.get ('__file__')
+
+
+def _library (object):
+    if isinstance (object, _nodes.Node):
+        return 'solidpython2' if _nodes.library (object) == _nodes.SOLID2 else 'solidpython'
+    return 'solidpython2' if hasattr (object, 'save_as_scad') else 'solidpython'
+
+
+def _version (library):
+    try:
+        return _metadata.version (library)
+    except _metadata.PackageNotFoundError:
+        return None
+
+
+def precision ():
+    value = _os.environ.get (PRECISION_VARIABLE, '')
+    if value == 'full':
+        return None
+    return int (value) if value else PRECISION
+
+
+def exports ():
+    formats = [ format.strip ().lower () for format in _os.environ.get (EXPORT_VARIABLE, '').split (',') if format.strip () ]
+    unknown = sorted (set (formats) - set (EXPORT_FORMATS))
+    if unknown:
+        raise ValueError (f'{EXPORT_VARIABLE} has unknown formats {", ".join (unknown)}')
+    return sorted (set (formats))
+
+
+def output_key (path, file_header, parameters, main = None):
+    versions = [ _version (library) for library in LIBRARIES ]
+    # Objects that need evaluation are shaped differently without OpenSCAD.
+    openscad = _shutil.which (_os.environ.get ('OPENSCAD', 'openscad')) is not None
+    options = [ _os.environ.get (OPTIMIZE_VARIABLE), precision (), exports (), openscad ]
+    key = [ sources_digest (main), versions, options, str (path), file_header, parameters ]
+    return _hashlib.sha256 (_json.dumps (key).encode ()).hexdigest ()
+
+
+def _header (object, file_header):
+
+    if _library (object) == 'solidpython2':
+        return file_header
+
+    # The header SolidPython adds by default carries a date stamp,
+    # which would make every output differ from the previous one. Plain
+    # nodes get the same header without importing the library.
+    return f'// Generated by SolidPython {_version ("solidpython") or "<Unknown>"}\n{file_header}'
+
+
+def _render (object, file_header):
+
+    # The pieces of the text together with the tree they are emitted from,
+    # which is None when a library renderer wrote the text. The pieces are
+    # generated while they are written, the text is never complete in memory.
+
+    if _os.environ.get (OPTIMIZE_VARIABLE, '1') != '0':
+        try:
+            program = _optimize.optimize (_emit.program (object, _header (object, file_header), precision ()))
+            return _emit.chunks (program), program.root
+        except _emit.Unsupported:
+            pass
+
+    # The libraries only render their own objects.
+    if isinstance (object, _nodes.Node):
+        object = _nodes.solid (object)
+
+    if _library (object) == 'solidpython2':
+        from solid2.core.scad_render import scad_render
+        return [ scad_render (object, file_header) ], None
+
+    from solid.solidpython import scad_render
+    return [ scad_render (object, _header (object, file_header)) ], None
+
+
+def render_scad (object, file_header = ''):
+    return ''.join (_render (object, file_header) [0])
+
+
+def _write (path, chunks):
+
+    # Written next to the output and compared with it, the output
+    # is only replaced when the content differs.
+
+    partial = path.with_name (f'.{path.name}.partial')
+    try:
+        with open (partial, 'w', encoding = 'utf-8', buffering = BUFFER_SIZE) as file:
+            file.writelines (chunks)
+        if path.exists () and _filecmp.cmp (partial, path, shallow = False):
+            partial.unlink ()
+        else:
+            _os.replace (partial, path)
+    except BaseException:
+        partial.unlink (missing_ok = True)
+        raise
+
+
+def _export (object, path, file_header):
+
+    # The meshes evaluated without OpenSCAD, written like the outputs.
+    # Objects with shapes the evaluation does not cover keep only the source,
+    # the tools render those with OpenSCAD.
+
+    from helpers import mesh as _mesh
+    from helpers import native as _native
+
+    formats = exports ()
+    if not formats:
+        return
+
+    try:
+        mesh, unsupported = _native.mesh (object, _header (object, file_header)), None
+    except _emit.Unsupported as error:
+        mesh, unsupported = None, f'unsupported {error}'
+
+    # Meshes that do not bound a solid, also once the STL precision merges
+    # close vertices, are not written. Those of an earlier revision would
+    # no longer match the source, they are removed.
+    checks = { 'stl': _mesh.stl_closed, '3mf': _mesh.closed }
+    writers = { 'stl': _mesh.write_stl, '3mf': _mesh.write_3mf }
+    for format in formats:
+        target = path.with_suffix (f'.{format}')
+        problem = unsupported or (None if checks [format] (mesh) else 'the mesh is not closed')
+        if problem:
+            target.unlink (missing_ok = True)
+            print (f'{target.name}: not exported, {problem}', file = _sys.stderr)
+            continue
+        partial = target.with_name (f'.{target.name}.partial')
+        try:
+            writers [format] (mesh, partial)
+            _os.replace (partial, target)
+        except BaseException:
+            partial.unlink (missing_ok = True)
+            raise
+
+
+def _load_cache (directory):
+    try:
+        return _json.loads ((directory / CACHE_FILE).read_text ())
+    except (OSError, ValueError):
+        return {}
+
+
+def _store_cache (directory, cache):
+    (directory / CACHE_FILE).write_text (_json.dumps (cache, indent = 4, sort_keys = True))
+
+
+def measurement (path, cached, build_time = None, render_time = None, statistics = None, emitted = None):
+
+    # The node counts of the model tree and of the tree actually emitted
+    # tell how much the optimizations shrank the output.
+
+    counts = statistics.counts if statistics else dict.fromkeys (_tree.CATEGORIES)
+    return {
+        'output': str (path),
+        'cached': cached,
+        'build_time': build_time,
+        'render_time': render_time,
+        'size': path.stat ().st_size,
+        'depth': statistics.depth if statistics else None,
+        **counts,
+        'nodes': sum (statistics.counts.values ()) if statistics else None,
+        'emitted_nodes': sum (emitted.counts.values ()) if emitted else None }
+
+
+def _save (build, path, file_header, parameters, main):
+
+    # Outputs are only written when their content changes, so that
+    # tools watching the modification times are not triggered needlessly.
+    # When none of the inputs changed the output is not even built.
+
+    path = _pathlib.Path (path)
+    directory = path.parent
+    key = output_key (path, file_header, parameters, main)
+    cache = _load_cache (directory)
+
+    if cache.get (path.name) == key and path.exists () and not _os.environ.get (FORCE_VARIABLE):
+        report.append (measurement (path, True))
+        return str (path.resolve ())
+
+    start = _time.perf_counter ()
+    object = build ()
+    built = _time.perf_counter ()
+    chunks, emitted = _render (object, file_header)
+    _write (path, chunks)
+    rendered = _time.perf_counter ()
+    _export (object, path, file_header)
+
+    emitted = _tree.statistics (emitted) if emitted else None
+    report.append (measurement (path, False, built - start, rendered - built, _tree.statistics (object), emitted))
+
+    cache [path.name] = key
+    _store_cache (directory, cache)
+
+    return str (path.resolve ())
+
+
+def save_scad (object, path, file_header = ''):
+    return _save (lambda: object, path, file_header, [], _caller_file ())
+
+
+def _stable (value):
+
+    # The text of a part argument, the same in every run. Functions are
+    # named by their module and qualified name, containers are written
+    # like repr writes them. Anything else whose text holds a memory
+    # address cannot key the cache and is refused.
+
+    if isinstance (value, tuple):
+        items = [ _stable (item) for item in value ]
+        return '(' + ', '.join (items) + (',' if len (items) == 1 else '') + ')'
+    if isinstance (value, list):
+        return '[' + ', '.join (_stable (item) for item in value) + ']'
+    if isinstance (value, dict):
+        return '{' + ', '.join (f'{_stable (key)}: {_stable (item)}' for key, item in value.items ()) + '}'
+    if callable (value) and '<' not in getattr (value, '__qualname__', '<'):
+        return f'{value.__module__}.{value.__qualname__}'
+
+    text = repr (value)
+    if ' at 0x' in text:
+        raise ValueError (f'part argument {text} has no stable text for the cache key, pass a module level function or plain values')
+    return text
+
+
+def part_selected (name):
+    patterns = [ pattern for pattern in _os.environ.get (PARTS_VARIABLE, '').split (',') if pattern ]
+    names = [ name, _pathlib.Path (name).stem ]
+    return not patterns or any (_fnmatch.fnmatch (candidate, pattern) for candidate in names for pattern in patterns)
+
+
+def part (name, builder, *arguments, file_header = '', **keywords):
+
+    # Register a named output and build it unless a selection excludes it.
+    # The builder is only called when the output is actually needed.
+
+    parts [name] = ( builder, arguments, keywords, file_header )
+
+    if not part_selected (name):
+        return None
+
+    parameters = [ builder.__qualname__, _stable (arguments), _stable (sorted (keywords.items ())) ]
+    return _save (lambda: builder (*arguments, **keywords), name, file_header, parameters, _caller_file ())
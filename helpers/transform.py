@@ -1,49 +1,131 @@
 import math as _math
+import sys as _sys
 
-from solid2 import *
-from solid2.extensions.bosl2 import *
+import numpy as _numpy
 
+from components import cad as _cad
+from components import nodes as _nodes
 from components.common import *
 
+from helpers import emit as _emit
+from helpers import mesh as _mesh
+from helpers import native as _native
 
-def bend (object, box, radius, segments):
 
-    segment_step = box [X] / segments
-    segment_size = ( segment_step, box [Y], box [Z] )
+# Warps, functions moving arrays of X, Y and Z.
+
+
+def bent (radius, start = 0, neutral = 0):
+
+    # Wrapped around the Y axis from the start along X, with
+    # the neutral height landing on the radius and keeping its length.
+
+    def displacement (x, y, z):
+        angle = (x - start) / radius
+        distance = z - neutral + radius
+        return distance * _numpy.sin (angle), y, distance * _numpy.cos (angle)
+
+    return displacement
+
+
+def tapered (factor, height):
+
+    # Scaled in X and Y by one at the bottom up to the factor at the height.
+
+    growth = (factor - 1) / height
+
+    def displacement (x, y, z):
+        scale = 1 + growth * _numpy.clip (z, 0, height)
+        return x * scale, y * scale, z
+
+    return displacement
+
+
+def twisted (angle, height):
+
+    # Turned counterclockwise about the Z axis, from nothing
+    # at the bottom up to the angle in degrees at the height.
+
+    def displacement (x, y, z):
+        turn = _numpy.radians (angle) * _numpy.clip (z, 0, height) / height
+        cosine, sine = _numpy.cos (turn), _numpy.sin (turn)
+        return x * cosine - y * sine, x * sine + y * cosine, z
 
-    rotation_circumference = 2 * _math.pi * radius
-    rotation_step = 360 * segment_step / rotation_circumference
+    return displacement
 
-    puzzle = []
 
-    for segment_index in range (segments):
+def sheared (sxy = 0, sxz = 0, syx = 0, syz = 0, szx = 0, szy = 0):
 
-        segment_rotation = segment_index * rotation_step
-        segment_position = segment_index * segment_step
-        segment_boundary = translate (( segment_position, 0, 0 )) (cube (segment_size))
-        segment_content = intersection () (object, segment_boundary)
+    # Skewed like BOSL2 skew does it, sxy moves X in proportion to Y.
 
-        # Move above origin for rotation.
-        segment_content = translate (( - segment_position - segment_size [X] / 2, 0, radius - segment_size [Z] / 2)) (segment_content)
+    def displacement (x, y, z):
+        return x + sxy * y + sxz * z, y + syx * x + syz * z, z + szx * x + szy * y
 
-        # Rotate as intended.
-        segment_content = rotate (( 0, segment_rotation, 0 )) (segment_content)
+    return displacement
 
-        # Aggregate.
-        puzzle.append (segment_content)
 
-    # Unionize :-)
-    return union () (*puzzle)
+def evaluated (object):
+
+    # The mesh of the object, computed natively when the backend covers
+    # the object and by OpenSCAD otherwise.
+
+    try:
+        return _native.mesh (object)
+    except _emit.Unsupported:
+        return _mesh.evaluate (object)
+
+
+def warp (object, *displacements, tolerance = _mesh.TOLERANCE):
+
+    # The object evaluated once and its vertices moved by the displacements
+    # in turn, as a polyhedron. Edges are split wherever the moved surface
+    # would otherwise stray further than the tolerance from its true shape.
+
+    def displacement (x, y, z):
+        for apply in displacements:
+            x, y, z = apply (x, y, z)
+        return x, y, z
+
+    return _mesh.polyhedron (_mesh.warp (evaluated (object), displacement, tolerance), object)
+
+
+def bend (object, box, radius, segments):
+
+    # The part of the object inside the box, which starts at the origin,
+    # is wrapped around the Y axis, its bottom at the radius less half the
+    # box height. The middle of the first of the segments stays upright,
+    # the rest turns by the arc it covers. The arcs are as smooth as the
+    # segments would make them.
+
+    segment_step = box [X] / segments
+    tolerance = radius * (1 - _numpy.cos (segment_step / radius / 2))
+
+    clipped = _nodes.intersection () (object, _nodes.cube (box))
+    return warp (clipped, bent (radius, segment_step / 2, box [Z] / 2), tolerance = tolerance)
 
 
 def scale_along_z (object, slice, height, factor):
 
+    # The object is scaled in X and Y by a factor that grows linearly from
+    # one at the bottom to the given factor at the height, continuously by
+    # a warp of the evaluated object that keeps what lies below and above.
+    # The slice is only used when neither the native backend nor OpenSCAD
+    # can evaluate the object, it is then cut into slices of that size up
+    # to the height, each scaled by the factor at its bottom, as plain CSG.
+
+    try:
+        return warp (object, tapered (factor, height))
+    except _mesh.Unavailable as error:
+        if slice is None:
+            raise
+        print (f'scale_along_z: {error}, tapering in slices of {slice [Z]}', file = _sys.stderr)
+
     steps = _math.ceil (height / slice [Z])
     tweak = (factor - 1) / steps
 
-    slice_base = cuboid (slice, anchor = BOTTOM)
+    slice_base = _nodes.cuboid (slice, anchor = _cad.BOTTOM)
     slice_list = [ slice_base.up (slice [Z] * step) for step in range (steps) ]
-    object_list = [ object * slice for slice in slice_list ]
+    object_list = [ _nodes.intersection () (object, slice) for slice in slice_list ]
     scaled_list = [ object.scale ([ 1 + tweak * step, 1 + tweak * step, 1 ]) for step, object in enumerate (object_list) ]
 
-    return union () (*scaled_list)
+    return _nodes.union () (*scaled_list)
@@ -0,0 +1,43 @@
+import collections as _collections
+
+
+# Node types reported separately, leaves count as primitives and the rest as other.
+BOOLEANS = [ 'union', 'difference', 'intersection', 'hull' ]
+CATEGORIES = [ *BOOLEANS, 'primitive', 'other' ]
+
+
+Statistics = _collections.namedtuple ('Statistics', [ 'counts', 'depth' ])
+
+
+def node_name (node):
+    # SolidPython 2 keeps the fields private, modifiers have no name at all.
+    return getattr (node, '_name', getattr (node, 'name', None))
+
+
+def node_children (node):
+    return getattr (node, '_children', getattr (node, 'children', []))
+
+
+def category (node):
+    name = node_name (node)
+    if name in BOOLEANS:
+        return name
+    return 'other' if node_children (node) else 'primitive'
+
+
+def statistics (root):
+
+    # Shared subtrees count as many times as they are emitted.
+    # Iterative, generated trees can be deeper than the recursion limit.
+
+    counts = dict.fromkeys (CATEGORIES, 0)
+    depth = 0
+    pending = [ ( root, 1 ) ]
+
+    while pending:
+        node, level = pending.pop ()
+        counts [category (node)] += 1
+        depth = max (depth, level)
+        pending.extend (( child, level + 1 ) for child in node_children (node))
+
+    return Statistics (counts, depth)
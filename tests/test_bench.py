@@ -0,0 +1,9 @@
+from tools import bench as _bench
+from tools import render as _render
+
+
+def test_missing_openscad (tmp_path, monkeypatch):
+    monkeypatch.setattr (_render, 'OPENSCAD', '/nonexistent/openscad')
+    source = tmp_path / 'part.scad'
+    source.write_text ('cube (1);\n')
+    assert _bench._openscad_time (source) is None
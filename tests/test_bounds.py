@@ -0,0 +1,44 @@
+import math as _math
+
+import numpy as _numpy
+
+from components import cad
+from helpers import bounds as _bounds
+
+
+def test_circumscribed_cylinder ():
+
+    # The corners of the hexagon reach beyond the radius.
+
+    box = _bounds.bounds (cad.cyl (r = 10, h = 2, circum = True, _fn = 6))
+    assert box [1, 0] >= 10 / _math.cos (_math.pi / 6) - _bounds.EPSILON
+    assert box [0, 0] <= -10 / _math.cos (_math.pi / 6) + _bounds.EPSILON
+
+
+def test_circumscribed_without_sides ():
+    box = _bounds.bounds (cad.cyl (r = 10, h = 2, circum = True))
+    assert box [1, 0] >= 20 - _bounds.EPSILON
+
+
+def test_sphere_diagonal_anchor ():
+
+    # The anchor is on the sphere, the shape moves by the radius along the diagonal.
+
+    radius = 10
+    box = _bounds.bounds (cad.sphere (r = radius, anchor = cad.TOP + cad.RIGHT))
+    shift = radius / _math.sqrt (2)
+    exact = _numpy.array ([ [ -radius - shift, -radius, -radius - shift ], [ radius - shift, radius, radius - shift ] ])
+    assert _bounds.contains (box, exact)
+
+
+def test_sphere_corner_anchor ():
+    radius = 10
+    box = _bounds.bounds (cad.sphere (r = radius, anchor = cad.TOP + cad.RIGHT + cad.BACK))
+    shift = radius / _math.sqrt (3)
+    exact = _numpy.array ([ [ -radius - shift ] * 3, [ radius - shift ] * 3 ])
+    assert _bounds.contains (box, exact)
+
+
+def test_unmodelled_arguments_are_unbounded ():
+    box = _bounds.bounds (cad.cyl (r = 1, h = 2, extra = 5))
+    assert not _numpy.isfinite (box).all ()
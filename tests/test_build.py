@@ -0,0 +1,79 @@
+import concurrent.futures as _futures
+import os as _os
+import pathlib as _pathlib
+import subprocess as _subprocess
+import sys as _sys
+
+from tools import build as _build
+from tools import model as _model
+
+
+# Uses SolidPython 2 without BOSL2.
+SOLID2_MODEL = _model.THINGS_PATH / 'kitchen' / 'tassimo-ivar-holder'
+
+
+def _outputs (directory):
+    return { path.name: path.read_text () for path in sorted (_pathlib.Path (directory).glob ('*.scad')) }
+
+
+def test_pool_matches_standalone (tmp_path, monkeypatch):
+
+    # Preloaded libraries must not leak into the outputs of the models.
+
+    monkeypatch.setenv ('SCAD_FORCE', '1')
+    pooled, standalone = tmp_path / 'pooled', tmp_path / 'standalone'
+    pooled.mkdir ()
+    standalone.mkdir ()
+
+    with _futures.ProcessPoolExecutor (max_workers = 1, mp_context = _build.process_context (), max_tasks_per_child = 1) as pool:
+        assert pool.submit (_model.run, SOLID2_MODEL, pooled).result ().success
+
+    script = f'from tools import model; assert model.run ({str (SOLID2_MODEL)!r}, {str (standalone)!r}).success'
+    _subprocess.run ([ _sys.executable, '-c', script ], cwd = _model.ROOT_PATH, check = True)
+
+    assert _outputs (pooled)
+    assert _outputs (pooled) == _outputs (standalone)
+    assert not any ('BOSL2' in text for text in _outputs (pooled).values ())
+
+
+def test_format_without_nodes ():
+    outputs = [ { 'nodes': 0, 'emitted_nodes': 0 } ]
+    text = _model.format_result (_model.Result ('empty', True, 0.5, '', outputs))
+    assert text.split () == [ 'ok', '0.50', 's', 'empty' ]
+
+
+INCLUDES_MODEL = '''
+from components import cad
+from helpers.output import part
+
+cad.require ('gears')
+
+def gear ():
+    return cad.spur_gear (circ_pitch = 5, teeth = 10, thickness = 2)
+
+def plate ():
+    return cad.cube (4)
+
+part ('gear.scad', gear)
+part ('plate.scad', plate)
+'''
+
+
+def test_part_alone_has_the_model_includes (tmp_path, monkeypatch):
+
+    # The includes of an output must not depend on the parts built before it.
+
+    monkeypatch.setenv ('SCAD_FORCE', '1')
+    model = tmp_path / _model.MAIN_FILE
+    model.write_text (INCLUDES_MODEL)
+    environment = { 'PYTHONPATH': str (_model.ROOT_PATH) }
+
+    _subprocess.run ([ _sys.executable, str (model) ], cwd = tmp_path, env = { **_os.environ, **environment }, check = True)
+    together = (tmp_path / 'plate.scad').read_text ()
+
+    environment ['SCAD_PARTS'] = 'plate'
+    _subprocess.run ([ _sys.executable, str (model) ], cwd = tmp_path, env = { **_os.environ, **environment }, check = True)
+    alone = (tmp_path / 'plate.scad').read_text ()
+
+    assert 'gears.scad' in alone
+    assert alone == together
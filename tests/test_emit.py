@@ -0,0 +1,105 @@
+import math as _math
+import re as _re
+
+from components import cad
+from components import cad_legacy
+from helpers import emit as _emit
+
+
+CALL = _re.compile (r'^(\t*)(shared_\d+)\(\);$', _re.MULTILINE)
+MODULE = _re.compile (r'^module (shared_\d+) \(\) \{\n(.*?)^\}\n\n', _re.MULTILINE | _re.DOTALL)
+
+
+def _node (name, *children, **parameters):
+    return _emit.Node (name, tuple (sorted (parameters.items ())), tuple (children), '')
+
+
+def _program (root):
+    return _emit.Program ('', root, '', _emit.literal)
+
+
+def _inlined (text):
+
+    # Every module call replaced by the module body at the depth of the call.
+
+    bodies = { name: body for name, body in MODULE.findall (text) }
+    text = MODULE.sub ('', text)
+
+    def body (match):
+        lines = bodies [match.group (2)].rstrip ('\n').split ('\n')
+        return '\n'.join (match.group (1) + line [1:] for line in lines)
+
+    while CALL.search (text):
+        text = CALL.sub (body, text)
+    return text
+
+
+def _big (seed):
+    points = [ [ seed + index, index * 2, index * 3 ] for index in range (12) ]
+    return _node ('polyhedron', points = points, faces = [ [ 0, 1, 2 ] ])
+
+
+def test_modules_match_inline_text (monkeypatch):
+    part = _node ('difference', _big (1), _node ('cube', size = 1))
+    root = _node ('union', *[ _node ('translate', part, v = [ index, 0, 0 ]) for index in range (3) ])
+
+    shared = _emit.emit (_program (root))
+    assert shared.count ('module shared_') == 1
+
+    monkeypatch.setattr (_emit, 'MODULE_MINIMUM', _math.inf)
+    inline = _emit.emit (_program (root))
+    assert 'module' not in inline
+    assert _inlined (shared) == inline
+
+
+def test_nested_shares_are_emitted_once (monkeypatch):
+
+    # The inner subtree is shared inside the outer one and on its own.
+
+    inner = _big (5)
+    outer = _node ('union', inner, _node ('sphere', r = 2))
+    root = _node ('union',
+        _node ('translate', outer, v = [ 1, 0, 0 ]),
+        _node ('translate', outer, v = [ 2, 0, 0 ]),
+        _node ('translate', inner, v = [ 3, 0, 0 ]))
+
+    text = _emit.emit (_program (root))
+    head = _emit.head (inner, _emit.literal)
+    assert text.count (head) == 1
+    assert text.count ('module shared_') == 2
+    assert text.count ('sphere(') == 1
+
+    monkeypatch.setattr (_emit, 'MODULE_MINIMUM', _math.inf)
+    assert _inlined (text) == _emit.emit (_program (root))
+
+
+def test_small_shares_stay_inline ():
+    small = _node ('cube', size = [ 1, 2, 3 ])
+    assert len (_emit.head (small, _emit.literal)) < _emit.MODULE_MINIMUM
+    root = _node ('union', small, _node ('translate', small, v = [ 5, 0, 0 ]))
+
+    text = _emit.emit (_program (root))
+    assert 'module' not in text
+    assert text.count ('cube(size = [1, 2, 3]);') == 2
+
+
+def test_solid2_matches_library ():
+    from solid2.core.scad_render import scad_render
+
+    part = cad.translate ([ 1, 2.5, 3 ]) (cad.cube (2) - cad.sphere (r = 1.25, _fn = 12))
+    object = part + cad.rotate (a = 30, v = [ 0, 0, 1 ]) (cad.cylinder (r = 1, h = 3, center = True))
+    assert _emit.render (object, '$fn = 8;') == scad_render (object, '$fn = 8;')
+
+
+def test_solid_matches_library ():
+
+    # SolidPython puts an empty line before the tree and none after it,
+    # the emitted text differs from it only in these.
+
+    from solid.solidpython import scad_render
+
+    part = cad_legacy.translate ([ 1, 2.5, 3 ]) (cad_legacy.cube (2) - cad_legacy.sphere (r = 1.25, segments = 12))
+    object = part + cad_legacy.rotate (a = 30, v = [ 0, 0, 1 ]) (cad_legacy.cylinder (r = 1, h = 3, center = True))
+    emitted = _emit.render (object, '$fn = 8;')
+    library = scad_render (object, '$fn = 8;')
+    assert [ line for line in emitted.split ('\n') if line ] == [ line for line in library.split ('\n') if line ]
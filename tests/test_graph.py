@@ -0,0 +1,24 @@
+from tools import graph as _graph
+from tools import model as _model
+
+
+def test_broken_file_keeps_its_imports (tmp_path):
+
+    # A half finished edit must not lose the edges or stop the watcher.
+
+    path = tmp_path / _model.MAIN_FILE
+    path.write_text ('from helpers import output\n')
+    known = _graph.imports (path)
+    assert known == { _model.ROOT_PATH / 'helpers' / 'output.py' }
+
+    path.write_text ('from helpers import (\n')
+    assert _graph.imports (path) == known
+
+    path.unlink ()
+    assert _graph.imports (path) == known
+
+
+def test_broken_model_is_its_own_dependent (tmp_path):
+    path = tmp_path / _model.MAIN_FILE
+    path.write_text ('def broken (:\n')
+    assert _graph.dependents ([ tmp_path ], [ path ]) == [ tmp_path ]
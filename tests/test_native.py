@@ -0,0 +1,31 @@
+import numpy as _numpy
+
+from components import cad
+from helpers import mesh as _mesh
+from helpers import native as _native
+
+
+def _extent (object):
+    mesh = _native.mesh (object)
+    return _numpy.array ([ mesh.vertices.min (axis = 0), mesh.vertices.max (axis = 0) ])
+
+
+def test_cube_anchor ():
+    assert _numpy.allclose (_extent (cad.cube ([ 1, 2, 3 ], anchor = cad.TOP)), [ [ -0.5, -1, -3 ], [ 0.5, 1, 0 ] ])
+
+
+def test_cylinder_orient ():
+    assert _numpy.allclose (_extent (cad.cylinder (r = 1, h = 4, orient = cad.RIGHT, _fn = 4)), [ [ 0, -1, -1 ], [ 4, 1, 1 ] ])
+
+
+def test_sphere_anchor ():
+
+    # The anchor lies on the sphere, the center moves along the diagonal.
+
+    extent = _extent (cad.sphere (r = 10, anchor = cad.TOP + cad.RIGHT, _fn = 64))
+    assert _numpy.allclose ((extent [0] + extent [1]) / 2, [ -10 / _numpy.sqrt (2), 0, -10 / _numpy.sqrt (2) ], atol = 0.1)
+
+
+def test_primitives_are_closed ():
+    for object in [ cad.cube (1), cad.sphere (1, _fn = 12), cad.cylinder (r1 = 1, r2 = 0, h = 1), cad.cyl (r = 1, h = 2, rounding = 0.3) ]:
+        assert _mesh.closed (_native.mesh (object))
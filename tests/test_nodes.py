@@ -0,0 +1,36 @@
+import subprocess as _subprocess
+import sys as _sys
+
+from components import nodes
+from helpers import output as _output
+from tools import model as _model
+
+
+PLAIN_RENDER = '''
+import sys
+from components import nodes
+from helpers import output
+tree = nodes.cube (size = 2) - nodes.translate ([ 1, 0, 0 ]) (nodes.sphere (r = 1))
+text = output.render_scad (tree, '$fn = 8;')
+print (text.splitlines () [1], sorted (name for name in sys.modules if name.split ('.') [0] in ( 'solid', 'solid2' )))
+'''
+
+
+def test_plain_nodes_need_no_library ():
+
+    # Only the header says SolidPython, the library itself stays out.
+
+    result = _subprocess.run ([ _sys.executable, '-c', PLAIN_RENDER ], cwd = _model.ROOT_PATH, capture_output = True, text = True, check = True)
+    assert result.stdout.split () == [ '$fn', '=', '8;', '[]' ]
+
+
+def test_library_of_nodes ():
+    assert nodes.library (nodes.cube (size = 2) + nodes.cylinder (r = 1, h = 2)) is None
+    assert nodes.library (nodes.cuboid (2)) == nodes.SOLID2
+    assert nodes.library (nodes.union () (nodes.cube (size = 2, anchor = [ 0, 0, 1 ]))) == nodes.SOLID2
+
+
+def test_plain_header ():
+    text = _output.render_scad (nodes.cube (size = 2), '$fn = 8;')
+    assert text.startswith ('// Generated by SolidPython ')
+    assert 'include' not in text
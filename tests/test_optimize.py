@@ -0,0 +1,126 @@
+import numpy as _numpy
+
+from components import cad
+from helpers import emit as _emit
+from helpers import optimize as _optimize
+
+
+def test_circumscribed_corner_keeps_tool ():
+
+    # The tool only reaches the corners of the hexagon, which lie outside
+    # the radius. Culling it would leave the corner uncut.
+
+    body = cad.cyl (r = 10, h = 2, circum = True, _fn = 6)
+    tool = cad.translate ([ 10.5, -0.5, -2 ]) (cad.cube ([ 2, 1, 4 ]))
+    culled = _optimize.cull_booleans (_emit.tree (body - tool))
+    assert culled.name == 'difference'
+    assert len (culled.children) == 2
+
+
+def test_distant_tool_is_culled ():
+    body = cad.cyl (r = 10, h = 2, circum = True, _fn = 6)
+    tool = cad.translate ([ 20, -0.5, -2 ]) (cad.cube ([ 2, 1, 4 ]))
+    culled = _optimize.cull_booleans (_emit.tree (body - tool))
+    assert culled.name == 'cyl'
+
+
+def _node (name, *children, modifier = '', **parameters):
+    return _emit.Node (name, tuple (sorted (parameters.items ())), tuple (children), modifier)
+
+
+CUBE = _node ('cube', size = [ 1, 2, 3 ])
+
+
+# Transforms
+
+
+def test_chain_folds_into_composed_matrix ():
+    scale = _node ('scale', CUBE, v = [ 2, 1, 1 ])
+    rotate = _node ('rotate', scale, a = [ 0, 0, 90 ])
+    translate = _node ('translate', rotate, v = [ 1, 2, 3 ])
+
+    folded = _optimize.fold_transforms (translate)
+    assert folded.name == 'multmatrix'
+    assert folded.children == ( CUBE, )
+
+    composed = _optimize.matrix (translate) @ _optimize.matrix (rotate) @ _optimize.matrix (scale)
+    assert _numpy.allclose (_optimize.matrix (folded), composed)
+    assert _numpy.allclose (composed @ [ 1, 0, 0, 1 ], [ 1, 4, 3, 1 ])
+
+
+def test_identities_disappear ():
+    assert _optimize.fold_transforms (_node ('translate', CUBE, v = [ 0, 0, 0 ])) == CUBE
+    assert _optimize.fold_transforms (_node ('rotate', _node ('rotate', CUBE, a = 90), a = -90)) == CUBE
+
+    sphere = _node ('sphere', r = 1)
+    folded = _optimize.fold_transforms (_node ('scale', CUBE, sphere, v = 1))
+    assert folded == _node ('union', CUBE, sphere)
+
+
+def test_modifiers_and_other_nodes_stay ():
+
+    # Only plain affine transforms take part, whatever they hold is kept.
+
+    marked = _node ('translate', CUBE, v = [ 0, 1, 0 ], modifier = '#')
+    outer = _node ('translate', marked, v = [ 1, 0, 0 ])
+    assert _optimize.fold_transforms (outer) == outer
+
+    extruded = _node ('linear_extrude', _node ('square', size = 1), height = 2)
+    outer = _node ('translate', extruded, v = [ 1, 0, 0 ])
+    assert _optimize.fold_transforms (outer) == outer
+
+    named = _node ('translate', CUBE, v = 'offset')
+    assert _optimize.fold_transforms (_node ('rotate', named, a = 90)) == _node ('rotate', named, a = 90)
+
+
+# Booleans
+
+
+def _leaves (node, name):
+    if node.name != name:
+        return [ node ]
+    return [ leaf for child in node.children for leaf in _leaves (child, name) ]
+
+
+def _cubes (count):
+    return [ _node ('cube', size = index + 1) for index in range (count) ]
+
+
+def test_nested_unions_and_intersections_flatten ():
+    a, b, c, d = _cubes (4)
+
+    union = _optimize.normalize_booleans (_node ('union', _node ('union', a, b), _node ('union', c), d))
+    assert union == _node ('union', a, b, c, d)
+
+    intersection = _optimize.normalize_booleans (_node ('intersection', _node ('intersection', a, b), c))
+    assert intersection == _node ('intersection', a, b, c)
+
+    # A union with a modifier is kept apart, it may be meant for preview.
+    marked = _node ('union', a, b, modifier = '#')
+    assert _optimize.normalize_booleans (_node ('union', marked, c)) == _node ('union', marked, c)
+
+
+def test_difference_cuts_once ():
+    body, first, second, third, fourth = _cubes (5)
+
+    chain = _node ('difference', _node ('difference', body, first), second, _node ('union', third, fourth))
+    assert _optimize.normalize_booleans (chain) == _node ('difference', body, _node ('union', first, second, third, fourth))
+
+    single = _node ('difference', body, first)
+    assert _optimize.normalize_booleans (single) == single
+
+
+def test_large_unions_are_balanced ():
+    cubes = _cubes (_optimize.UNION_FANOUT ** 2 + 3)
+    balanced = _optimize.normalize_booleans (_node ('union', *cubes))
+
+    assert _leaves (balanced, 'union') == cubes
+    pending = [ balanced ]
+    while pending:
+        node = pending.pop ()
+        if node.name == 'union':
+            assert len (node.children) <= _optimize.UNION_FANOUT
+            pending.extend (node.children)
+
+    small = _node ('union', *cubes [:_optimize.UNION_FANOUT])
+    assert _optimize.normalize_booleans (small) == small
@@ -0,0 +1,61 @@
+import subprocess as _subprocess
+import sys as _sys
+
+import pytest
+
+from helpers import output as _output
+from tools import model as _model
+
+
+MODEL = '''
+from components import nodes
+from helpers.output import part, report
+part ('box.scad', nodes.cube, size = 1)
+print (report [-1] ['cached'])
+'''
+
+# Runs the model through runpy from a script on standard input.
+RUNNER = '''
+import runpy, sys
+sys.path.insert (0, {root!r})
+runpy.run_path ({model!r})
+'''
+
+
+def _run (model):
+    script = RUNNER.format (root = str (_model.ROOT_PATH), model = str (model))
+    result = _subprocess.run ([ _sys.executable, '-' ], input = script, cwd = model.parent, capture_output = True, text = True, check = True)
+    return result.stdout.strip ()
+
+
+def test_cache_follows_the_model_file (tmp_path):
+
+    # The digest covers the file that registers the part and the data
+    # next to it, not whatever the main module happens to be.
+
+    model = tmp_path / _model.MAIN_FILE
+    model.write_text (MODEL)
+    (tmp_path / 'drawing.svg').write_text ('<svg/>')
+
+    assert _run (model) == 'False'
+    assert _run (model) == 'True'
+
+    (tmp_path / 'drawing.svg').write_text ('<svg></svg>')
+    assert _run (model) == 'False'
+
+    model.write_text (MODEL + '\n')
+    assert _run (model) == 'False'
+
+
+def test_stable_part_arguments ():
+
+    # Functions are keyed by name, plain values exactly as repr writes them.
+
+    plain = ( 1, 'a', [ 2.5, ( 3, ) ], { 'b': None } )
+    assert _output._stable (plain) == repr (plain)
+    assert _output._stable (( _output.part, )) == '(helpers.output.part,)'
+
+    with pytest.raises (ValueError):
+        _output._stable (( lambda: None, ))
+    with pytest.raises (ValueError):
+        _output._stable ([ object () ])
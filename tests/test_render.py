@@ -0,0 +1,17 @@
+import asyncio as _asyncio
+
+from tools import render as _render
+
+
+def test_missing_openscad (tmp_path, monkeypatch):
+
+    # A failed job that says what to set, not a traceback.
+
+    monkeypatch.setattr (_render, 'OPENSCAD', '/nonexistent/openscad')
+    source = tmp_path / 'part.scad'
+    source.write_text ('cube (1);\n')
+
+    outcome, = _asyncio.run (_render.render (_render.make_jobs ([ source ], [ 'stl' ]), 1))
+    assert not outcome.success
+    assert 'set OPENSCAD' in outcome.output
+    assert not list (tmp_path.glob ('*.stl'))
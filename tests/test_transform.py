@@ -0,0 +1,45 @@
+import numpy as _numpy
+import pytest
+
+from components import cad
+from helpers import emit as _emit
+from helpers import mesh as _mesh
+from helpers import native as _native
+from helpers import transform as _transform
+
+
+def test_missing_openscad (monkeypatch):
+    monkeypatch.setattr (_mesh, 'OPENSCAD', '/nonexistent/openscad')
+    with pytest.raises (_mesh.Unavailable):
+        _mesh.evaluate (cad.cube (1))
+
+
+def test_taper_is_continuous (monkeypatch):
+
+    # The slice no longer matters when the object can be evaluated.
+
+    monkeypatch.setattr (_mesh, 'OPENSCAD', '/nonexistent/openscad')
+    tapered = _transform.scale_along_z (cad.cube ([ 2, 2, 4 ]), [ 10, 10, 1 ], 4, 0.5)
+    assert type (tapered).__name__ == 'polyhedron'
+
+    points = _numpy.array (tapered._params ['points'])
+    bottom = points [_numpy.isclose (points [:, 2], 0)]
+    top = points [_numpy.isclose (points [:, 2], 4)]
+    assert _numpy.allclose (abs (top [:, :2]).max (axis = 0), abs (bottom [:, :2]).max (axis = 0) * 0.5)
+
+
+def test_sliced_taper_without_evaluation (monkeypatch):
+
+    # Slices are plain CSG, the fallback when nothing can evaluate the object.
+
+    def unsupported (object, file_header = ''):
+        raise _emit.Unsupported ('test')
+
+    monkeypatch.setattr (_mesh, 'OPENSCAD', '/nonexistent/openscad')
+    monkeypatch.setattr (_native, 'mesh', unsupported)
+    tapered = _transform.scale_along_z (cad.cube ([ 2, 2, 4 ]), [ 10, 10, 1 ], 4, 0.5)
+    assert tapered.name == 'union'
+    assert len (tapered.children) == 4
+
+    with pytest.raises (_mesh.Unavailable):
+        _transform.scale_along_z (cad.cube ([ 2, 2, 4 ]), None, 4, 0.5)
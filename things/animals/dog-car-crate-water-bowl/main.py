@@ -2,13 +2,13 @@
 
 import math as _math
 
-from solid2 import *
-from solid2.extensions.bosl2 import *
+from components import cad
 
 from components.common import *
+from helpers.output import part
 
 
-set_global_fn (111)
+cad.set_global_fn (111)
 
 
 OVERLAP = 0.01
@@ -48,49 +48,49 @@ def hook (bar_diameter):
 
     body = (
         # Hook base body ...
-        pie_slice (
+        cad.pie_slice (
             h = HOOK_WIDTH,
             d = bar_diameter + HOOK_THICKNESS * 2,
             ang = 180 + HOOK_ANGLE,
-            anchor = CENTER,
+            anchor = cad.CENTER,
         )
         .rotate ([ 0, 0, 0 - HOOK_ANGLE ])
         +
-        cuboid (
+        cad.cuboid (
             [
                 BAR_SINK + bar_diameter / 2,
                 bar_diameter / 2 + HOOK_THICKNESS,
                 HOOK_WIDTH
             ],
-            anchor = RIGHT + FRONT,
+            anchor = cad.RIGHT + cad.FRONT,
         )
         +
-        cuboid (
+        cad.cuboid (
             [
                 BAR_SINK,
                 HOOK_CATCH - HOOK_THICKNESS - bar_diameter / 2 + BAR_SINK,
                 HOOK_WIDTH
             ],
             chamfer = BAR_SINK,
-            edges = [ RIGHT + FRONT ],
-            anchor = RIGHT + BACK,
+            edges = [ cad.RIGHT + cad.FRONT ],
+            anchor = cad.RIGHT + cad.BACK,
         )
         .left (bar_diameter / 2)
         -
         # Pipe hole ...
-        cyl (h = HOOK_WIDTH + OVERLAP * 2, d = bar_diameter)
+        cad.cyl (h = HOOK_WIDTH + OVERLAP * 2, d = bar_diameter)
     )
 
     catch_upper = (
-        cuboid (
+        cad.cuboid (
             [
                 HOOK_CHAMFER + ONE_PERIMETER,
                 HOOK_CATCH + OVERLAP,
                 HOOK_CHAMFER + ONE_PERIMETER + OVERLAP
             ],
             chamfer = HOOK_CHAMFER,
-            edges = [ LEFT + BOTTOM, FRONT + BOTTOM ],
-            anchor = RIGHT + BACK + BOTTOM,
+            edges = [ cad.LEFT + cad.BOTTOM, cad.FRONT + cad.BOTTOM ],
+            anchor = cad.RIGHT + cad.BACK + cad.BOTTOM,
         )
         .left (bar_diameter / 2 + HOOK_THICKNESS)
         .back (bar_diameter / 2 + HOOK_THICKNESS + OVERLAP)
@@ -102,7 +102,7 @@ def hook (bar_diameter):
     body -= catch_upper + catch_lower
 
     notch = (
-        cuboid (
+        cad.cuboid (
             [
                 NOTCH_DEPTH * _math.sqrt (2),
                 NOTCH_DEPTH * _math.sqrt (2),
@@ -122,15 +122,15 @@ def hook (bar_diameter):
 def rail ():
 
     catch_upper = (
-        cuboid (
+        cad.cuboid (
             [
                 HOOK_CHAMFER + ONE_PERIMETER,
                 HOOK_CATCH,
                 HOOK_CHAMFER + ONE_PERIMETER
             ],
             chamfer = HOOK_CHAMFER,
-            edges = [ LEFT + BOTTOM, FRONT + BOTTOM ],
-            anchor = RIGHT + BACK + BOTTOM,
+            edges = [ cad.LEFT + cad.BOTTOM, cad.FRONT + cad.BOTTOM ],
+            anchor = cad.RIGHT + cad.BACK + cad.BOTTOM,
         )
         .left (HOOK_THICKNESS)
         .up (HOOK_WIDTH / 2 - HOOK_CHAMFER + HOOK_SLACK)
@@ -139,15 +139,15 @@ def rail ():
     catch_lower = catch_upper.mirror ([0, 0, 1])
 
     cover_upper = (
-        cuboid (
+        cad.cuboid (
             [
                 BAR_SINK,
                 HOOK_CATCH + BAR_SINK,
                 BAR_SINK
             ],
             chamfer = BAR_SINK,
-            edges = [ RIGHT + TOP, RIGHT + FRONT, TOP + FRONT ],
-            anchor = RIGHT + BACK + BOTTOM,
+            edges = [ cad.RIGHT + cad.TOP, cad.RIGHT + cad.FRONT, cad.TOP + cad.FRONT ],
+            anchor = cad.RIGHT + cad.BACK + cad.BOTTOM,
         )
         .up (HOOK_WIDTH / 2 + HOOK_SLACK)
     )
@@ -157,7 +157,7 @@ def rail ():
     body = catch_upper + catch_lower + cover_upper + cover_lower
 
     notch = (
-        cuboid (
+        cad.cuboid (
             [
                 NOTCH_DEPTH * _math.sqrt (2),
                 NOTCH_DEPTH * _math.sqrt (2),
@@ -177,33 +177,33 @@ def rail ():
 def bowl ():
 
     body = (
-        cuboid (
+        cad.cuboid (
             [
                 BOWL_WIDTH,
                 BOWL_LENGTH,
                 BOWL_DEPTH
             ],
-            edges = [ LEFT + FRONT, RIGHT + FRONT, LEFT + BOTTOM, FRONT + BOTTOM, RIGHT + BOTTOM ],
+            edges = [ cad.LEFT + cad.FRONT, cad.RIGHT + cad.FRONT, cad.LEFT + cad.BOTTOM, cad.FRONT + cad.BOTTOM, cad.RIGHT + cad.BOTTOM ],
             chamfer = BOWL_CHAMFER,
-            anchor = BACK + TOP,
+            anchor = cad.BACK + cad.TOP,
         )
         -
-        cuboid (
+        cad.cuboid (
             [
                 BOWL_WIDTH - BOWL_THICKNESS * 2,
                 BOWL_LENGTH - BOWL_THICKNESS * 2,
                 BOWL_DEPTH - BOWL_THICKNESS + OVERLAP
             ],
-            edges = [ LEFT + FRONT, RIGHT + FRONT, LEFT + BOTTOM, FRONT + BOTTOM, RIGHT + BOTTOM ],
+            edges = [ cad.LEFT + cad.FRONT, cad.RIGHT + cad.FRONT, cad.LEFT + cad.BOTTOM, cad.FRONT + cad.BOTTOM, cad.RIGHT + cad.BOTTOM ],
             chamfer = BOWL_CHAMFER - BOWL_THICKNESS / _math.sqrt (2),
-            anchor = BACK + TOP,
+            anchor = cad.BACK + cad.TOP,
         )
         .fwd (BOWL_THICKNESS)
         .up (OVERLAP)
     )
 
     notch = (
-        cuboid (
+        cad.cuboid (
             [
                 NOTCH_WIDTH,
                 NOTCH_DEPTH * _math.sqrt (2),
@@ -232,69 +232,69 @@ def bowl ():
 def lid ():
 
     body = (
-        cuboid (
+        cad.cuboid (
             [
                 BOWL_WIDTH + LID_SLACK * 2 + LID_THICKNESS * 2,
                 BOWL_LENGTH + LID_SLACK * 2 + LID_THICKNESS * 2,
                 LID_CATCH + LID_THICKNESS
             ],
-            edges = [ LEFT + FRONT, RIGHT + FRONT ],
+            edges = [ cad.LEFT + cad.FRONT, cad.RIGHT + cad.FRONT ],
             chamfer = BOWL_CHAMFER + (LID_SLACK + LID_THICKNESS) / _math.sqrt (2),
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         -
-        cuboid (
+        cad.cuboid (
             [
                 BOWL_WIDTH + LID_SLACK * 2,
                 BOWL_LENGTH + LID_SLACK * 2,
                 LID_CATCH + OVERLAP
             ],
-            edges = [ LEFT + FRONT, RIGHT + FRONT ],
+            edges = [ cad.LEFT + cad.FRONT, cad.RIGHT + cad.FRONT ],
             chamfer = BOWL_CHAMFER + LID_SLACK / _math.sqrt (2),
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .up (LID_THICKNESS)
         +
-        cuboid (
+        cad.cuboid (
             [
                 BOWL_WIDTH - BOWL_THICKNESS * 2 - LID_SLACK * 2,
                 BOWL_LENGTH - LID_THICKNESS * 2 - LID_SLACK * 2,
                 LID_SHIELD_OUTER + LID_THICKNESS
             ],
-            edges = [ LEFT + FRONT, RIGHT + FRONT ],
+            edges = [ cad.LEFT + cad.FRONT, cad.RIGHT + cad.FRONT ],
             chamfer = BOWL_CHAMFER - (BOWL_THICKNESS + LID_SLACK) / _math.sqrt (2),
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         -
-        cuboid (
+        cad.cuboid (
             [
                 BOWL_WIDTH - BOWL_THICKNESS * 2 - LID_SLACK * 2 - LID_THICKNESS * 2,
                 BOWL_LENGTH - LID_THICKNESS * 2 - LID_SLACK * 2 - LID_THICKNESS * 2,
                 LID_SHIELD_OUTER + OVERLAP
             ],
-            edges = [ LEFT + FRONT, RIGHT + FRONT ],
+            edges = [ cad.LEFT + cad.FRONT, cad.RIGHT + cad.FRONT ],
             chamfer = BOWL_CHAMFER - (BOWL_THICKNESS + LID_SLACK + LID_THICKNESS) / _math.sqrt (2),
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .up (LID_THICKNESS)
     )
 
     guard = (
-        fillet (
+        cad.fillet (
             l = BOWL_WIDTH - BOWL_THICKNESS * 2 - LID_SLACK * 2,
             r = LID_BRIM - LID_THICKNESS * 2,
         )
         .rotate ([ 90, 0, 0 - 90 ])
         .fwd (BOWL_LENGTH / 2 - BOWL_THICKNESS - LID_SLACK - LID_THICKNESS)
         +
-        fillet (
+        cad.fillet (
             l = BOWL_WIDTH - BOWL_THICKNESS * 2 - LID_SLACK * 2 - BOWL_CHAMFER * 2 + LID_THICKNESS,
             r = LID_BRIM - LID_THICKNESS * 2,
         )
         .rotate ([ 0 - 90, 180, 0 - 90 ])
         .back (BOWL_LENGTH / 2 - BOWL_THICKNESS - LID_SLACK - LID_THICKNESS)
         +
-        fillet (
+        cad.fillet (
             l = BOWL_LENGTH - BOWL_THICKNESS * 2 - LID_SLACK * 2 - BOWL_CHAMFER,
             r = LID_BRIM - LID_THICKNESS * 2,
         )
@@ -302,7 +302,7 @@ def lid ():
         .left (BOWL_WIDTH / 2 - BOWL_THICKNESS - LID_SLACK - LID_THICKNESS)
         .fwd (BOWL_CHAMFER / 2 - LID_THICKNESS / 2)
         +
-        fillet (
+        cad.fillet (
             l = BOWL_LENGTH - BOWL_THICKNESS * 2 - LID_SLACK * 2 - BOWL_CHAMFER,
             r = LID_BRIM - LID_THICKNESS * 2,
         )
@@ -310,7 +310,7 @@ def lid ():
         .right (BOWL_WIDTH / 2 - BOWL_THICKNESS - LID_SLACK - LID_THICKNESS)
         .fwd (BOWL_CHAMFER / 2 - LID_THICKNESS / 2)
         +
-        fillet (
+        cad.fillet (
             l = BOWL_CHAMFER * _math.sqrt (2) - BOWL_THICKNESS - LID_SLACK - LID_THICKNESS,
             r = LID_BRIM - LID_THICKNESS * 2,
         )
@@ -318,7 +318,7 @@ def lid ():
         .left (BOWL_WIDTH / 2 - BOWL_THICKNESS - LID_SLACK - LID_THICKNESS - (BOWL_CHAMFER - (BOWL_THICKNESS + LID_SLACK + LID_THICKNESS) / _math.sqrt (2)) / 2)
         .back (BOWL_LENGTH / 2 - BOWL_THICKNESS - LID_SLACK - LID_THICKNESS - (BOWL_CHAMFER - (BOWL_THICKNESS + LID_SLACK + LID_THICKNESS) / _math.sqrt (2)) / 2)
         +
-        fillet (
+        cad.fillet (
             l = BOWL_CHAMFER * _math.sqrt (2) - BOWL_THICKNESS - LID_SLACK - LID_THICKNESS,
             r = LID_BRIM - LID_THICKNESS * 2,
         )
@@ -332,7 +332,7 @@ def lid ():
     body += guard
 
     notch = (
-        cuboid (
+        cad.cuboid (
             [
                 NOTCH_WIDTH + LID_SLACK * 2,
                 NOTCH_DEPTH * _math.sqrt (2),
@@ -350,30 +350,30 @@ def lid ():
     body -= notch_front + notch_left + notch_right
 
     shield = (
-        cuboid (
+        cad.cuboid (
             [
                 BOWL_WIDTH - LID_BRIM * 2 + LID_THICKNESS * 2,
                 BOWL_LENGTH - LID_BRIM * 2 + LID_THICKNESS * 2,
                 LID_THICKNESS + LID_SHIELD_INNER
             ],
-            edges = [ LEFT + FRONT, RIGHT + FRONT ],
+            edges = [ cad.LEFT + cad.FRONT, cad.RIGHT + cad.FRONT ],
             rounding = LID_ROUNDING + LID_THICKNESS,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
     )
 
     body += shield
 
     hole = (
-        cuboid (
+        cad.cuboid (
             [
                 BOWL_WIDTH - LID_BRIM * 2,
                 BOWL_LENGTH - LID_BRIM * 2,
                 LID_THICKNESS + LID_SHIELD_INNER + OVERLAP * 2
             ],
-            edges = [ LEFT + FRONT, RIGHT + FRONT ],
+            edges = [ cad.LEFT + cad.FRONT, cad.RIGHT + cad.FRONT ],
             rounding = LID_ROUNDING,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .down (OVERLAP)
     )
@@ -383,7 +383,7 @@ def lid ():
     return body
 
 
-hook (BAR_DIAMETER_SMALL).save_as_scad ('hook-small.scad')
-hook (BAR_DIAMETER_LARGE).save_as_scad ('hook-large.scad')
-bowl ().save_as_scad ('bowl.scad')
-lid ().save_as_scad ('lid.scad')
+part ('hook-small.scad', hook, BAR_DIAMETER_SMALL)
+part ('hook-large.scad', hook, BAR_DIAMETER_LARGE)
+part ('bowl.scad', bowl)
+part ('lid.scad', lid)
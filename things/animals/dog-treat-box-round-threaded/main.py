@@ -2,12 +2,13 @@
 
 import numpy as _np
 
-from solid2 import *
-from solid2.extensions.bosl2 import *
-from solid2.extensions.bosl2.threading import *
+from components import cad
 
+from helpers.output import part
 
-set_global_fn (111)
+
+cad.require ('threading')
+cad.set_global_fn (111)
 
 
 OVERLAP = 0.001
@@ -45,12 +46,12 @@ def box ():
     inside_height = outside_height - BOX_THICKNESS_FLOOR
 
     box = (
-        cyl (
+        cad.cyl (
             h = outside_height, d = BOX_DIAMETER, circum = True,
             chamfer1 = BOX_CHAMFER, _fn = BOX_SEGMENTS,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         ) +
-        threaded_rod (
+        cad.threaded_rod (
             h = THREAD_HEIGHT,
             d = THREAD_DIAMETERS - THREAD_SLACK/2,
             pitch = THREAD_PITCH,
@@ -58,13 +59,13 @@ def box ():
             blunt_start1 = False,
             end_len2 = THREAD_LEAD,
             bevel2 = THREAD_BEVEL,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .up (outside_height) -
-        cyl (
+        cad.cyl (
             h = inside_height + THREAD_HEIGHT + OVERLAP, d = BOX_DIAMETER - BOX_THICKNESS_WALLS * 2,
             rounding1 = BOX_CHAMFER,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .up (BOX_THICKNESS_FLOOR)
     )
@@ -78,12 +79,12 @@ def lid ():
     inside_height = outside_height - BOX_THICKNESS_FLOOR
 
     lid = (
-        cyl (
+        cad.cyl (
             h = outside_height, d = BOX_DIAMETER, circum = True,
             chamfer1 = BOX_CHAMFER, _fn = BOX_SEGMENTS,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         ) -
-        threaded_rod (
+        cad.threaded_rod (
             h = THREAD_HEIGHT + OVERLAP,
             d = THREAD_DIAMETERS + THREAD_SLACK/2,
             pitch = THREAD_PITCH,
@@ -91,19 +92,19 @@ def lid ():
             internal = True,
             blunt_start1 = False,
             end_len2 = THREAD_LEAD,
-            anchor = BOTTOM,
-            orient = BOTTOM,
+            anchor = cad.BOTTOM,
+            orient = cad.BOTTOM,
         )
         .up (outside_height + OVERLAP) -
-        cyl (
+        cad.cyl (
             h = inside_height + OVERLAP, d = BOX_DIAMETER - BOX_THICKNESS_WALLS * 2,
             rounding1 = BOX_CHAMFER,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .up (BOX_THICKNESS_FLOOR)
     )
 
-    paw_full = import_ ('paw.svg').scale (0.5)
+    paw_full = cad.import_ ('paw.svg').scale (0.5)
     paw_line_outer = paw_full.offset (PAW_OUTLINE/2).linear_extrude (PAW_DEPTH + OVERLAP).down (OVERLAP)
     paw_line_inner = paw_full.offset (-PAW_OUTLINE/2).linear_extrude (PAW_DEPTH + 2*OVERLAP).down (2*OVERLAP)
     paw_line = paw_line_outer - paw_line_inner
@@ -111,5 +112,5 @@ def lid ():
     return lid - paw_line
 
 
-box ().save_as_scad ('box.scad')
-lid ().save_as_scad ('lid.scad')
+part ('box.scad', box)
+part ('lid.scad', lid)
@@ -3,12 +3,14 @@
 import numpy as _np
 import math as _math
 
-from solid2 import *
-from solid2.extensions.bosl2 import *
-from solid2.extensions.bosl2.threading import *
+from components import cad
+from components import instances
 
+from helpers.output import part
 
-set_global_fn (111)
+
+cad.require ('threading')
+cad.set_global_fn (111)
 
 
 OVERLAP = 0.001
@@ -51,7 +53,7 @@ def box ():
     outside_height = BOX_HEIGHT - BOX_LID_SPLIT
 
     box = (
-        threaded_rod (
+        cad.threaded_rod (
             h = THREAD_HEIGHT + OVERLAP,
             d = THREAD_DIAMETERS - THREAD_SLACK/2,
             pitch = THREAD_PITCH,
@@ -59,31 +61,31 @@ def box ():
             blunt_start2 = False,
             end_len1 = THREAD_LEAD,
             bevel1 = THREAD_BEVEL,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         ) +
-        cyl (
+        cad.cyl (
             h = outside_height, d = BOX_DIAMETER, circum = True,
             chamfer1 = BOX_THICKNESS_WALLS,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .up (THREAD_HEIGHT) -
-        cyl (
+        cad.cyl (
             h = THREAD_HEIGHT + OVERLAP, d = BOX_DIAMETER - BOX_THICKNESS_WALLS * 4,
             rounding1 = BOX_CHAMFER * ROUNDED,
             rounding2 = 0 - BOX_THICKNESS_WALLS/2 * ROUNDED,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .up (BOX_THICKNESS_FLOOR) -
-        cyl (
+        cad.cyl (
             h = outside_height + OVERLAP, d = BOX_DIAMETER - BOX_THICKNESS_WALLS * 2,
             rounding1 = BOX_THICKNESS_WALLS/2 * ROUNDED,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .up (THREAD_HEIGHT + BOX_THICKNESS_FLOOR)
     )
 
-    paw_line = import_ ('paw.svg').scale (0.77)
-    paw_full = cylindrical_extrude (id = BOX_DIAMETER - PAW_DEPTH, od = BOX_DIAMETER + PAW_DEPTH) (paw_line).up (BOX_HEIGHT/2 + THREAD_HEIGHT)
+    paw_line = cad.import_ ('paw.svg').scale (0.77)
+    paw_full = cad.cylindrical_extrude (id = BOX_DIAMETER - PAW_DEPTH, od = BOX_DIAMETER + PAW_DEPTH) (paw_line).up (BOX_HEIGHT/2 + THREAD_HEIGHT)
 
     return box - paw_full
 
@@ -91,20 +93,30 @@ def box ():
 def holes_round ():
 
     hole = (
-        cyl (
+        cad.cyl (
             h = BOX_THICKNESS_FLOOR + OVERLAP * 2, d = HOLE_DIAMETER,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .down (OVERLAP)
     )
 
     hole_count = _math.floor ((BOX_DIAMETER / 2 - BOX_THICKNESS_WALLS * 2 - HOLE_DIAMETER) / HOLE_SPACING) + 1
 
-    hole_line = union () (*[ hole.right (index * HOLE_SPACING).rotate ([0, 0, 60]) for index in range (hole_count) ])
-    hole_frag = union () (*[ hole_line.left (index * HOLE_SPACING) for index in range (hole_count) ])
-    hole_full = union () (*[ hole_frag.rotate ([0, 0, index * 60]) for index in range (6) ])
+    # A line of holes turned by 60 degrees, repeated along X
+    # to fill a rhombus, then six rhombi around the center.
+
+    steps = _np.arange (hole_count) * HOLE_SPACING
+    line = _np.stack ([ steps * _math.cos (_math.pi/3), steps * _math.sin (_math.pi/3) ], axis = -1)
+    frag = (line [:, None] - _np.stack ([ steps, _np.zeros (hole_count) ], axis = -1) [None, :]).reshape (-1, 2)
+
+    turns = _np.radians (_np.arange (6) * 60)
+    spins = _np.stack ([ _np.stack ([ _np.cos (turns), -_np.sin (turns) ], axis = -1), _np.stack ([ _np.sin (turns), _np.cos (turns) ], axis = -1) ], axis = 1)
+    full = _np.einsum ('kij,nj->kni', spins, frag).reshape (-1, 2)
+
+    offsets = _np.column_stack ([ full, _np.zeros (len (full)) ])
+    rotations = _np.column_stack ([ _np.zeros ((len (full), 2)), _np.repeat (_np.degrees (turns) + 60, len (frag)) ])
 
-    return hole_full
+    return instances.instances (hole, offsets, rotations)
 
 
 def holes_slits ():
@@ -118,28 +130,28 @@ def holes_slits ():
         slit_position = index * SLIT_SPACING
         slit_length = _math.sqrt (slit_radius ** 2 - slit_position ** 2) * 2
         slit = (
-            cuboid (
+            cad.cuboid (
                 [ SLIT_WIDTH, slit_length, BOX_THICKNESS_FLOOR + OVERLAP * 2],
-                rounding = SLIT_WIDTH/2, edges = [ FRONT+LEFT, FRONT+RIGHT, BACK+LEFT, BACK+RIGHT ],
-                anchor = BOTTOM,
+                rounding = SLIT_WIDTH/2, edges = [ cad.FRONT+cad.LEFT, cad.FRONT+cad.RIGHT, cad.BACK+cad.LEFT, cad.BACK+cad.RIGHT ],
+                anchor = cad.BOTTOM,
             )
             .down (OVERLAP)
         )
         slit_list.append (slit.left (slit_position))
         slit_list.append (slit.right (slit_position))
 
-    return union () (*slit_list)
+    return cad.union () (*slit_list)
 
 
 def lid ():
 
     lid = (
-        cyl (
+        cad.cyl (
             h = BOX_LID_SPLIT + BOX_THICKNESS_WALLS, d = BOX_DIAMETER, circum = True,
             chamfer1 = BOX_CHAMFER,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         ) -
-        threaded_rod (
+        cad.threaded_rod (
             h = THREAD_HEIGHT + OVERLAP,
             d = THREAD_DIAMETERS + THREAD_SLACK/2,
             pitch = THREAD_PITCH,
@@ -147,15 +159,15 @@ def lid ():
             internal = True,
             blunt_start1 = False,
             end_len2 = THREAD_LEAD,
-            anchor = BOTTOM,
-            orient = BOTTOM,
+            anchor = cad.BOTTOM,
+            orient = cad.BOTTOM,
         )
         .up (BOX_LID_SPLIT + OVERLAP) -
-        cyl (
+        cad.cyl (
             h = BOX_LID_SPLIT + BOX_THICKNESS_WALLS - BOX_THICKNESS_FLOOR + OVERLAP, d = BOX_DIAMETER - BOX_THICKNESS_WALLS * 2,
             chamfer2 = 0 - BOX_THICKNESS_WALLS,
             rounding1 = BOX_CHAMFER * ROUNDED,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .up (BOX_THICKNESS_FLOOR)
     )
@@ -163,9 +175,14 @@ def lid ():
     return lid
 
 
-box_round = box () - holes_round ()
-box_slits = box () - holes_slits ()
+def box_round ():
+    return box () - holes_round ()
+
+
+def box_slits ():
+    return box () - holes_slits ()
+
 
-box_round.save_as_scad ('box-round.scad')
-box_slits.save_as_scad ('box-slits.scad')
-lid ().save_as_scad ('lid.scad')
+part ('box-round.scad', box_round)
+part ('box-slits.scad', box_slits)
+part ('lid.scad', lid)
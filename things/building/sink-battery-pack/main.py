@@ -2,13 +2,13 @@
 
 import math as _math
 
-from solid2 import *
-from solid2.extensions.bosl2 import *
+from components import cad
 
 from components.common import *
+from helpers.output import part
 
 
-set_global_fn (111)
+cad.set_global_fn (111)
 
 
 OVERLAP = 0.01
@@ -41,15 +41,15 @@ def pack (sink_hole_diameter_upper, sink_hole_diameter_lower, sink_hole_depth):
 
     tube_hole_angle = _math.degrees (_math.asin ((TUBE_HOLE_DIAMETER / 2 + TUBE_HOLE_GAP / 2) / TUBE_HOLE_DISTANCE))
 
-    body = cyl (h = sink_hole_depth + RIM_THICKNESS, d1 = sink_hole_diameter_lower, d2 = sink_hole_diameter_upper, anchor = BOTTOM)
-    body += cyl (h = RIM_THICKNESS, d = sink_hole_diameter_lower + RIM_LENGTH * 2, anchor = BOTTOM)
-    body -= cyl (h = sink_hole_depth + RIM_THICKNESS + OVERLAP * 2, d = SCREW_HOLE_DIAMETER, anchor = BOTTOM).back (SCREW_HOLE_DISTANCE).down (OVERLAP)
-    body -= cyl (h = sink_hole_depth + RIM_THICKNESS + OVERLAP * 2, d = TUBE_HOLE_DIAMETER, anchor = BOTTOM).fwd (TUBE_HOLE_DISTANCE).rotate ([0, 0, 0 + tube_hole_angle]).down (OVERLAP)
-    body -= cyl (h = sink_hole_depth + RIM_THICKNESS + OVERLAP * 2, d = TUBE_HOLE_DIAMETER, anchor = BOTTOM).fwd (TUBE_HOLE_DISTANCE).rotate ([0, 0, 0 - tube_hole_angle]).down (OVERLAP)
+    body = cad.cyl (h = sink_hole_depth + RIM_THICKNESS, d1 = sink_hole_diameter_lower, d2 = sink_hole_diameter_upper, anchor = cad.BOTTOM)
+    body += cad.cyl (h = RIM_THICKNESS, d = sink_hole_diameter_lower + RIM_LENGTH * 2, anchor = cad.BOTTOM)
+    body -= cad.cyl (h = sink_hole_depth + RIM_THICKNESS + OVERLAP * 2, d = SCREW_HOLE_DIAMETER, anchor = cad.BOTTOM).back (SCREW_HOLE_DISTANCE).down (OVERLAP)
+    body -= cad.cyl (h = sink_hole_depth + RIM_THICKNESS + OVERLAP * 2, d = TUBE_HOLE_DIAMETER, anchor = cad.BOTTOM).fwd (TUBE_HOLE_DISTANCE).rotate ([0, 0, 0 + tube_hole_angle]).down (OVERLAP)
+    body -= cad.cyl (h = sink_hole_depth + RIM_THICKNESS + OVERLAP * 2, d = TUBE_HOLE_DIAMETER, anchor = cad.BOTTOM).fwd (TUBE_HOLE_DISTANCE).rotate ([0, 0, 0 - tube_hole_angle]).down (OVERLAP)
 
     return body
 
 
-pack (SINK_SHOWER_HOLE_DIAMETER_UPPER, SINK_SHOWER_HOLE_DIAMETER_LOWER, SINK_SHOWER_HOLE_DEPTH).save_as_scad ('pack-shower.scad')
-pack (SINK_KITCHEN_HOLE_DIAMETER_UPPER, SINK_KITCHEN_HOLE_DIAMETER_LOWER, SINK_KITCHEN_HOLE_DEPTH).save_as_scad ('pack-kitchen.scad')
-pack (SINK_BATHROOM_HOLE_DIAMETER_UPPER, SINK_BATHROOM_HOLE_DIAMETER_LOWER, SINK_BATHROOM_HOLE_DEPTH).save_as_scad ('pack-bathroom.scad')
+part ('pack-shower.scad', pack, SINK_SHOWER_HOLE_DIAMETER_UPPER, SINK_SHOWER_HOLE_DIAMETER_LOWER, SINK_SHOWER_HOLE_DEPTH)
+part ('pack-kitchen.scad', pack, SINK_KITCHEN_HOLE_DIAMETER_UPPER, SINK_KITCHEN_HOLE_DIAMETER_LOWER, SINK_KITCHEN_HOLE_DEPTH)
+part ('pack-bathroom.scad', pack, SINK_BATHROOM_HOLE_DIAMETER_UPPER, SINK_BATHROOM_HOLE_DIAMETER_LOWER, SINK_BATHROOM_HOLE_DEPTH)
@@ -2,10 +2,12 @@
 
 import math
 
-from solid import *
-from solid.utils import *
+from components import cad_legacy as cad
+from components import instances
+from components.cache import memoized
 
 from components.common import *
+from helpers.output import part
 
 
 SEGMENTS = 111
@@ -38,15 +40,16 @@ INSERT_OVERLAP = 1
 INSERT_THICKNESS = 1
 
 
+@memoized
 def rounded_box (size, radius):
 
-    corner = cylinder (r = radius, h = size [Z])
-    ll_corner = translate ((radius, radius, 0)) (corner)
-    lr_corner = translate ((size [X] - radius, radius, 0)) (corner)
-    ul_corner = translate ((radius, size [Y] - radius, 0)) (corner)
-    ur_corner = translate ((size [X] - radius, size [Y] - radius, 0)) (corner)
+    corner = cad.cylinder (r = radius, h = size [Z])
+    ll_corner = cad.translate ((radius, radius, 0)) (corner)
+    lr_corner = cad.translate ((size [X] - radius, radius, 0)) (corner)
+    ul_corner = cad.translate ((radius, size [Y] - radius, 0)) (corner)
+    ur_corner = cad.translate ((size [X] - radius, size [Y] - radius, 0)) (corner)
 
-    return hull () (ll_corner + lr_corner + ul_corner + ur_corner)
+    return cad.hull () (ll_corner + lr_corner + ul_corner + ur_corner)
 
 
 HEX_SCALE_LONGER = math.cos (math.pi*1/6)
@@ -84,10 +87,11 @@ def size_to_hexagrid_size (size, gap, radius):
     return ( outer_horizontal, outer_vertical, size [Z] )
 
 
+@memoized
 def hexagon (radius, rim, thickness):
-    outer = cylinder (r = radius + rim / HEX_SCALE_LONGER, h = thickness, segments = 6)
-    inner = translate ((0, 0, 0 - OVERLAP)) (cylinder (r = radius, h = thickness + 2*OVERLAP, segments = 6))
-    return rotate ((0, 0, 30)) (outer - inner)
+    outer = cad.cylinder (r = radius + rim / HEX_SCALE_LONGER, h = thickness, segments = 6)
+    inner = cad.translate ((0, 0, 0 - OVERLAP)) (cad.cylinder (r = radius, h = thickness + 2*OVERLAP, segments = 6))
+    return cad.rotate ((0, 0, 30)) (outer - inner)
 
 
 def hexagrid (rows, cols, gap, radius, thickness):
@@ -95,17 +99,14 @@ def hexagrid (rows, cols, gap, radius, thickness):
     spacing_vertical = 2*hexagrid_spacing_vertical (gap, radius)
     spacing_horizontal = hexagrid_spacing_horizontal (gap, radius)
 
-    element = translate ((gap + radius * HEX_SCALE_LONGER, gap / HEX_SCALE_LONGER + radius, 0)) (hexagon (radius, gap, thickness))
+    element = cad.translate ((gap + radius * HEX_SCALE_LONGER, gap / HEX_SCALE_LONGER + radius, 0)) (hexagon (radius, gap, thickness))
 
-    grid_row_longer_list = [ translate ((spacing_horizontal*column, 0, 0)) (element) for column in range (cols) ]
-    grid_row_longer = union () (*grid_row_longer_list)
-    grid_rows_longer = [ translate ((0, spacing_vertical*row, 0)) (grid_row_longer) for row in range (math.ceil (rows/2)) ]
+    steps = (( spacing_horizontal, 0, 0 ), ( 0, spacing_vertical, 0 ))
 
-    grid_row_shorter_list = [ translate ((spacing_horizontal*column + spacing_horizontal/2, 0, 0)) (element) for column in range (cols-1) ]
-    grid_row_shorter = union () (*grid_row_shorter_list)
-    grid_rows_shorter = [ translate ((0, spacing_vertical*row + spacing_vertical/2, 0)) (grid_row_shorter) for row in range (math.floor (rows/2)) ]
+    grid_rows_longer = instances.lattice (element, ( cols, math.ceil (rows/2) ), steps)
+    grid_rows_shorter = instances.lattice (element, ( cols-1, math.floor (rows/2) ), steps, ( spacing_horizontal/2, spacing_vertical/2, 0 ))
 
-    return union () (*grid_rows_longer, *grid_rows_shorter)
+    return cad.union () (grid_rows_longer, grid_rows_shorter)
 
 
 def holder_lower ():
@@ -118,29 +119,29 @@ def holder_lower ():
     cutout_hex_gap = HEX_GAP + 2*INSERT_SLACK + 2*OVERLAP
     cutout_hex_radius = HEX_RADIUS - (INSERT_SLACK + OVERLAP)/HEX_SCALE_LONGER
 
-    insert_body = translate ((0 - (HEX_GAP + INSERT_SLACK)/HEX_SCALE_LONGER, 0 - HEX_GAP - INSERT_SLACK, 0)) (
+    insert_body = cad.translate ((0 - (HEX_GAP + INSERT_SLACK)/HEX_SCALE_LONGER, 0 - HEX_GAP - INSERT_SLACK, 0)) (
         hexagrid (back_rows, back_cols, body_hex_gap, body_hex_radius, INSERT_THICKNESS + INSERT_OVERLAP))
-    insert_cutout = translate ((0 - OVERLAP/HEX_SCALE_LONGER, 0 - 2*hexagrid_spacing_vertical (cutout_hex_gap, cutout_hex_radius) - OVERLAP, 0 - OVERLAP)) (
+    insert_cutout = cad.translate ((0 - OVERLAP/HEX_SCALE_LONGER, 0 - 2*hexagrid_spacing_vertical (cutout_hex_gap, cutout_hex_radius) - OVERLAP, 0 - OVERLAP)) (
         hexagrid (back_rows + 4, back_cols, cutout_hex_gap, cutout_hex_radius, INSERT_THICKNESS + OVERLAP))
 
-    back = translate ((0, 0, INSERT_THICKNESS)) (
+    back = cad.translate ((0, 0, INSERT_THICKNESS)) (
         hexagrid (back_rows, back_cols, HEX_GAP, HEX_RADIUS, BACK_THICKNESS + BACK_BENT))
 
     bent_radius = back_size [Y] ** 2 / BACK_BENT / 8 + BACK_BENT / 2
     hook_angle = math.degrees (math.asin (back_size [Y] / bent_radius / 2))
 
-    bent = translate ((0 - OVERLAP, back_size [Y] / 2, INSERT_THICKNESS + BACK_THICKNESS + bent_radius)) (
-        rotate ((0, 90, 0)) (
-            cylinder (r = bent_radius, h = back_size [X] + 2*OVERLAP)))
+    bent = cad.translate ((0 - OVERLAP, back_size [Y] / 2, INSERT_THICKNESS + BACK_THICKNESS + bent_radius)) (
+        cad.rotate ((0, 90, 0)) (
+            cad.cylinder (r = bent_radius, h = back_size [X] + 2*OVERLAP)))
 
-    hook = union () (
+    hook = cad.union () (
         rounded_box ((HOOK_WIDTH, HOOK_DEPTH + WALL_OFFSET + WALL_THICKNESS, WALL_THICKNESS), WALL_RADIUS),
-        translate ((0, HOOK_DEPTH + WALL_OFFSET + WALL_THICKNESS, 0)) (
-            rotate ((90 - hook_angle, 0, 0)) (
+        cad.translate ((0, HOOK_DEPTH + WALL_OFFSET + WALL_THICKNESS, 0)) (
+            cad.rotate ((90 - hook_angle, 0, 0)) (
                 rounded_box ((HOOK_WIDTH, HOOK_CATCH + WALL_THICKNESS, WALL_THICKNESS), WALL_RADIUS))))
 
-    hook = translate (((back_size [X] - HOOK_WIDTH)/2, back_size [Y] - WALL_OFFSET, BACK_THICKNESS + BACK_BENT - WALL_OFFSET)) (
-        rotate ((90 + hook_angle + BACK_ADJUST, 0, 0)) (
+    hook = cad.translate (((back_size [X] - HOOK_WIDTH)/2, back_size [Y] - WALL_OFFSET, BACK_THICKNESS + BACK_BENT - WALL_OFFSET)) (
+        cad.rotate ((90 + hook_angle + BACK_ADJUST, 0, 0)) (
             hook))
 
     return insert_body - insert_cutout + back - bent + hook
@@ -157,29 +158,29 @@ def holder_upper ():
     slope_size = ( back_size [X] + 2*OVERLAP, back_size [Y] + 2*OVERLAP, back_size [Z] + BACK_SLOPE + OVERLAP)
 
     back = hexagrid (back_rows, back_cols, HEX_GAP, HEX_RADIUS, BACK_THICKNESS + BACK_SLOPE)
-    slope = multmatrix ((
+    slope = cad.multmatrix ((
         (1, 0, 0, 0 - OVERLAP),
         (0, 1, 0, 0 - OVERLAP),
         (0 - wall_ratio, 0, 1, BACK_SLOPE + BACK_THICKNESS),
         (0, 0, 0, 1))) (
-            cube (slope_size))
+            cad.cube (slope_size))
 
-    wall_right = translate ((back_size [X] - WALL_OFFSET * wall_reduce_width, WALL_OFFSET, WALL_OFFSET * wall_reduce_height)) (
-        rotate ((0, math.degrees (wall_ratio) - 90, 0)) (
+    wall_right = cad.translate ((back_size [X] - WALL_OFFSET * wall_reduce_width, WALL_OFFSET, WALL_OFFSET * wall_reduce_height)) (
+        cad.rotate ((0, math.degrees (wall_ratio) - 90, 0)) (
             rounded_box ((PHONE_THICKNESS + BACK_THICKNESS, back_size [Y] - 2*WALL_OFFSET, WALL_THICKNESS), WALL_RADIUS)
         )
     )
 
     bottom_wall_width = (back_size [X] / wall_reduce_width - 4 * WALL_OFFSET) / 3
 
-    wall_bottom_left = translate ((WALL_OFFSET * wall_reduce_width, WALL_OFFSET + WALL_THICKNESS, BACK_SLOPE - WALL_OFFSET * wall_reduce_height)) (
-        rotate ((90, math.degrees (wall_angle), 0)) (
+    wall_bottom_left = cad.translate ((WALL_OFFSET * wall_reduce_width, WALL_OFFSET + WALL_THICKNESS, BACK_SLOPE - WALL_OFFSET * wall_reduce_height)) (
+        cad.rotate ((90, math.degrees (wall_angle), 0)) (
             rounded_box ((bottom_wall_width, PHONE_THICKNESS + BACK_THICKNESS, WALL_THICKNESS), WALL_RADIUS)
         )
     )
 
-    wall_bottom_right = translate ((back_size [X] - (bottom_wall_width + WALL_OFFSET) * wall_reduce_width, WALL_OFFSET + WALL_THICKNESS, (bottom_wall_width + WALL_OFFSET) * wall_reduce_height)) (
-        rotate ((90, math.degrees (wall_angle), 0)) (
+    wall_bottom_right = cad.translate ((back_size [X] - (bottom_wall_width + WALL_OFFSET) * wall_reduce_width, WALL_OFFSET + WALL_THICKNESS, (bottom_wall_width + WALL_OFFSET) * wall_reduce_height)) (
+        cad.rotate ((90, math.degrees (wall_angle), 0)) (
             rounded_box ((bottom_wall_width, PHONE_THICKNESS + BACK_THICKNESS, WALL_THICKNESS), WALL_RADIUS)
         )
     )
@@ -187,5 +188,5 @@ def holder_upper ():
     return back - slope + wall_right + wall_bottom_left + wall_bottom_right
 
 
-scad_render_to_file (holder_lower (), 'holder_lower.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (holder_upper (), 'holder_upper.scad', file_header = f'$fn = {SEGMENTS};')
+part ('holder_lower.scad', holder_lower, file_header = f'$fn = {SEGMENTS};')
+part ('holder_upper.scad', holder_upper, file_header = f'$fn = {SEGMENTS};')
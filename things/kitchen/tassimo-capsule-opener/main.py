@@ -2,11 +2,12 @@
 
 import math as _math
 
-from solid2 import *
-from solid2.extensions.bosl2 import *
+from components import cad
 
+from helpers.output import part
 
-set_global_fn (111)
+
+cad.set_global_fn (111)
 
 
 OVERLAP = 0.001
@@ -48,14 +49,14 @@ def _tooth (inner_radius, outer_radius, depth, edge_angle, body_angle):
         # Negative angle means sharp inner edge.
         tooth_path = [[inner_radius, 0], [outer_radius, 0], [outer_radius, depth - edge_height], [inner_radius + EDGE_THICKNESS, depth], [inner_radius, depth]]
 
-    tooth_base = rotate_sweep (tooth_path, body_angle / 2)
+    tooth_base = cad.rotate_sweep (tooth_path, body_angle / 2)
 
     slant_length = outer_radius * _math.sin (_math.radians (body_angle) / 2)
 
     tooth_upper = tooth_base.skew (szy = 0 - edge_height / slant_length)
     tooth_lower = tooth_upper.mirror ([ 0, 1, 0])
 
-    tooth_body = (tooth_upper + tooth_lower) * cuboid ([outer_radius, outer_radius, depth], anchor = LEFT + BOTTOM)
+    tooth_body = (tooth_upper + tooth_lower) * cad.cuboid ([outer_radius, outer_radius, depth], anchor = cad.LEFT + cad.BOTTOM)
 
     return tooth_body
 
@@ -71,51 +72,51 @@ def _teeth (inner_radius, outer_radius, depth, edge_angle, count):
 def _opener (center_slack, handle_hole_diameter):
 
     arm = (
-        cyl (
+        cad.cyl (
             d = THUMB_DIAMETER, h = ARM_THICKNESS,
             chamfer = ARM_CHAMFER,
-            anchor = TOP,
+            anchor = cad.TOP,
         )
         +
-        cuboid (
+        cad.cuboid (
             [ ARM_LENGTH, ARM_WIDTH, ARM_THICKNESS ],
-            edges = [ FRONT + BOTTOM, FRONT + TOP, BACK + BOTTOM, BACK + TOP ],
+            edges = [ cad.FRONT + cad.BOTTOM, cad.FRONT + cad.TOP, cad.BACK + cad.BOTTOM, cad.BACK + cad.TOP ],
             chamfer = ARM_CHAMFER,
-            anchor = TOP,
+            anchor = cad.TOP,
         )
         .right (ARM_LENGTH / 2)
         +
-        cyl (
+        cad.cyl (
             d = ARM_WIDTH, h = ARM_THICKNESS,
             chamfer = ARM_CHAMFER,
-            anchor = TOP,
+            anchor = cad.TOP,
         )
         .right (ARM_LENGTH)
     )
 
     if (handle_hole_diameter):
 
-        hole = cyl (d = handle_hole_diameter, h = ARM_THICKNESS + OVERLAP * 2, anchor = TOP).right (ARM_LENGTH).up (OVERLAP)
+        hole = cad.cyl (d = handle_hole_diameter, h = ARM_THICKNESS + OVERLAP * 2, anchor = cad.TOP).right (ARM_LENGTH).up (OVERLAP)
 
         arm -= hole
 
     middle = (
-        cyl (
+        cad.cyl (
             d = CENTER_INNER_DIAMETER - center_slack, h = CENTER_INNER_DEPTH - BLADE_THICKNESS,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         +
-        cyl (
+        cad.cyl (
             d1 = CENTER_INNER_DIAMETER - center_slack,
             d2 = CENTER_INNER_DIAMETER - center_slack - 2 * BLADE_THICKNESS + 2 * EDGE_THICKNESS,
             h = BLADE_THICKNESS,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .up (CENTER_INNER_DEPTH - BLADE_THICKNESS)
         -
-        cyl (
+        cad.cyl (
             d = CENTER_INNER_DIAMETER - center_slack - 2 * BLADE_THICKNESS, h = CENTER_INNER_DEPTH + OVERLAP,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
     )
 
@@ -132,7 +133,7 @@ def _opener (center_slack, handle_hole_diameter):
     cutter = _tooth (CUTTER_RADIUS - BLADE_THICKNESS, CUTTER_RADIUS, CUTTER_DEPTH, EDGE_ANGLE, CUTTER_ANGLE)
 
     stripes = (
-        cuboid ([STRIPE_WIDTH, ARM_WIDTH + 2 * OVERLAP, STRIPE_THICKNESS + OVERLAP], anchor = BOTTOM)
+        cad.cuboid ([STRIPE_WIDTH, ARM_WIDTH + 2 * OVERLAP, STRIPE_THICKNESS + OVERLAP], anchor = cad.BOTTOM)
         .skew (sxy = 1)
         .xcopies (n = STRIPE_COUNT, spacing = 0 - STRIPE_WIDTH * 2, sp = [ARM_LENGTH + ARM_WIDTH / 2 - STRIPE_WIDTH * 3/2, 0, 0])
         .down (ARM_THICKNESS + OVERLAP)
@@ -142,6 +143,6 @@ def _opener (center_slack, handle_hole_diameter):
 
 
 for gap in range (1,12):
-    _opener (gap/10, 0).save_as_scad (f'opener-gap-{gap}.scad')
-    _opener (gap/10, 8).save_as_scad (f'opener-hole-8-gap-{gap}.scad')
-    _opener (gap/10, 11).save_as_scad (f'opener-hole-11-gap-{gap}.scad')
+    part (f'opener-gap-{gap}.scad', _opener, gap/10, 0)
+    part (f'opener-hole-8-gap-{gap}.scad', _opener, gap/10, 8)
+    part (f'opener-hole-11-gap-{gap}.scad', _opener, gap/10, 11)
@@ -5,6 +5,7 @@ import math as _math
 from solid2 import *
 
 from helpers.ivar import *
+from helpers.output import part
 
 
 set_global_fn (33)
@@ -119,8 +120,8 @@ def holder_double (shelf_height):
 
 # Main
 
-holder_single (SHELF_HEIGHT).save_as_scad ('holder_single.scad')
-holder_double (SHELF_HEIGHT).save_as_scad ('holder_double.scad')
+part ('holder_single.scad', holder_single, SHELF_HEIGHT)
+part ('holder_double.scad', holder_double, SHELF_HEIGHT)
 
-holder_single (15.5).save_as_scad ('holder_single_155.scad')
-holder_single (18.0).save_as_scad ('holder_single_180.scad')
+part ('holder_single_155.scad', holder_single, 15.5)
+part ('holder_single_180.scad', holder_single, 18.0)
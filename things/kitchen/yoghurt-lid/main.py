@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 
-from solid2 import *
-from solid2.extensions.bosl2 import *
+from components import cad
 
+from helpers.output import part
 
-set_global_fn (111)
+
+cad.set_global_fn (111)
 
 
 OVERLAP = 0.001
@@ -25,27 +26,27 @@ LAYER = 0.2
 def lid ():
 
     lid = (
-        cyl (
+        cad.cyl (
             h = LID_THICKNESS + CUP_THICKNESS + LID_OVERLAP,
             d = CUP_DIAMETER + CATCH_HEIGHT/2 + LID_THICKNESS*2,
             circum = True,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         ) -
-        cyl (
+        cad.cyl (
             h = CUP_THICKNESS + LID_OVERLAP + OVERLAP,
             d = CUP_DIAMETER + CATCH_HEIGHT/2,
             circum = True,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .up (LID_THICKNESS)
     )
 
     catch = (
-        prismoid (
+        cad.prismoid (
             size1 = (CATCH_WIDTH, CUP_THICKNESS + LID_OVERLAP),
             size2 = (CATCH_WIDTH, LAYER),
             height = CATCH_HEIGHT,
-            anchor = BOTTOM + FRONT,
+            anchor = cad.BOTTOM + cad.FRONT,
         )
         .rotate ((90, 0, 0))
         .up (LID_THICKNESS)
@@ -54,7 +55,7 @@ def lid ():
 
     catches = [ catch.rotate ((0, 0, step * 360 / CATCHES )) for step in range (CATCHES) ]
 
-    return lid + union () (*catches)
+    return lid + cad.union () (*catches)
 
 
-lid ().save_as_scad ('lid.scad')
+part ('lid.scad', lid)
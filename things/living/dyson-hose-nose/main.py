@@ -2,14 +2,14 @@
 
 import math as _math
 
-from solid2 import *
-from solid2.extensions.bosl2 import *
-from solid2.extensions.bosl2.threading import *
+from components import cad
 
 from components.common import *
+from helpers.output import part
 
 
-set_global_fn (111)
+cad.require ('threading')
+cad.set_global_fn (111)
 
 
 OVERLAP = 0.001
@@ -67,16 +67,16 @@ NOSE_BODY_HEIGHT = NOSE_BUTTON_OFFSET + NOSE_BUTTON_DIAMETER/2 + NOSE_BODY_RIM*2
 def hose_connector ():
 
     body = (
-        cyl (
+        cad.cyl (
             h = HOSE_THREAD_LENGTH + HOSE_THICKNESS,
             d = HOSE_OUTER_DIAMETER,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         -
-        cyl (
+        cad.cyl (
             h = HOSE_THICKNESS + OVERLAP*2,
             d = HOSE_INNER_DIAMETER,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .down (OVERLAP)
     )
@@ -95,7 +95,7 @@ def hose_connector ():
     )
 
     thread = (
-        generic_threaded_rod (
+        cad.generic_threaded_rod (
             h = HOSE_THREAD_LENGTH + OVERLAP,
             d1 = HOSE_THREAD_DIAMETER - HOSE_THREAD_SHRINK,
             d2 = HOSE_THREAD_DIAMETER,
@@ -105,7 +105,7 @@ def hose_connector ():
             bevel2 = True,
             blunt_start = False,
             left_handed = True,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .up (HOSE_THICKNESS + OVERLAP)
     )
@@ -118,16 +118,16 @@ def hose_connector ():
 def rotator_connector_upper ():
 
     body = (
-        cyl (d = HOSE_OUTER_DIAMETER, h = ROTATOR_CUFF_HEIGHT, anchor = BOTTOM)
+        cad.cyl (d = HOSE_OUTER_DIAMETER, h = ROTATOR_CUFF_HEIGHT, anchor = cad.BOTTOM)
         -
-        cyl (d = ROTATOR_MIDDLE_DIAMETER + ROTATOR_GAP, h = ROTATOR_CUFF_HEIGHT + OVERLAP*2, anchor = BOTTOM)
+        cad.cyl (d = ROTATOR_MIDDLE_DIAMETER + ROTATOR_GAP, h = ROTATOR_CUFF_HEIGHT + OVERLAP*2, anchor = cad.BOTTOM)
         .down (OVERLAP)
         -
-        cyl (
+        cad.cyl (
             d1 = ROTATOR_MIDDLE_DIAMETER + ROTATOR_NOTCH_DEPTH*2 + ROTATOR_GAP,
             d2 = ROTATOR_MIDDLE_DIAMETER + ROTATOR_GAP,
             h = ROTATOR_NOTCH_HEIGHT,
-            anchor = TOP,
+            anchor = cad.TOP,
         )
         .up (ROTATOR_CUFF_HEIGHT - ROTATOR_GAP)
     )
@@ -137,72 +137,72 @@ def rotator_connector_upper ():
 
 def rotator_connector_lower ():
 
-    body = cyl (d = ROTATOR_MIDDLE_DIAMETER - ROTATOR_GAP, h = ROTATOR_CUFF_HEIGHT, anchor = BOTTOM)
+    body = cad.cyl (d = ROTATOR_MIDDLE_DIAMETER - ROTATOR_GAP, h = ROTATOR_CUFF_HEIGHT, anchor = cad.BOTTOM)
 
     notch = (
         (
-            cyl (
+            cad.cyl (
                 d1 = ROTATOR_MIDDLE_DIAMETER + ROTATOR_NOTCH_DEPTH*2 - ROTATOR_GAP,
                 d2 = ROTATOR_MIDDLE_DIAMETER - ROTATOR_GAP,
                 h = ROTATOR_NOTCH_HEIGHT,
-                anchor = BOTTOM,
+                anchor = cad.BOTTOM,
             )
             *
-            cuboid (
+            cad.cuboid (
                 [ROTATOR_NOTCH_WIDTH, ROTATOR_MIDDLE_DIAMETER/2 + ROTATOR_NOTCH_DEPTH, ROTATOR_NOTCH_HEIGHT],
-                anchor = BACK + BOTTOM,
+                anchor = cad.BACK + cad.BOTTOM,
             )
         )
         .up (ROTATOR_CUFF_HEIGHT - ROTATOR_NOTCH_HEIGHT)
     )
 
     notch_list = [ notch.rotate (0, 0, index * 360 / ROTATOR_NOTCH_COUNT) for index in range (ROTATOR_NOTCH_COUNT) ]
-    body += union () (*notch_list)
+    body += cad.union () (*notch_list)
 
     cut = (
         (
-            cuboid (
+            cad.cuboid (
                 [ROTATOR_NOTCH_WIDTH + ROTATOR_NOTCH_GAP*2, ROTATOR_MIDDLE_DIAMETER/2 + ROTATOR_NOTCH_DEPTH, ROTATOR_CUFF_HEIGHT - ROTATOR_CUFF_RIM + OVERLAP],
-                anchor = BACK + BOTTOM,
+                anchor = cad.BACK + cad.BOTTOM,
             )
             -
-            cuboid (
+            cad.cuboid (
                 [ROTATOR_NOTCH_WIDTH, ROTATOR_MIDDLE_DIAMETER/2 + ROTATOR_NOTCH_DEPTH + OVERLAP, ROTATOR_CUFF_HEIGHT - ROTATOR_CUFF_RIM + OVERLAP*2],
-                anchor = BACK + BOTTOM,
+                anchor = cad.BACK + cad.BOTTOM,
             )
         )
         .up (ROTATOR_CUFF_RIM)
     )
 
     cut_list = [ cut.rotate (0, 0, index * 360 / ROTATOR_NOTCH_COUNT) for index in range (ROTATOR_NOTCH_COUNT) ]
-    body -= union () (*cut_list)
+    body -= cad.union () (*cut_list)
 
-    body -= cyl (d = HOSE_INNER_DIAMETER, h = ROTATOR_CUFF_HEIGHT + OVERLAP*2, anchor = BOTTOM).down (OVERLAP)
+    body -= cad.cyl (d = HOSE_INNER_DIAMETER, h = ROTATOR_CUFF_HEIGHT + OVERLAP*2, anchor = cad.BOTTOM).down (OVERLAP)
 
     return body
 
 
 def nose_connector ():
 
-    body = cyl (h = NOSE_BODY_HEIGHT, d = NOSE_OUTER_DIAMETER, anchor = BOTTOM)
+    body = cad.cyl (h = NOSE_BODY_HEIGHT, d = NOSE_OUTER_DIAMETER, anchor = cad.BOTTOM)
 
     cut = (
         (
-            cuboid ([NOSE_BUTTON_DIAMETER + NOSE_CUT_GAP*2, NOSE_OUTER_DIAMETER, NOSE_BUTTON_OFFSET - NOSE_BODY_RIM], anchor = BACK + BOTTOM)
+            cad.cuboid ([NOSE_BUTTON_DIAMETER + NOSE_CUT_GAP*2, NOSE_OUTER_DIAMETER, NOSE_BUTTON_OFFSET - NOSE_BODY_RIM], anchor = cad.BACK + cad.BOTTOM)
             -
-            cuboid ([NOSE_BUTTON_DIAMETER, NOSE_OUTER_DIAMETER + OVERLAP*2, NOSE_BUTTON_OFFSET - NOSE_BODY_RIM + OVERLAP*2], anchor = BACK + BOTTOM)
+            cad.cuboid ([NOSE_BUTTON_DIAMETER, NOSE_OUTER_DIAMETER + OVERLAP*2, NOSE_BUTTON_OFFSET - NOSE_BODY_RIM + OVERLAP*2], anchor = cad.BACK + cad.BOTTOM)
             .down (OVERLAP)
             .back (OVERLAP)
         )
         .up (NOSE_BODY_RIM)
         +
         (
-            cyl (d = NOSE_BUTTON_DIAMETER + NOSE_CUT_GAP*2, h = NOSE_OUTER_DIAMETER, anchor = BOTTOM, orient = FWD, circum = True, spin = 30, _fn = 6)
+            cad.cyl (d = NOSE_BUTTON_DIAMETER + NOSE_CUT_GAP*2, h = NOSE_OUTER_DIAMETER, anchor = cad.BOTTOM, orient = cad.FWD, circum = True, spin = 30, _fn = 6)
             -
-            cyl (d = NOSE_BUTTON_DIAMETER, h = NOSE_OUTER_DIAMETER + OVERLAP*2, anchor = BOTTOM, orient = FWD, circum = True, spin = 30, _fn = 6)
+            cad.cyl (d = NOSE_BUTTON_DIAMETER, h = NOSE_OUTER_DIAMETER + OVERLAP*2, anchor = cad.BOTTOM, orient = cad.FWD, circum = True, spin = 30, _fn = 6)
             .back (OVERLAP)
             -
-            cuboid ([NOSE_OUTER_DIAMETER, NOSE_OUTER_DIAMETER, NOSE_OUTER_DIAMETER], anchor = BACK + TOP)
+            cad.cuboid ([NOSE_OUTER_DIAMETER, NOSE_OUTER_DIAMETER, NOSE_OUTER_DIAMETER], anchor = cad.BACK + cad.TOP)
             .down (OVERLAP)
         )
         .up (NOSE_BUTTON_OFFSET)
@@ -212,8 +212,8 @@ def nose_connector ():
 
     button = (
         (
-            cyl (d = NOSE_BUTTON_DIAMETER, h = NOSE_OUTER_DIAMETER/2 + NOSE_BUTTON_HEIGHT, anchor = BOTTOM, orient = FWD)
-            * cyl (d = NOSE_OUTER_DIAMETER + NOSE_BUTTON_HEIGHT, h = NOSE_BODY_HEIGHT)
+            cad.cyl (d = NOSE_BUTTON_DIAMETER, h = NOSE_OUTER_DIAMETER/2 + NOSE_BUTTON_HEIGHT, anchor = cad.BOTTOM, orient = cad.FWD)
+            * cad.cyl (d = NOSE_OUTER_DIAMETER + NOSE_BUTTON_HEIGHT, h = NOSE_BODY_HEIGHT)
         )
         .up (NOSE_BUTTON_OFFSET)
     )
@@ -222,8 +222,8 @@ def nose_connector ():
 
     notch = (
         (
-            cyl (d = NOSE_NOTCH_DIAMETER, h = NOSE_OUTER_DIAMETER/2 + NOSE_NOTCH_HEIGHT, anchor = BOTTOM, orient = FWD)
-            * cyl (d = NOSE_OUTER_DIAMETER + NOSE_NOTCH_HEIGHT, h = NOSE_BODY_HEIGHT)
+            cad.cyl (d = NOSE_NOTCH_DIAMETER, h = NOSE_OUTER_DIAMETER/2 + NOSE_NOTCH_HEIGHT, anchor = cad.BOTTOM, orient = cad.FWD)
+            * cad.cyl (d = NOSE_OUTER_DIAMETER + NOSE_NOTCH_HEIGHT, h = NOSE_BODY_HEIGHT)
         )
         .skew (syz = -NOSE_NOTCH_HEIGHT/NOSE_NOTCH_DIAMETER)
         .up (NOSE_NOTCH_OFFSET)
@@ -232,18 +232,18 @@ def nose_connector ():
     body += notch
 
     rail = (
-        cuboid (
+        cad.cuboid (
             [NOSE_RAILS_WIDTH, NOSE_OUTER_DIAMETER/2 + NOSE_RAILS_HEIGHT, NOSE_RAILS_LENGTH],
             rounding = NOSE_RAILS_WIDTH/2,
-            edges = [ FRONT, TOP+LEFT, BOTTOM+LEFT, TOP+RIGHT, BOTTOM+RIGHT ],
-            anchor = BACK + BOTTOM,
+            edges = [ cad.FRONT, cad.TOP+cad.LEFT, cad.BOTTOM+cad.LEFT, cad.TOP+cad.RIGHT, cad.BOTTOM+cad.RIGHT ],
+            anchor = cad.BACK + cad.BOTTOM,
         )
         .up (NOSE_RAILS_OFFSET)
     )
 
     body += rail.rotateZ (+90) + rail.rotateZ (-90)
 
-    body -= cyl (h = NOSE_BODY_HEIGHT + OVERLAP*2, d = NOSE_INNER_DIAMETER, anchor = BOTTOM).down (OVERLAP)
+    body -= cad.cyl (h = NOSE_BODY_HEIGHT + OVERLAP*2, d = NOSE_INNER_DIAMETER, anchor = cad.BOTTOM).down (OVERLAP)
 
     central_sink_depth = NOSE_NOTCH_HEIGHT * (NOSE_BUTTON_OFFSET + NOSE_BUTTON_DIAMETER/2 / _math.cos (_math.pi / 6) - NOSE_BODY_RIM) / (NOSE_NOTCH_OFFSET + NOSE_NOTCH_DIAMETER/2 - NOSE_BODY_RIM)
     rounded_sink_depth = NOSE_OUTER_DIAMETER/2 - _math.sqrt (NOSE_OUTER_DIAMETER**2/4 - NOSE_BUTTON_DIAMETER**2/4)
@@ -251,25 +251,25 @@ def nose_connector ():
 
     block = (
         (
-            cuboid (
+            cad.cuboid (
                 [ NOSE_OUTER_DIAMETER, total_sink_depth + NOSE_BLOCK_THICKNESS, NOSE_BODY_HEIGHT ],
                 chamfer = total_sink_depth,
-                edges = [ TOP + BACK ],
-                anchor = FRONT + BOTTOM,
+                edges = [ cad.TOP + cad.BACK ],
+                anchor = cad.FRONT + cad.BOTTOM,
             )
             .fwd (NOSE_OUTER_DIAMETER/2)
             -
-            cuboid (
+            cad.cuboid (
                 [ NOSE_OUTER_DIAMETER, total_sink_depth, NOSE_BODY_HEIGHT - NOSE_BLOCK_THICKNESS * (1 + _math.sqrt (2)) ],
                 chamfer = total_sink_depth,
-                edges = [ TOP + BACK ],
-                anchor = FRONT + BOTTOM,
+                edges = [ cad.TOP + cad.BACK ],
+                anchor = cad.FRONT + cad.BOTTOM,
             )
             .fwd (NOSE_OUTER_DIAMETER/2)
             .up (NOSE_BLOCK_THICKNESS)
         )
         *
-        cyl (h = NOSE_BODY_HEIGHT, d = NOSE_OUTER_DIAMETER, anchor = BOTTOM)
+        cad.cyl (h = NOSE_BODY_HEIGHT, d = NOSE_OUTER_DIAMETER, anchor = cad.BOTTOM)
     )
 
     body += block
@@ -294,9 +294,9 @@ def combo_hose_nose_lower ():
 
     joint_height = max (HOSE_OUTER_DIAMETER - NOSE_OUTER_DIAMETER, HOSE_INNER_DIAMETER - NOSE_INNER_DIAMETER) / 2
     joint = (
-        cyl (d1 = NOSE_OUTER_DIAMETER, d2 = HOSE_OUTER_DIAMETER, h = joint_height, anchor = BOTTOM)
+        cad.cyl (d1 = NOSE_OUTER_DIAMETER, d2 = HOSE_OUTER_DIAMETER, h = joint_height, anchor = cad.BOTTOM)
         -
-        cyl (d1 = NOSE_INNER_DIAMETER, d2 = HOSE_INNER_DIAMETER, h = joint_height + OVERLAP*2, anchor = BOTTOM)
+        cad.cyl (d1 = NOSE_INNER_DIAMETER, d2 = HOSE_INNER_DIAMETER, h = joint_height + OVERLAP*2, anchor = cad.BOTTOM)
         .down (OVERLAP)
     )
 
@@ -305,5 +305,5 @@ def combo_hose_nose_lower ():
     return combo
 
 
-combo_hose_nose_upper ().save_as_scad ('hose_nose_upper.scad')
-combo_hose_nose_lower ().save_as_scad ('hose_nose_lower.scad')
+part ('hose_nose_upper.scad', combo_hose_nose_upper)
+part ('hose_nose_lower.scad', combo_hose_nose_lower)
@@ -2,11 +2,12 @@
 
 import math as _math
 
-from solid2 import *
-from solid2.extensions.bosl2 import *
+from components import cad
 
+from helpers.output import part
 
-set_global_fn (111)
+
+cad.set_global_fn (111)
 
 
 OVERLAP = 0.008
@@ -44,39 +45,39 @@ def holder (leg_small_shift):
     LEG_LARGE_ANGLE = 360 * LEG_LARGE_POSITION / WHOLE_CIRCUMFERENCE
 
     ring = (
-        cyl (
+        cad.cyl (
             d = RADIO_DIAMETER + 2 * RING_THICKNESS,
             h = RING_WIDTH,
             chamfer = RING_THICKNESS / 2,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         -
-        cyl (
+        cad.cyl (
             d = RADIO_DIAMETER,
             h = RING_WIDTH + 2 * OVERLAP,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .down (OVERLAP)
     )
 
     wedge = (
-        pie_slice (
+        cad.pie_slice (
             d = RADIO_DIAMETER + 2 * RING_THICKNESS + 2 * OVERLAP,
             h = RING_WIDTH + 2 * OVERLAP,
             ang = WEDGE_ANGLE,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .down (OVERLAP)
         .zrot (0 - SCREEN_ANGLE)
         +
-        cube (RING_WIDTH + 2 * OVERLAP, anchor = LEFT + FRONT + BOTTOM)
+        cad.cube (RING_WIDTH + 2 * OVERLAP, anchor = cad.LEFT + cad.FRONT + cad.BOTTOM)
         .down (OVERLAP)
         .fwd (RING_THICKNESS)
         .zrot (45)
         .right (RADIO_DIAMETER / 2 + RING_THICKNESS / 2)
         .zrot (0 - SCREEN_ANGLE)
         +
-        cube (RING_WIDTH + 2 * OVERLAP, anchor = RIGHT + FRONT + BOTTOM)
+        cad.cube (RING_WIDTH + 2 * OVERLAP, anchor = cad.RIGHT + cad.FRONT + cad.BOTTOM)
         .down (OVERLAP)
         .fwd (RING_THICKNESS)
         .zrot (0 - 45)
@@ -85,45 +86,45 @@ def holder (leg_small_shift):
     )
 
     leg_small_hole = (
-        xcyl (
+        cad.xcyl (
             d = LEG_SMALL_DIAMETER,
             h = RADIO_DIAMETER / 2 + LEG_SMALL_HEIGHT,
-            anchor = LEFT,
+            anchor = cad.LEFT,
         )
         .up (RING_WIDTH / 2 + leg_small_shift)
         .zrot (0 - LEG_SMALL_ANGLE)
     )
 
     leg_large_hole = (
-        xcyl (
+        cad.xcyl (
             d = LEG_LARGE_DIAMETER,
             h = RADIO_DIAMETER / 2 + LEG_LARGE_HEIGHT,
-            anchor = LEFT,
+            anchor = cad.LEFT,
         )
         .up (RING_WIDTH / 2)
         .zrot (0 - LEG_LARGE_ANGLE)
     )
 
     clasp = (
-        cuboid (
+        cad.cuboid (
             [2 * CLASP_THICKNESS + CLASP_LENGTH, CLASP_WIDTH + 2 * CLASP_THICKNESS, RING_WIDTH],
             chamfer = RING_THICKNESS / 2,
-            _except = LEFT,
-            anchor = LEFT + BOTTOM,
+            _except = cad.LEFT,
+            anchor = cad.LEFT + cad.BOTTOM,
         )
         .right (RADIO_DIAMETER / 2 - CLASP_THICKNESS)
         -
-        cuboid (
+        cad.cuboid (
             [CLASP_LENGTH + OVERLAP, CLASP_WIDTH, RING_WIDTH + 2 * OVERLAP],
-            anchor = LEFT + BOTTOM,
+            anchor = cad.LEFT + cad.BOTTOM,
         )
         .down (OVERLAP)
         .right (RADIO_DIAMETER / 2 + CLASP_THICKNESS)
         -
-        cyl (
+        cad.cyl (
             d = RADIO_DIAMETER,
             h = RING_WIDTH + 2 * OVERLAP,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .down (OVERLAP)
     )
@@ -131,5 +132,5 @@ def holder (leg_small_shift):
     return ring - wedge + clasp - leg_small_hole - leg_large_hole
 
 
-holder (LEG_SMALL_SHIFT_ONE).save_as_scad ('holder_one.scad')
-holder (LEG_SMALL_SHIFT_TWO).save_as_scad ('holder_two.scad')
+part ('holder_one.scad', holder, LEG_SMALL_SHIFT_ONE)
+part ('holder_two.scad', holder, LEG_SMALL_SHIFT_TWO)
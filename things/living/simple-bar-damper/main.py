@@ -2,11 +2,12 @@
 
 import math as _math
 
-from solid2 import *
-from solid2.extensions.bosl2 import *
+from components import cad
 
+from helpers.output import part
 
-set_global_fn (111)
+
+cad.set_global_fn (111)
 
 
 OVERLAP = 0.01
@@ -31,63 +32,63 @@ LOWER_THICKNESS = 3.5
 def damper (width, length, chamfer, diameter, thickness):
 
     arc = (
-        cyl (
+        cad.cyl (
             h = width + DAMPER_THICKNESS_NORMAL * 2,
             d = diameter,
-            anchor = CENTER,
+            anchor = cad.CENTER,
         )
         -
-        cyl (
+        cad.cyl (
             h = width + DAMPER_THICKNESS_NORMAL * 2 + OVERLAP * 2,
             d = diameter - DAMPER_THICKNESS_STRONG * 2,
-            anchor = CENTER,
+            anchor = cad.CENTER,
         )
         .down (OVERLAP)
         -
-        cuboid (
+        cad.cuboid (
             [
                 diameter,
                 diameter,
                 width + DAMPER_THICKNESS_NORMAL * 2 + OVERLAP * 2
             ],
-            edges = [ BACK + LEFT, BACK + RIGHT ],
-            anchor = BACK,
+            edges = [ cad.BACK + cad.LEFT, cad.BACK + cad.RIGHT ],
+            anchor = cad.BACK,
         )
         .fwd (DAMPER_THICKNESS_STRONG - DAMPER_THICKNESS_NORMAL)
         .down (OVERLAP)
         -
-        cuboid (
+        cad.cuboid (
             [
                 diameter - DAMPER_THICKNESS_STRONG * 2 + DAMPER_THICKNESS_NORMAL * 2,
                 diameter,
                 width + DAMPER_THICKNESS_NORMAL * 2 + OVERLAP * 2
             ],
-            edges = [ BACK + LEFT, BACK + RIGHT ],
+            edges = [ cad.BACK + cad.LEFT, cad.BACK + cad.RIGHT ],
             chamfer = DAMPER_THICKNESS_STRONG - DAMPER_THICKNESS_NORMAL,
-            anchor = BACK,
+            anchor = cad.BACK,
         )
         .down (OVERLAP)
     )
 
     leg = (
-        cuboid (
+        cad.cuboid (
             [
                 thickness + DAMPER_THICKNESS_NORMAL * 2,
                 length,
                 width + DAMPER_THICKNESS_NORMAL * 2
             ],
-            anchor = BACK,
+            anchor = cad.BACK,
         )
         -
-        cuboid (
+        cad.cuboid (
             [
                 thickness,
                 length + OVERLAP * 2,
                 width
             ],
-            _except = [ FRONT, BACK ],
+            _except = [ cad.FRONT, cad.BACK ],
             chamfer = chamfer,
-            anchor = BACK,
+            anchor = cad.BACK,
         )
         .back (OVERLAP)
     )
@@ -100,5 +101,5 @@ def damper (width, length, chamfer, diameter, thickness):
     return body
 
 
-damper (UPPER_WIDTH, UPPER_LENGTH, UPPER_CHAMFER, UPPER_DIAMETER, UPPER_THICKNESS).save_as_scad ('upper.scad')
-damper (LOWER_WIDTH, LOWER_LENGTH, LOWER_CHAMFER, LOWER_DIAMETER, LOWER_THICKNESS).save_as_scad ('lower.scad')
+part ('upper.scad', damper, UPPER_WIDTH, UPPER_LENGTH, UPPER_CHAMFER, UPPER_DIAMETER, UPPER_THICKNESS)
+part ('lower.scad', damper, LOWER_WIDTH, LOWER_LENGTH, LOWER_CHAMFER, LOWER_DIAMETER, LOWER_THICKNESS)
@@ -2,10 +2,10 @@
 
 import math as _math
 
-from solid import *
-from solid.utils import *
+from components import nodes
 
 from components.common import *
+from helpers.output import part
 
 
 SEGMENTS = 33
@@ -58,7 +58,7 @@ def get_rounded_stand_dimension (dimension):
 
 def do_tile_pattern (rows, columns):
 
-    tile_ini = polyhedron (
+    tile_ini = nodes.polyhedron (
         points = [
             # Bottom layer.
             (0, 0, 0), (TILE_WIDTH_PIN, 0, 0), (TILE_WIDTH_PIN, TILE_HEIGHT_PIN, 0), (0, TILE_HEIGHT_PIN, 0),
@@ -75,17 +75,18 @@ def do_tile_pattern (rows, columns):
             (0, 4, 5, 1), (1, 5, 6, 2), (2, 6, 7, 3), (3, 7, 4, 0),
             # Top.
             (4, 7, 6, 5),
-        ])
+        ],
+        convexity = 10)
 
-    rib = translate ((0, TILE_HEIGHT_PIN / 2, TILE_DEPTH)) (sphere (TILE_DIP_RADIUS))
-    dip = translate ((0, TILE_HEIGHT_PIN / 2, TILE_PIN_RADIUS + TILE_SLACK)) (sphere (TILE_DIP_RADIUS))
-    pin = translate ((TILE_WIDTH_PIN, TILE_HEIGHT_PIN / 2, TILE_DEPTH - TILE_PIN_RADIUS)) (sphere (TILE_PIN_RADIUS))
+    rib = nodes.translate ((0, TILE_HEIGHT_PIN / 2, TILE_DEPTH)) (nodes.sphere (r = TILE_DIP_RADIUS))
+    dip = nodes.translate ((0, TILE_HEIGHT_PIN / 2, TILE_PIN_RADIUS + TILE_SLACK)) (nodes.sphere (r = TILE_DIP_RADIUS))
+    pin = nodes.translate ((TILE_WIDTH_PIN, TILE_HEIGHT_PIN / 2, TILE_DEPTH - TILE_PIN_RADIUS)) (nodes.sphere (r = TILE_PIN_RADIUS))
 
     tile_dip = tile_ini - rib - dip
     tile_pin = tile_ini + pin
 
-    tile_dip = translate ((TILE_SLACK, TILE_SLACK, 0)) (tile_dip)
-    tile_pin = translate ((TILE_SLACK + TILE_WIDTH_PIN + TILE_WIDTH_GAP, TILE_SLACK, 0)) (tile_pin)
+    tile_dip = nodes.translate ((TILE_SLACK, TILE_SLACK, 0)) (tile_dip)
+    tile_pin = nodes.translate ((TILE_SLACK + TILE_WIDTH_PIN + TILE_WIDTH_GAP, TILE_SLACK, 0)) (tile_pin)
 
     tile = tile_dip + tile_pin
 
@@ -94,9 +95,9 @@ def do_tile_pattern (rows, columns):
     for row in range (rows):
         for column in range (columns):
             if (row + column) % 2 == 0:
-                tiles.append (translate ((column * TILE_WIDTH, row * TILE_HEIGHT_ALL, 0)) (tile))
+                tiles.append (nodes.translate ((column * TILE_WIDTH, row * TILE_HEIGHT_ALL, 0)) (tile))
 
-    return union () (*tiles)
+    return nodes.union () (*tiles)
 
 
 # Stand
@@ -109,16 +110,16 @@ def do_stand (rows, columns, radius, width, height):
     step_horizontal = gap_horizontal + radius * 2
     step_vertical = gap_vertical + radius * 2
 
-    stand = cube ((width, height, STAND_HEIGHT))
+    stand = nodes.cube (size = (width, height, STAND_HEIGHT))
 
-    drill = cylinder (radius, STAND_HEIGHT)
-    drill = translate ((0, 0, STAND_FLOOR_THICKNESS)) (drill)
-    drill += cylinder (radius * STAND_FLOOR_RATIO, STAND_HEIGHT)
-    drill = translate ((gap_horizontal + radius, gap_vertical + radius, 0 - OVERLAP)) (drill)
+    drill = nodes.cylinder (r = radius, h = STAND_HEIGHT)
+    drill = nodes.translate ((0, 0, STAND_FLOOR_THICKNESS)) (drill)
+    drill += nodes.cylinder (r = radius * STAND_FLOOR_RATIO, h = STAND_HEIGHT)
+    drill = nodes.translate ((gap_horizontal + radius, gap_vertical + radius, 0 - OVERLAP)) (drill)
 
     for row in range (rows):
         for column in range (columns):
-            stand -= translate ((step_horizontal * column, step_vertical * row, 0)) (drill)
+            stand -= nodes.translate ((step_horizontal * column, step_vertical * row, 0)) (drill)
 
     pattern_columns_ew = _math.floor (height / TILE_WIDTH / 2) * 2
     pattern_offset_ew = (height - pattern_columns_ew * TILE_WIDTH) / 2
@@ -129,10 +130,10 @@ def do_stand (rows, columns, radius, width, height):
     pattern_ew = do_tile_pattern (STAND_PATTERN_ROWS, pattern_columns_ew)
     pattern_ns = do_tile_pattern (STAND_PATTERN_ROWS, pattern_columns_ns)
 
-    pattern_s = translate ((pattern_offset_ns, 0, STAND_PATTERN_OFFSET)) (rotate ((90, 0, 0)) (pattern_ns))
-    pattern_e = translate ((width, pattern_offset_ew, STAND_PATTERN_OFFSET)) (rotate ((90, 0, 90)) (pattern_ew))
-    pattern_n = translate ((width - pattern_offset_ns, height, STAND_PATTERN_OFFSET)) (rotate ((90, 0, 180)) (pattern_ns))
-    pattern_w = translate ((0, height - pattern_offset_ew, STAND_PATTERN_OFFSET)) (rotate ((90, 0, 270)) (pattern_ew))
+    pattern_s = nodes.translate ((pattern_offset_ns, 0, STAND_PATTERN_OFFSET)) (nodes.rotate ((90, 0, 0)) (pattern_ns))
+    pattern_e = nodes.translate ((width, pattern_offset_ew, STAND_PATTERN_OFFSET)) (nodes.rotate ((90, 0, 90)) (pattern_ew))
+    pattern_n = nodes.translate ((width - pattern_offset_ns, height, STAND_PATTERN_OFFSET)) (nodes.rotate ((90, 0, 180)) (pattern_ns))
+    pattern_w = nodes.translate ((0, height - pattern_offset_ew, STAND_PATTERN_OFFSET)) (nodes.rotate ((90, 0, 270)) (pattern_ew))
 
     stand += pattern_s + pattern_e + pattern_n + pattern_w
 
@@ -145,7 +146,7 @@ DIM_SQUARE = get_rounded_stand_dimension (62)
 DIM_LONG_WIDTH = get_rounded_stand_dimension (125)
 DIM_LONG_HEIGHT = get_rounded_stand_dimension (22)
 
-scad_render_to_file (do_stand (4, 4, 15/2, DIM_SQUARE, DIM_SQUARE), 'stand-square-aa.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (do_stand (5, 5, 11/2, DIM_SQUARE, DIM_SQUARE), 'stand-square-aaa.scad', file_header = f'$fn = {SEGMENTS};')
+part ('stand-square-aa.scad', do_stand, 4, 4, 15/2, DIM_SQUARE, DIM_SQUARE, file_header = f'$fn = {SEGMENTS};')
+part ('stand-square-aaa.scad', do_stand, 5, 5, 11/2, DIM_SQUARE, DIM_SQUARE, file_header = f'$fn = {SEGMENTS};')
 
-scad_render_to_file (do_stand (2, 10, 11/2, DIM_LONG_WIDTH, DIM_LONG_HEIGHT), 'stand-long-aaa.scad', file_header = f'$fn = {SEGMENTS};')
+part ('stand-long-aaa.scad', do_stand, 2, 10, 11/2, DIM_LONG_WIDTH, DIM_LONG_HEIGHT, file_header = f'$fn = {SEGMENTS};')
@@ -2,8 +2,9 @@
 
 import math
 
-from solid import *
-from solid.utils import *
+from components import cad_legacy as cad
+
+from helpers.output import part
 
 
 SEGMENTS = 33
@@ -41,11 +42,11 @@ EMBOSSING_SLACK = 1
 def mesh (width, length, spacing, thickness, height):
     width_in_cells = round (width / spacing)
     length_in_cells = round (length / spacing)
-    zig = back (thickness/2) (cube ([width_in_cells * spacing, thickness, height]))
-    zag = left (thickness/2) (cube ([thickness, length_in_cells * spacing, height]))
-    zigs = [ forward (step * spacing) (zig) for step in range (width_in_cells + 1) ]
-    zags = [ right (step * spacing) (zag) for step in range (length_in_cells + 1) ]
-    return left (width_in_cells * spacing / 2) (back (length_in_cells * spacing / 2) (union () (*zigs, *zags)))
+    zig = cad.back (thickness/2) (cad.cube ([width_in_cells * spacing, thickness, height]))
+    zag = cad.left (thickness/2) (cad.cube ([thickness, length_in_cells * spacing, height]))
+    zigs = [ cad.forward (step * spacing) (zig) for step in range (width_in_cells + 1) ]
+    zags = [ cad.right (step * spacing) (zag) for step in range (length_in_cells + 1) ]
+    return cad.left (width_in_cells * spacing / 2) (cad.back (length_in_cells * spacing / 2) (cad.union () (*zigs, *zags)))
 
 
 def spiral (radius, width, height, threads, direction, offset):
@@ -54,20 +55,20 @@ def spiral (radius, width, height, threads, direction, offset):
     revolutions = height / circumference / math.tan (SPIRAL_SLOPE * math.pi / 180)
     # Generate spiral.
     step = 360 / threads
-    beams = [ rotate ([0, 0, step * thread + offset]) (square ([radius * 2, width], center = True)) for thread in range (threads) ]
-    footprint = union () (*beams)
-    result = linear_extrude (height, convexity = 8, twist = math.copysign (360 * revolutions, direction), slices = height * 3) (footprint)
+    beams = [ cad.rotate ([0, 0, step * thread + offset]) (cad.square ([radius * 2, width], center = True)) for thread in range (threads) ]
+    footprint = cad.union () (*beams)
+    result = cad.linear_extrude (height, convexity = 8, twist = math.copysign (360 * revolutions, direction), slices = height * 3) (footprint)
     # Whatever.
     return result    
 
 
 def cube_rounded_edges (size, radius):
-    edge = cylinder (r = radius, h = size [Z])
-    lf =  left (size [X]/2 - radius) (forward (size [Y]/2 - radius) (edge))
-    lb =  left (size [X]/2 - radius) (   back (size [Y]/2 - radius) (edge))
-    rf = right (size [X]/2 - radius) (forward (size [Y]/2 - radius) (edge))
-    rb = right (size [X]/2 - radius) (   back (size [Y]/2 - radius) (edge))
-    return hull () (lf, lb, rf, rb)
+    edge = cad.cylinder (r = radius, h = size [Z])
+    lf =  cad.left (size [X]/2 - radius) (cad.forward (size [Y]/2 - radius) (edge))
+    lb =  cad.left (size [X]/2 - radius) (   cad.back (size [Y]/2 - radius) (edge))
+    rf = cad.right (size [X]/2 - radius) (cad.forward (size [Y]/2 - radius) (edge))
+    rb = cad.right (size [X]/2 - radius) (   cad.back (size [Y]/2 - radius) (edge))
+    return cad.hull () (lf, lb, rf, rb)
 
 
 def cup ():
@@ -75,12 +76,12 @@ def cup ():
     base = cube_rounded_edges ([CUP_BASE, CUP_BASE, CUP_FLOOR_THICKNESS], CUP_EDGE_RADIUS)
 
     tube_outer = cube_rounded_edges ([CUP_BASE, CUP_BASE, CUP_HEIGHT], CUP_EDGE_RADIUS)
-    tube_inner = down (OVERLAP) (cube_rounded_edges ([CUP_BASE - 2*CUP_WALL_THICKNESS, CUP_BASE - 2*CUP_WALL_THICKNESS, CUP_HEIGHT + 2*OVERLAP], CUP_EDGE_RADIUS-CUP_WALL_THICKNESS))
-    tube = difference () (tube_outer, tube_inner)
+    tube_inner = cad.down (OVERLAP) (cube_rounded_edges ([CUP_BASE - 2*CUP_WALL_THICKNESS, CUP_BASE - 2*CUP_WALL_THICKNESS, CUP_HEIGHT + 2*OVERLAP], CUP_EDGE_RADIUS-CUP_WALL_THICKNESS))
+    tube = cad.difference () (tube_outer, tube_inner)
 
     lid_outer = cube_rounded_edges ([CUP_BASE, CUP_BASE, CUP_FLOOR_THICKNESS], CUP_EDGE_RADIUS)
-    lid_inner = down (OVERLAP) (cube_rounded_edges ([CUP_BASE - 2*CUP_WALL_THICKNESS, CUP_BASE - 2*CUP_WALL_THICKNESS, CUP_FLOOR_THICKNESS + 2*OVERLAP], CUP_EDGE_RADIUS-CUP_WALL_THICKNESS))
-    lid = up (CUP_HEIGHT - CUP_FLOOR_THICKNESS) (difference () (lid_outer, lid_inner))
+    lid_inner = cad.down (OVERLAP) (cube_rounded_edges ([CUP_BASE - 2*CUP_WALL_THICKNESS, CUP_BASE - 2*CUP_WALL_THICKNESS, CUP_FLOOR_THICKNESS + 2*OVERLAP], CUP_EDGE_RADIUS-CUP_WALL_THICKNESS))
+    lid = cad.up (CUP_HEIGHT - CUP_FLOOR_THICKNESS) (cad.difference () (lid_outer, lid_inner))
 
     # Compute offsets so that the spirals are
     # at maximum phase distance just below the lid
@@ -92,12 +93,12 @@ def cup ():
 
     pattern_l = spiral (CUP_BASE, CUP_WALL_THICKNESS/2, CUP_HEIGHT, SPIRAL_WINGS, +1, offset)
     pattern_r = spiral (CUP_BASE, CUP_WALL_THICKNESS/2, CUP_HEIGHT, SPIRAL_WINGS, -1, -offset)
-    pattern = union () (pattern_l, pattern_r)
+    pattern = cad.union () (pattern_l, pattern_r)
     tube *= pattern
 
-    logo = translate ([0, CUP_BASE/2 + 1/2, CUP_HEIGHT*3/5]) (rotate ([90, 0, 0]) (scale (3) (linear_extrude (1/3) (import_dxf ('logo.dxf')))))
+    logo = cad.translate ([0, CUP_BASE/2 + 1/2, CUP_HEIGHT*3/5]) (cad.rotate ([90, 0, 0]) (cad.scale (3) (cad.linear_extrude (1/3) (cad.import_dxf ('logo.dxf')))))
 
-    return union () (base, tube, logo, lid)
+    return cad.union () (base, tube, logo, lid)
 
 
 def box (rows, cols):
@@ -110,32 +111,32 @@ def box (rows, cols):
 
     base = cube_rounded_edges ([total_width, total_height, BOX_FLOOR_THICKNESS], BOX_EDGE_RADIUS)
 
-    pattern = rotate ([0, 0, 45]) (mesh (pattern_size, pattern_size, MESH_SPACING, MESH_WALL_THICKNESS, BOX_FLOOR_THICKNESS))
+    pattern = cad.rotate ([0, 0, 45]) (mesh (pattern_size, pattern_size, MESH_SPACING, MESH_WALL_THICKNESS, BOX_FLOOR_THICKNESS))
     base *= pattern
 
     wall_outer = cube_rounded_edges ([total_width, total_height, BOX_HEIGHT], BOX_EDGE_RADIUS)
-    wall_inner = down (OVERLAP) (cube_rounded_edges ([total_width - 2*BOX_WALL_THICKNESS, total_height - 2*BOX_WALL_THICKNESS, BOX_HEIGHT + 2*OVERLAP], BOX_EDGE_RADIUS-BOX_WALL_THICKNESS))
-    wall = difference () (wall_outer, wall_inner)
+    wall_inner = cad.down (OVERLAP) (cube_rounded_edges ([total_width - 2*BOX_WALL_THICKNESS, total_height - 2*BOX_WALL_THICKNESS, BOX_HEIGHT + 2*OVERLAP], BOX_EDGE_RADIUS-BOX_WALL_THICKNESS))
+    wall = cad.difference () (wall_outer, wall_inner)
 
-    spacer = up (BOX_HEIGHT/2) (right (total_width/2 - BOX_SLOT - BOX_WALL_THICKNESS*3/2) (cube ([BOX_WALL_THICKNESS, total_height, BOX_HEIGHT], center = True)))
+    spacer = cad.up (BOX_HEIGHT/2) (cad.right (total_width/2 - BOX_SLOT - BOX_WALL_THICKNESS*3/2) (cad.cube ([BOX_WALL_THICKNESS, total_height, BOX_HEIGHT], center = True)))
 
-    compact = right (total_width/2) (forward (total_height/2) (union () (base, wall, spacer)))
+    compact = cad.right (total_width/2) (cad.forward (total_height/2) (cad.union () (base, wall, spacer)))
 
     dip = cube_rounded_edges ([CUP_BASE + EMBOSSING_SLACK, CUP_BASE + EMBOSSING_SLACK, EMBOSSING_DEPTH], CUP_EDGE_RADIUS + EMBOSSING_SLACK/2)
     for row in range (rows):
         for col in range (cols):
-            compact -= up (BOX_FLOOR_THICKNESS - EMBOSSING_DEPTH + OVERLAP) (
-                right (BOX_WALL_THICKNESS + BOX_SPACING + CUP_BASE/2 + (CUP_BASE + BOX_SPACING) * col) (
-                    forward (BOX_WALL_THICKNESS + BOX_SPACING + CUP_BASE/2 + (CUP_BASE + BOX_SPACING) * row) (
+            compact -= cad.up (BOX_FLOOR_THICKNESS - EMBOSSING_DEPTH + OVERLAP) (
+                cad.right (BOX_WALL_THICKNESS + BOX_SPACING + CUP_BASE/2 + (CUP_BASE + BOX_SPACING) * col) (
+                    cad.forward (BOX_WALL_THICKNESS + BOX_SPACING + CUP_BASE/2 + (CUP_BASE + BOX_SPACING) * row) (
                         dip)))
     
     return compact
 
 
-scad_render_to_file (cup (), 'cup.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (box (1, 2), 'box-1-2.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (box (1, 3), 'box-1-3.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (box (2, 1), 'box-2-1.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (box (2, 2), 'box-2-2.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (box (2, 3), 'box-2-3.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (box (3, 3), 'box-3-3.scad', file_header = f'$fn = {SEGMENTS};')
+part ('cup.scad', cup, file_header = f'$fn = {SEGMENTS};')
+part ('box-1-2.scad', box, 1, 2, file_header = f'$fn = {SEGMENTS};')
+part ('box-1-3.scad', box, 1, 3, file_header = f'$fn = {SEGMENTS};')
+part ('box-2-1.scad', box, 2, 1, file_header = f'$fn = {SEGMENTS};')
+part ('box-2-2.scad', box, 2, 2, file_header = f'$fn = {SEGMENTS};')
+part ('box-2-3.scad', box, 2, 3, file_header = f'$fn = {SEGMENTS};')
+part ('box-3-3.scad', box, 3, 3, file_header = f'$fn = {SEGMENTS};')
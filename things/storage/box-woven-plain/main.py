@@ -2,9 +2,11 @@
 
 import math as _math
 
-from solid import *
+from components import cad_legacy as cad
+from components import instances
 
 from components.common import *
+from helpers.output import part
 
 
 SEGMENTS = 33
@@ -60,56 +62,53 @@ def connector (pos_one, angle_one, pos_two, angle_two):
     connector_length = vector_length (connector_vector)
     connector_rotation = point_to_rotation (connector_vector)
 
-    connector = cylinder (STICK_RADIUS, connector_length, segments = STICK_SEGMENTS)
-    connector = rotate ((0, 0, STICK_ROTATION)) (connector)
-    connector = rotate ((0, 90, 0)) (connector)
-    connector = rotate (connector_rotation) (connector)
-    connector = translate (real_pos_one) (connector)
+    connector = cad.cylinder (STICK_RADIUS, connector_length, segments = STICK_SEGMENTS)
+    connector = cad.rotate ((0, 0, STICK_ROTATION)) (connector)
+    connector = cad.rotate ((0, 90, 0)) (connector)
+    connector = cad.rotate (connector_rotation) (connector)
+    connector = cad.translate (real_pos_one) (connector)
 
     return connector
 
 def filler (angle_one, angle_two):
 
-    outline = circle (STICK_RADIUS, segments = STICK_SEGMENTS)
-    outline = rotate ((0, 0, 90)) (outline)
-    outline = translate ((COLUMN_RADIUS + STICK_RADIUS * STICK_SQUISH, 0, 0)) (outline)
-    filler = rotate_extrude (angle_two - angle_one) (outline)
-    filler = rotate ((0, 0, angle_one)) (filler)
+    outline = cad.circle (STICK_RADIUS, segments = STICK_SEGMENTS)
+    outline = cad.rotate ((0, 0, 90)) (outline)
+    outline = cad.translate ((COLUMN_RADIUS + STICK_RADIUS * STICK_SQUISH, 0, 0)) (outline)
+    filler = cad.rotate_extrude (angle_two - angle_one) (outline)
+    filler = cad.rotate ((0, 0, angle_one)) (filler)
 
     return filler
 
 def wall (num_rows, num_columns):
 
-    column_positions = [(index * COLUMN_SPACING, 0, 0) for index in range (num_columns)]
+    column_step = (( COLUMN_SPACING, 0, 0 ),)
     column_height = num_rows * STICK_RADIUS * 2
-    column_proto = cylinder (COLUMN_RADIUS, column_height)
-    columns_list = [translate (position) (column_proto) for position in column_positions]
-    columns = union () (*columns_list)
-
-    stick_positions_one = column_positions [:-1]
-    stick_positions_two = column_positions [1:]
-    stick_shifts_one = [270, 90] * _math.ceil (num_columns / 2)
-    stick_shifts_two = [90, 270] * _math.ceil (num_columns / 2)
-    sticks_list = [
-        connector (pos_one, shift_one, pos_two, shift_two)
-        for (pos_one, shift_one, pos_two, shift_two)
-        in zip (stick_positions_one, stick_shifts_one, stick_positions_two, stick_shifts_two)
-    ]
+    column_proto = cad.cylinder (COLUMN_RADIUS, column_height)
+    columns = instances.lattice (column_proto, ( num_columns, ), column_step)
+
+    # Sticks between even and odd columns alternate, every other one is the same.
+    pair_step = (( 2 * COLUMN_SPACING, 0, 0 ),)
+    pair_shift = ( COLUMN_SPACING, 0, 0 )
+    stick_proto_one = connector ((0, 0, 0), 270, pair_shift, 90)
+    stick_proto_two = connector ((0, 0, 0), 90, pair_shift, 270)
+    sticks_one = instances.lattice (stick_proto_one, ( num_columns // 2, ), pair_step)
+    sticks_two = instances.lattice (stick_proto_two, ( (num_columns - 1) // 2, ), pair_step, pair_shift)
 
     # Too lazy to compute the filler angles.
     filler_proto_one = filler (-95, -85)
     filler_proto_two = filler (+85, +95)
-    fillers_one_list = [translate (position) (filler_proto_one) for position in column_positions [::2]]
-    fillers_two_list = [translate (position) (filler_proto_two) for position in column_positions [1::2]]
+    fillers_one = instances.lattice (filler_proto_one, ( (num_columns + 1) // 2, ), pair_step)
+    fillers_two = instances.lattice (filler_proto_two, ( num_columns // 2, ), pair_step, pair_shift)
 
-    sticks = union () (*sticks_list, *fillers_one_list, *fillers_two_list)
+    sticks = cad.union () (sticks_one, sticks_two, fillers_one, fillers_two)
 
-    sticks_mirror = mirror ((0, 1, 0)) (sticks)
+    sticks_mirror = cad.mirror ((0, 1, 0)) (sticks)
 
-    weave_positions = [(0, 0, STICK_RADIUS + index * STICK_RADIUS * 2) for index in range (num_rows)]
-    weaves_one_list = [translate (position) (sticks) for position in weave_positions [::2]]
-    weaves_two_list = [translate (position) (sticks_mirror) for position in weave_positions [1::2]]
-    weaves = union () (*weaves_one_list, *weaves_two_list)
+    weave_step = (( 0, 0, STICK_RADIUS * 4 ),)
+    weaves_one = instances.lattice (sticks, ( (num_rows + 1) // 2, ), weave_step, ( 0, 0, STICK_RADIUS ))
+    weaves_two = instances.lattice (sticks_mirror, ( num_rows // 2, ), weave_step, ( 0, 0, STICK_RADIUS * 3 ))
+    weaves = cad.union () (weaves_one, weaves_two)
 
     return columns + weaves
 
@@ -119,18 +118,18 @@ def corner (num_rows, angle):
     angle_two = angle + 45
     angle_support = (angle + 180) % 360
 
-    corner_positions = [(0, 0, STICK_RADIUS + index * STICK_RADIUS * 2) for index in range (num_rows)]
+    corner_step = (( 0, 0, STICK_RADIUS * 4 ),)
     corner_proto_one = filler (angle_one, angle_two)
     corner_proto_two = filler (0, 360)
-    corners_one_list = [translate (position) (corner_proto_one) for position in corner_positions [::2]]
-    corners_two_list = [translate (position) (corner_proto_two) for position in corner_positions [1::2]]
-    corners = union () (*corners_one_list, *corners_two_list)
+    corners_one = instances.lattice (corner_proto_one, ( (num_rows + 1) // 2, ), corner_step, ( 0, 0, STICK_RADIUS ))
+    corners_two = instances.lattice (corner_proto_two, ( num_rows // 2, ), corner_step, ( 0, 0, STICK_RADIUS * 3 ))
+    corners = cad.union () (corners_one, corners_two)
 
     support_height = num_rows * STICK_RADIUS * 2
-    support_one = cylinder (COLUMN_RADIUS, support_height)
-    support_two = translate (((COLUMN_RADIUS + STICK_RADIUS * STICK_SQUISH + NOZZLE_RADIUS) * _math.sqrt (2) - COLUMN_RADIUS, 0, 0)) (support_one)
-    support_two = rotate ((0, 0, angle_support)) (support_two)
-    support = hull () (support_one, support_two)
+    support_one = cad.cylinder (COLUMN_RADIUS, support_height)
+    support_two = cad.translate (((COLUMN_RADIUS + STICK_RADIUS * STICK_SQUISH + NOZZLE_RADIUS) * _math.sqrt (2) - COLUMN_RADIUS, 0, 0)) (support_one)
+    support_two = cad.rotate ((0, 0, angle_support)) (support_two)
+    support = cad.hull () (support_one, support_two)
 
     return corners + support
 
@@ -146,38 +145,38 @@ def box (depth, width, height):
     # Rounded corners so no cube here.
     box_width_centers = (box_width_cols - 1) * COLUMN_SPACING
     box_height_centers = (box_height_cols - 1) * COLUMN_SPACING
-    floor_column_proto = cylinder (COLUMN_RADIUS, BOX_FLOOR_THICKNESS)
-    floor = union () (
-        translate ((0, 0, 0)) (floor_column_proto),
-        translate ((box_width_centers, 0, 0)) (floor_column_proto),
-        translate ((0, box_height_centers, 0)) (floor_column_proto),
-        translate ((box_width_centers, box_height_centers, 0)) (floor_column_proto))
-    floor = hull () (floor)
-
-    logo = linear_extrude (BOX_LOGO_THICKNESS) (import_dxf ('paw.dxf'))
-    logo = scale (BOX_LOGO_SCALE) (logo) # type: ignore
-    logo = translate ((box_width_centers / 2, box_height_centers / 2, BOX_FLOOR_THICKNESS)) (logo)
+    floor_column_proto = cad.cylinder (COLUMN_RADIUS, BOX_FLOOR_THICKNESS)
+    floor = cad.union () (
+        cad.translate ((0, 0, 0)) (floor_column_proto),
+        cad.translate ((box_width_centers, 0, 0)) (floor_column_proto),
+        cad.translate ((0, box_height_centers, 0)) (floor_column_proto),
+        cad.translate ((box_width_centers, box_height_centers, 0)) (floor_column_proto))
+    floor = cad.hull () (floor)
+
+    logo = cad.linear_extrude (BOX_LOGO_THICKNESS) (cad.import_dxf ('paw.dxf'))
+    logo = cad.scale (BOX_LOGO_SCALE) (logo) # type: ignore
+    logo = cad.translate ((box_width_centers / 2, box_height_centers / 2, BOX_FLOOR_THICKNESS)) (logo)
 
     # Walls.
     wall_x_proto = wall (box_depth_rows, box_width_cols)
     wall_y_proto = wall (box_depth_rows, box_height_cols)
 
-    wall_one = translate ((0, 0, BOX_FLOOR_THICKNESS)) (rotate ((0, 0, 0)) (wall_x_proto))
-    wall_two = translate ((box_width_centers, 0, BOX_FLOOR_THICKNESS)) (rotate ((0, 0, 90)) (wall_y_proto))
-    wall_tre = translate ((box_width_centers, box_height_centers, BOX_FLOOR_THICKNESS)) (rotate ((0, 0, 180)) (wall_x_proto))
-    wall_for = translate ((0, box_height_centers, BOX_FLOOR_THICKNESS)) (rotate ((0, 0, 270)) (wall_y_proto))
+    wall_one = cad.translate ((0, 0, BOX_FLOOR_THICKNESS)) (cad.rotate ((0, 0, 0)) (wall_x_proto))
+    wall_two = cad.translate ((box_width_centers, 0, BOX_FLOOR_THICKNESS)) (cad.rotate ((0, 0, 90)) (wall_y_proto))
+    wall_tre = cad.translate ((box_width_centers, box_height_centers, BOX_FLOOR_THICKNESS)) (cad.rotate ((0, 0, 180)) (wall_x_proto))
+    wall_for = cad.translate ((0, box_height_centers, BOX_FLOOR_THICKNESS)) (cad.rotate ((0, 0, 270)) (wall_y_proto))
 
     # Corners.
-    corners_one = translate ((0, 0, BOX_FLOOR_THICKNESS)) (corner (box_depth_rows, 225))
-    corners_two = translate ((box_width_centers, 0, BOX_FLOOR_THICKNESS)) (corner (box_depth_rows, 315))
-    corners_tre = translate ((box_width_centers, box_height_centers, BOX_FLOOR_THICKNESS)) (corner (box_depth_rows, 45))
-    corners_for = translate ((0, box_height_centers, BOX_FLOOR_THICKNESS)) (corner (box_depth_rows, 135))
+    corners_one = cad.translate ((0, 0, BOX_FLOOR_THICKNESS)) (corner (box_depth_rows, 225))
+    corners_two = cad.translate ((box_width_centers, 0, BOX_FLOOR_THICKNESS)) (corner (box_depth_rows, 315))
+    corners_tre = cad.translate ((box_width_centers, box_height_centers, BOX_FLOOR_THICKNESS)) (corner (box_depth_rows, 45))
+    corners_for = cad.translate ((0, box_height_centers, BOX_FLOOR_THICKNESS)) (corner (box_depth_rows, 135))
 
     return floor + logo + wall_one + wall_two + wall_tre + wall_for + corners_one + corners_two + corners_tre + corners_for
 
 
 # Main
 
-scad_render_to_file (box (BOX_SQUARE_DEPTH, BOX_SQUARE_WIDTH, BOX_SQUARE_HEIGHT), 'box-square.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (box (BOX_MIDDLE_DEPTH, BOX_MIDDLE_WIDTH, BOX_MIDDLE_HEIGHT), 'box-middle.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (box (BOX_RECTANGULAR_DEPTH, BOX_RECTANGULAR_WIDTH, BOX_RECTANGULAR_HEIGHT), 'box-rectangular.scad', file_header = f'$fn = {SEGMENTS};')
+part ('box-square.scad', box, BOX_SQUARE_DEPTH, BOX_SQUARE_WIDTH, BOX_SQUARE_HEIGHT, file_header = f'$fn = {SEGMENTS};')
+part ('box-middle.scad', box, BOX_MIDDLE_DEPTH, BOX_MIDDLE_WIDTH, BOX_MIDDLE_HEIGHT, file_header = f'$fn = {SEGMENTS};')
+part ('box-rectangular.scad', box, BOX_RECTANGULAR_DEPTH, BOX_RECTANGULAR_WIDTH, BOX_RECTANGULAR_HEIGHT, file_header = f'$fn = {SEGMENTS};')
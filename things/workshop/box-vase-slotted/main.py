@@ -2,8 +2,9 @@
 
 import math
 
-from solid import *
-from solid.utils import *
+from components import cad_legacy as cad
+
+from helpers.output import part
 
 
 SEGMENTS = 33
@@ -28,13 +29,16 @@ def pocket (rows, columns):
     width = (BOX_WIDTH - 2*BOX_WALL_THICKNESS - POCKET_SLACK) / columns
     depth = (BOX_DEPTH - 2*BOX_WALL_THICKNESS - POCKET_SLACK) / rows
     height = BOX_HEIGHT - 2*BOX_FLOOR_THICKNESS
-    return cube ((width, depth, height))
+    return cad.cube ((width, depth, height))
+
+def box ():
+    return cad.cube ((BOX_WIDTH, BOX_DEPTH, BOX_HEIGHT - LID_HEIGHT))
 
-box = cube ((BOX_WIDTH, BOX_DEPTH, BOX_HEIGHT - LID_HEIGHT))
-lid = cube ((BOX_WIDTH, BOX_DEPTH, LID_HEIGHT))
+def lid ():
+    return cad.cube ((BOX_WIDTH, BOX_DEPTH, LID_HEIGHT))
 
-scad_render_to_file (box, 'box.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (lid, 'lid.scad', file_header = f'$fn = {SEGMENTS};')
+part ('box.scad', box, file_header = f'$fn = {SEGMENTS};')
+part ('lid.scad', lid, file_header = f'$fn = {SEGMENTS};')
 
-scad_render_to_file (pocket (3, 3), 'pocket-3-3.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (pocket (3, 4), 'pocket-3-4.scad', file_header = f'$fn = {SEGMENTS};')
+part ('pocket-3-3.scad', pocket, 3, 3, file_header = f'$fn = {SEGMENTS};')
+part ('pocket-3-4.scad', pocket, 3, 4, file_header = f'$fn = {SEGMENTS};')
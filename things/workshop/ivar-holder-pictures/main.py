@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 
-from solid import *
-from solid.utils import *
+from components import cad_legacy as cad
 
 from helpers import ivar
+from helpers.output import part
 
 SEGMENTS = 33
 
@@ -24,37 +24,37 @@ HOOK_THICKNESS = 2.2
 
 def hanger (length):
 
-    catch_upper = cube ((CATCH_OVERLAP_UPPER + CATCH_THICKNESS, HOLDER_WIDTH, CATCH_THICKNESS))
-    catch_upper = translate ((0 - CATCH_THICKNESS, 0, ivar.SHELF_HEIGHT)) (catch_upper)
+    catch_upper = cad.cube ((CATCH_OVERLAP_UPPER + CATCH_THICKNESS, HOLDER_WIDTH, CATCH_THICKNESS))
+    catch_upper = cad.translate ((0 - CATCH_THICKNESS, 0, ivar.SHELF_HEIGHT)) (catch_upper)
 
-    catch_side = cube ((CATCH_THICKNESS, HOLDER_WIDTH, ivar.SHELF_HEIGHT + 2*CATCH_THICKNESS))
-    catch_side = translate ((0 - CATCH_THICKNESS, 0, 0 - CATCH_THICKNESS)) (catch_side)
+    catch_side = cad.cube ((CATCH_THICKNESS, HOLDER_WIDTH, ivar.SHELF_HEIGHT + 2*CATCH_THICKNESS))
+    catch_side = cad.translate ((0 - CATCH_THICKNESS, 0, 0 - CATCH_THICKNESS)) (catch_side)
 
-    catch_lower = cube ((CATCH_OVERLAP_LOWER + CATCH_THICKNESS, HOLDER_WIDTH, CATCH_THICKNESS))
-    catch_lower = translate ((0 - CATCH_THICKNESS, 0, 0 - CATCH_THICKNESS)) (catch_lower)
+    catch_lower = cad.cube ((CATCH_OVERLAP_LOWER + CATCH_THICKNESS, HOLDER_WIDTH, CATCH_THICKNESS))
+    catch_lower = cad.translate ((0 - CATCH_THICKNESS, 0, 0 - CATCH_THICKNESS)) (catch_lower)
 
     catch = catch_upper + catch_side + catch_lower
 
-    arm = cube ((ARM_THICKNESS, HOLDER_WIDTH, length))
-    arm = translate ((CATCH_OVERLAP_LOWER, 0, 0 - length)) (arm)
+    arm = cad.cube ((ARM_THICKNESS, HOLDER_WIDTH, length))
+    arm = cad.translate ((CATCH_OVERLAP_LOWER, 0, 0 - length)) (arm)
 
     tip_height = (HOLDER_WIDTH - HOOK_WIDTH)/2
-    tip = polygon ([(0, 0), (HOLDER_WIDTH, 0), (HOLDER_WIDTH/2 + HOOK_WIDTH/2, tip_height), (HOLDER_WIDTH/2 - HOOK_WIDTH/2, tip_height)])
-    tip = linear_extrude (ARM_THICKNESS) (tip)
+    tip = cad.polygon ([(0, 0), (HOLDER_WIDTH, 0), (HOLDER_WIDTH/2 + HOOK_WIDTH/2, tip_height), (HOLDER_WIDTH/2 - HOOK_WIDTH/2, tip_height)])
+    tip = cad.linear_extrude (ARM_THICKNESS) (tip)
 
-    bar = cube ((HOOK_WIDTH, HOOK_WIDTH, HOOK_GAP))
-    bar = translate ((HOLDER_WIDTH/2 - HOOK_WIDTH/2, tip_height - HOOK_WIDTH, ARM_THICKNESS)) (bar)
+    bar = cad.cube ((HOOK_WIDTH, HOOK_WIDTH, HOOK_GAP))
+    bar = cad.translate ((HOLDER_WIDTH/2 - HOOK_WIDTH/2, tip_height - HOOK_WIDTH, ARM_THICKNESS)) (bar)
 
-    bin = cube ((HOOK_WIDTH, HOOK_WIDTH + HOOK_HEIGHT, HOOK_THICKNESS))
-    bin = translate ((HOLDER_WIDTH/2 - HOOK_WIDTH/2, tip_height - HOOK_WIDTH - HOOK_HEIGHT, ARM_THICKNESS + HOOK_GAP)) (bin)
+    bin = cad.cube ((HOOK_WIDTH, HOOK_WIDTH + HOOK_HEIGHT, HOOK_THICKNESS))
+    bin = cad.translate ((HOLDER_WIDTH/2 - HOOK_WIDTH/2, tip_height - HOOK_WIDTH - HOOK_HEIGHT, ARM_THICKNESS + HOOK_GAP)) (bin)
 
     hook = tip + bar + bin
 
-    hook = rotate ((270, 0, 90)) (hook)
-    hook = translate ((CATCH_OVERLAP_LOWER + ARM_THICKNESS, 0, 0 - length)) (hook)
+    hook = cad.rotate ((270, 0, 90)) (hook)
+    hook = cad.translate ((CATCH_OVERLAP_LOWER + ARM_THICKNESS, 0, 0 - length)) (hook)
 
     return catch + arm + hook
 
 
 for length in range (20, 100, 10):
-    scad_render_to_file (hanger (length), f'hanger-{length}.scad', file_header = f'$fn = {SEGMENTS};')
+    part (f'hanger-{length}.scad', hanger, length, file_header = f'$fn = {SEGMENTS};')
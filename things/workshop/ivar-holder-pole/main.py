@@ -2,16 +2,15 @@
 
 import math as _math
 
-from solid2 import *
-from solid2.extensions.bosl2 import *
-from solid2.extensions.bosl2.gears import *
-from solid2.extensions.bosl2.threading import *
+from components import cad
 
 from components.common import *
 from helpers.transform import *
+from helpers.output import part
 
 
-set_global_fn (111)
+cad.require ('gears', 'threading')
+cad.set_global_fn (111)
 
 
 OVERLAP = 0.001
@@ -51,13 +50,13 @@ def wrap (pole_diameter, thread_shrink, closed):
 
     thread_diameter = pole_diameter + BODY_THICKNESS * 2 + THREAD_PITCH / 2
 
-    thread = trapezoidal_threaded_rod (
+    thread = cad.trapezoidal_threaded_rod (
         d = thread_diameter + THREAD_SLACK,
         l = THREAD_LENGTH + OVERLAP * 2,
         pitch = THREAD_PITCH,
         end_len1 = THREAD_LEAD,
         internal = True,
-        anchor = BOTTOM,
+        anchor = cad.BOTTOM,
     )
 
     thread = scale_along_z (
@@ -70,17 +69,17 @@ def wrap (pole_diameter, thread_shrink, closed):
     thread = thread.down (OVERLAP)
 
     body = (
-        cyl (
+        cad.cyl (
             d = thread_diameter + THREAD_SLACK + BODY_THICKNESS * 2,
             l = THREAD_LENGTH + closed * BODY_THICKNESS,
-            anchor = BOTTOM)
+            anchor = cad.BOTTOM)
         +
-        spur_gear (
+        cad.spur_gear (
             _math.pi * (thread_diameter + THREAD_SLACK + BODY_THICKNESS * 2) / WRAP_TEETH,
             WRAP_TEETH,
             WRAP_CAP,
             helical = WRAP_ANGLE,
-            anchor = TOP,
+            anchor = cad.TOP,
         )
         .up (THREAD_LENGTH + closed * BODY_THICKNESS)
     )
@@ -95,31 +94,31 @@ def ring (pole_diameter):
     thread_diameter = pole_diameter + BODY_THICKNESS * 2 + THREAD_PITCH / 2
 
     body = (
-        cyl (d = thread_diameter, l = RING_LENGTH + BODY_THICKNESS, anchor = BOTTOM)
+        cad.cyl (d = thread_diameter, l = RING_LENGTH + BODY_THICKNESS, anchor = cad.BOTTOM)
         +
-        cuboid ([thread_diameter, thread_diameter / 2 + RING_HEIGHT + BODY_THICKNESS, RING_LENGTH + BODY_THICKNESS], anchor = BOTTOM + BACK)
+        cad.cuboid ([thread_diameter, thread_diameter / 2 + RING_HEIGHT + BODY_THICKNESS, RING_LENGTH + BODY_THICKNESS], anchor = cad.BOTTOM + cad.BACK)
         +
-        trapezoidal_threaded_rod (
+        cad.trapezoidal_threaded_rod (
             d = thread_diameter,
             l = THREAD_LENGTH,
             pitch = THREAD_PITCH,
             end_len2 = THREAD_LEAD,
-            anchor = BOTTOM,
+            anchor = cad.BOTTOM,
         )
         .up (RING_LENGTH + BODY_THICKNESS)
         -
-        cuboid ([thread_diameter + OVERLAP * 2, RING_HEIGHT, RING_LENGTH + OVERLAP], anchor = BOTTOM + BACK)
+        cad.cuboid ([thread_diameter + OVERLAP * 2, RING_HEIGHT, RING_LENGTH + OVERLAP], anchor = cad.BOTTOM + cad.BACK)
         .fwd (thread_diameter / 2)
         .up (BODY_THICKNESS)
         -
-        cyl (d = pole_diameter, l = BODY_THICKNESS + RING_LENGTH + THREAD_LENGTH + OVERLAP * 2, anchor = BOTTOM)
+        cad.cyl (d = pole_diameter, l = BODY_THICKNESS + RING_LENGTH + THREAD_LENGTH + OVERLAP * 2, anchor = cad.BOTTOM)
         .down (OVERLAP)
         -
-        cuboid ([thread_diameter + OVERLAP * 2, THREAD_GAP, THREAD_LENGTH + OVERLAP], anchor = BOTTOM)
+        cad.cuboid ([thread_diameter + OVERLAP * 2, THREAD_GAP, THREAD_LENGTH + OVERLAP], anchor = cad.BOTTOM)
         .up (RING_LENGTH + BODY_THICKNESS)
         .rotate ([0, 0, 45])
         -
-        cuboid ([THREAD_GAP, thread_diameter + OVERLAP * 2, THREAD_LENGTH + OVERLAP], anchor = BOTTOM)
+        cad.cuboid ([THREAD_GAP, thread_diameter + OVERLAP * 2, THREAD_LENGTH + OVERLAP], anchor = cad.BOTTOM)
         .up (RING_LENGTH + BODY_THICKNESS)
         .rotate ([0, 0, 45])
     )
@@ -130,50 +129,50 @@ def ring (pole_diameter):
 def support ():
 
     ring = (
-        cyl (
+        cad.cyl (
             d1 = SUPPORT_DIAMETER + SUPPORT_THICKNESS_THIN * 2,
             d2 = SUPPORT_DIAMETER + SUPPORT_THICKNESS_THICK * 2,
             l = SUPPORT_RING + OVERLAP,
-            anchor = BOTTOM)
+            anchor = cad.BOTTOM)
         +
-        cyl (
+        cad.cyl (
             d = SUPPORT_DIAMETER + SUPPORT_THICKNESS_THICK * 2,
             l = SUPPORT_RING + OVERLAP,
-            anchor = BOTTOM)
+            anchor = cad.BOTTOM)
         .up (SUPPORT_RING)
         +
-        cyl (
+        cad.cyl (
             d1 = SUPPORT_DIAMETER + SUPPORT_THICKNESS_THICK * 2,
             d2 = SUPPORT_DIAMETER + SUPPORT_THICKNESS_THIN * 2,
             l = SUPPORT_RING + OVERLAP,
-            anchor = BOTTOM)
+            anchor = cad.BOTTOM)
         .up (SUPPORT_RING * 2)
     )
 
     ring_list = [ ring.up (index * (SUPPORT_LENGTH - SUPPORT_RING * 3) / SUPPORT_COUNT) for index in range (SUPPORT_COUNT + 1) ]
 
     body = (
-        cyl (
+        cad.cyl (
             d = SUPPORT_DIAMETER + SUPPORT_THICKNESS_THIN * 2,
             l = SUPPORT_LENGTH,
-            anchor = BOTTOM)
+            anchor = cad.BOTTOM)
     )
 
     pole = (
-        cyl (
+        cad.cyl (
             d = SUPPORT_DIAMETER,
             l = SUPPORT_LENGTH + OVERLAP * 2,
-            anchor = BOTTOM)
+            anchor = cad.BOTTOM)
         .down (OVERLAP)
     )
 
-    return union () (*ring_list) + body - pole
+    return cad.union () (*ring_list) + body - pole
 
 
-wrap (POLE_DIAMETER_WOOD, THREAD_SHRINK_WOOD, False).save_as_scad ('wrap-wood.scad')
-wrap (POLE_DIAMETER_METAL, THREAD_SHRINK_METAL, True).save_as_scad ('wrap-metal.scad')
+part ('wrap-wood.scad', wrap, POLE_DIAMETER_WOOD, THREAD_SHRINK_WOOD, False)
+part ('wrap-metal.scad', wrap, POLE_DIAMETER_METAL, THREAD_SHRINK_METAL, True)
 
-ring (POLE_DIAMETER_WOOD).save_as_scad ('ring-wood.scad')
-ring (POLE_DIAMETER_METAL).save_as_scad ('ring-metal.scad')
+part ('ring-wood.scad', ring, POLE_DIAMETER_WOOD)
+part ('ring-metal.scad', ring, POLE_DIAMETER_METAL)
 
-support ().save_as_scad ('support.scad')
+part ('support.scad', support)
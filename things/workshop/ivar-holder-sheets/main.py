@@ -2,15 +2,16 @@
 
 import math as _math
 
-from solid2 import *
-from solid2.extensions.bosl2 import *
+from components import cad
+from components import instances
 
 from components.common import *
 
 from helpers import ivar
+from helpers.output import part
 
 
-set_global_fn (111)
+cad.set_global_fn (111)
 
 
 OVERLAP = 0.001
@@ -43,7 +44,7 @@ PIN_CHAMFER = 2.2
 
 
 def _hexagon (radius, thickness):
-    return rotate ((0, 0, 30)) (cylinder (r = radius, h = thickness, _fn = 6))
+    return cad.rotate ((0, 0, 30)) (cad.cylinder (r = radius, h = thickness, _fn = 6))
 
 
 def hexagrid_spacing_vertical (gap, radius):
@@ -57,17 +58,14 @@ def hexagrid (rows, cols, gap, radius, thickness):
     spacing_vertical = 2*hexagrid_spacing_vertical (gap, radius)
     spacing_horizontal = hexagrid_spacing_horizontal (gap, radius)
 
-    element = translate ((radius*_math.cos (_math.pi/6), radius, 0)) (_hexagon (radius, thickness))
+    element = cad.translate ((radius*_math.cos (_math.pi/6), radius, 0)) (_hexagon (radius, thickness))
 
-    grid_row_longer_list = [ translate ((spacing_horizontal*column, 0, 0)) (element) for column in range (cols) ]
-    grid_row_longer = union () (*grid_row_longer_list)
-    grid_rows_longer = [ translate ((0, spacing_vertical*row, 0)) (grid_row_longer) for row in range ((rows+1)//2) ]
+    steps = (( spacing_horizontal, 0, 0 ), ( 0, spacing_vertical, 0 ))
 
-    grid_row_shorter_list = [ translate ((spacing_horizontal*column + spacing_horizontal/2, 0, 0)) (element) for column in range (cols-1) ]
-    grid_row_shorter = union () (*grid_row_shorter_list)
-    grid_rows_shorter = [ translate ((0, spacing_vertical*row + spacing_vertical/2, 0)) (grid_row_shorter) for row in range (rows//2) ]
+    grid_rows_longer = instances.lattice (element, ( cols, (rows+1)//2 ), steps)
+    grid_rows_shorter = instances.lattice (element, ( cols-1, rows//2 ), steps, ( spacing_horizontal/2, spacing_vertical/2, 0 ))
 
-    return union () (*grid_rows_longer, *grid_rows_shorter)
+    return cad.union () (grid_rows_longer, grid_rows_shorter)
 
 
 def hexagrid_pierced_wall (size, gap, radius, rim):
@@ -81,14 +79,14 @@ def hexagrid_pierced_wall (size, gap, radius, rim):
     centering_vertical = (size [Z] - (piercing_spacing_vertical * (rows-1)) - gap*_math.cos (_math.pi/6)/2) / 2
     centering_horizontal = (size [X] - (piercing_spacing_horizontal * (cols-2)) - gap) / 2
 
-    body = cube (size)
+    body = cad.cube (size)
 
-    piercing = translate ((0 - centering_horizontal, size [Y] + OVERLAP, 0 - centering_vertical)) (
-        rotate ((90, 0, 0)) (
+    piercing = cad.translate ((0 - centering_horizontal, size [Y] + OVERLAP, 0 - centering_vertical)) (
+        cad.rotate ((90, 0, 0)) (
             hexagrid (rows, cols, gap, radius, size [Y] + 2*OVERLAP)))
 
-    rim = translate ((rim, -OVERLAP, rim)) (
-        cube ((size [X] - 2*rim, size [Y] + 2*OVERLAP, size [Z] - 2*rim)))
+    rim = cad.translate ((rim, -OVERLAP, rim)) (
+        cad.cube ((size [X] - 2*rim, size [Y] + 2*OVERLAP, size [Z] - 2*rim)))
 
     return (body - piercing) + (body - rim)
 
@@ -97,26 +95,26 @@ def bracket_grid (shift):
 
     rim = BRACKET_THICKNESS + ivar.STAND_CHAMFER
 
-    bottom = translate ((-ivar.STAND_WIDTH/2, -BRACKET_THICKNESS, 0)) (
+    bottom = cad.translate ((-ivar.STAND_WIDTH/2, -BRACKET_THICKNESS, 0)) (
         hexagrid_pierced_wall ((ivar.STAND_WIDTH/2 + BRACKET_THICKNESS, BRACKET_THICKNESS, HOLDER_HEIGHT), BRACKET_PIERCING_CELL_GAP, BRACKET_PIERCING_CELL_RADIUS, rim))
-    side = translate ((BRACKET_THICKNESS, 0, 0)) (
-        rotate ((0, 0, 90)) (
+    side = cad.translate ((BRACKET_THICKNESS, 0, 0)) (
+        cad.rotate ((0, 0, 90)) (
             hexagrid_pierced_wall ((ivar.STAND_DEPTH + BRACKET_THICKNESS*2, BRACKET_THICKNESS, HOLDER_HEIGHT), BRACKET_PIERCING_CELL_GAP, BRACKET_PIERCING_CELL_RADIUS, rim)))
-    top = translate ((-ivar.STAND_WIDTH/2, ivar.STAND_DEPTH, 0)) (
+    top = cad.translate ((-ivar.STAND_WIDTH/2, ivar.STAND_DEPTH, 0)) (
         hexagrid_pierced_wall ((ivar.STAND_WIDTH/2 + BRACKET_THICKNESS, BRACKET_THICKNESS, HOLDER_HEIGHT), BRACKET_PIERCING_CELL_GAP, BRACKET_PIERCING_CELL_RADIUS, rim))
 
-    reinforcement_base = intersection () (
-        cylinder (r = rim, h = HOLDER_HEIGHT, _fn = 4),
-        cube ((rim, rim, HOLDER_HEIGHT)))
-    reinforcement_bottom = translate ((BRACKET_THICKNESS, 0, 0)) (
-        rotate ((0, 0, 90)) (
+    reinforcement_base = cad.intersection () (
+        cad.cylinder (r = rim, h = HOLDER_HEIGHT, _fn = 4),
+        cad.cube ((rim, rim, HOLDER_HEIGHT)))
+    reinforcement_bottom = cad.translate ((BRACKET_THICKNESS, 0, 0)) (
+        cad.rotate ((0, 0, 90)) (
             reinforcement_base))
-    reinforcement_top = translate ((BRACKET_THICKNESS, ivar.STAND_DEPTH, 0)) (
-        rotate ((0, 0, 180)) (
+    reinforcement_top = cad.translate ((BRACKET_THICKNESS, ivar.STAND_DEPTH, 0)) (
+        cad.rotate ((0, 0, 180)) (
             reinforcement_base))
 
     pin_base = (
-        cyl (r = ivar.PIN_RADIUS_SMALL, h = BRACKET_THICKNESS + PIN_DEPTH + PIN_CHAMFER, chamfer2 = PIN_CHAMFER, anchor = BOTTOM)
+        cad.cyl (r = ivar.PIN_RADIUS_SMALL, h = BRACKET_THICKNESS + PIN_DEPTH + PIN_CHAMFER, chamfer2 = PIN_CHAMFER, anchor = cad.BOTTOM)
         .down (BRACKET_THICKNESS)
         .rotate ([90, 0, 0])
         .left (ivar.STAND_PIN_HOLE_TO_EDGE + shift)
@@ -124,9 +122,9 @@ def bracket_grid (shift):
         .up (BRACKET_PIN_OFFSET)
     )
     pin_count = int ((HOLDER_HEIGHT - BRACKET_PIN_OFFSET - 2*ivar.PIN_RADIUS_LARGE) // ivar.PIN_DISTANCE_VERTICAL) + 1
-    pin_list = [translate ((0, 0, ivar.PIN_DISTANCE_VERTICAL * pin)) (pin_base) for pin in range (pin_count)]
+    pin_list = [cad.translate ((0, 0, ivar.PIN_DISTANCE_VERTICAL * pin)) (pin_base) for pin in range (pin_count)]
 
-    return union () (
+    return cad.union () (
         bottom, reinforcement_bottom,
         top, reinforcement_top,
         side, *pin_list)
@@ -134,21 +132,21 @@ def bracket_grid (shift):
 
 def bracket_full (shift):
 
-    face_wall = cuboid ((ivar.STAND_PIN_HOLE_TO_EDGE + ivar.PIN_RADIUS_SMALL + shift, BRACKET_THICKNESS, HOLDER_HEIGHT), rounding = BRACKET_THICKNESS, edges = [FRONT+LEFT], anchor = RIGHT+BACK+BOTTOM)
-    side_wall = cuboid ((BRACKET_THICKNESS, ivar.STAND_DEPTH + 2*BRACKET_THICKNESS, HOLDER_HEIGHT), anchor = LEFT+FRONT+BOTTOM).fwd (BRACKET_THICKNESS)
-    back_wall = cuboid ((ivar.STAND_PIN_HOLE_TO_EDGE + ivar.PIN_RADIUS_SMALL + shift, BRACKET_THICKNESS, HOLDER_HEIGHT), rounding = BRACKET_THICKNESS, edges = [BACK+LEFT], anchor = RIGHT+FRONT+BOTTOM).back (ivar.STAND_DEPTH)
+    face_wall = cad.cuboid ((ivar.STAND_PIN_HOLE_TO_EDGE + ivar.PIN_RADIUS_SMALL + shift, BRACKET_THICKNESS, HOLDER_HEIGHT), rounding = BRACKET_THICKNESS, edges = [cad.FRONT+cad.LEFT], anchor = cad.RIGHT+cad.BACK+cad.BOTTOM)
+    side_wall = cad.cuboid ((BRACKET_THICKNESS, ivar.STAND_DEPTH + 2*BRACKET_THICKNESS, HOLDER_HEIGHT), anchor = cad.LEFT+cad.FRONT+cad.BOTTOM).fwd (BRACKET_THICKNESS)
+    back_wall = cad.cuboid ((ivar.STAND_PIN_HOLE_TO_EDGE + ivar.PIN_RADIUS_SMALL + shift, BRACKET_THICKNESS, HOLDER_HEIGHT), rounding = BRACKET_THICKNESS, edges = [cad.BACK+cad.LEFT], anchor = cad.RIGHT+cad.FRONT+cad.BOTTOM).back (ivar.STAND_DEPTH)
 
     rows = _math.floor ((HOLDER_HEIGHT - BRACKET_PIN_OFFSET - ivar.PIN_RADIUS_SMALL) // ivar.PIN_DISTANCE_VERTICAL) + 1
 
     pin_base = (
-        cyl (h = PIN_DEPTH + PIN_CHAMFER, r = ivar.PIN_RADIUS_SMALL, chamfer2 = PIN_CHAMFER, anchor = BOTTOM, orient = FORWARD)
+        cad.cyl (h = PIN_DEPTH + PIN_CHAMFER, r = ivar.PIN_RADIUS_SMALL, chamfer2 = PIN_CHAMFER, anchor = cad.BOTTOM, orient = cad.FORWARD)
         .left (ivar.STAND_PIN_HOLE_TO_EDGE + shift)
         .back (ivar.STAND_DEPTH)
         .up (BRACKET_PIN_OFFSET)
     )
     pin_list = [ pin_base.up (row * ivar.PIN_DISTANCE_VERTICAL) for row in range (rows) ]
 
-    return face_wall + side_wall + back_wall + union () (*pin_list)
+    return face_wall + side_wall + back_wall + cad.union () (*pin_list)
 
 
 def slots ():
@@ -156,31 +154,31 @@ def slots ():
     width = SLOT_THICKNESS + (SLOT_WIDTH + SLOT_THICKNESS) * SLOT_COUNT
     depth = SLOT_THICKNESS + SLOT_DEPTH
 
-    body = cube ((width, depth, HOLDER_HEIGHT))
+    body = cad.cube ((width, depth, HOLDER_HEIGHT))
 
-    slot_base = translate ((SLOT_THICKNESS, SLOT_THICKNESS, SLOT_THICKNESS + SLOT_DESCENT*(SLOT_COUNT-1))) (
-        cube ((SLOT_WIDTH, SLOT_DEPTH + OVERLAP, HOLDER_HEIGHT + OVERLAP)))
-    slot_list = [translate (((SLOT_WIDTH+SLOT_THICKNESS)*slot, 0, -SLOT_DESCENT*slot)) (slot_base) for slot in range (SLOT_COUNT)]
-    body -= union () (*slot_list)
+    slot_base = cad.translate ((SLOT_THICKNESS, SLOT_THICKNESS, SLOT_THICKNESS + SLOT_DESCENT*(SLOT_COUNT-1))) (
+        cad.cube ((SLOT_WIDTH, SLOT_DEPTH + OVERLAP, HOLDER_HEIGHT + OVERLAP)))
+    slot_list = [cad.translate (((SLOT_WIDTH+SLOT_THICKNESS)*slot, 0, -SLOT_DESCENT*slot)) (slot_base) for slot in range (SLOT_COUNT)]
+    body -= cad.union () (*slot_list)
 
-    chamfer_primary = translate ((BRACKET_THICKNESS, -OVERLAP, HOLDER_HEIGHT)) (
-        rotate ((0, SLOT_PRIMARY_CHAMFER_ANGLE_DEG, 0)) (
-            cube ((width / _math.cos (SLOT_PRIMARY_CHAMFER_ANGLE_RAD), depth + 2*OVERLAP, HOLDER_HEIGHT))))
+    chamfer_primary = cad.translate ((BRACKET_THICKNESS, -OVERLAP, HOLDER_HEIGHT)) (
+        cad.rotate ((0, SLOT_PRIMARY_CHAMFER_ANGLE_DEG, 0)) (
+            cad.cube ((width / _math.cos (SLOT_PRIMARY_CHAMFER_ANGLE_RAD), depth + 2*OVERLAP, HOLDER_HEIGHT))))
 
     chamfer_secondary_size = SLOT_SECONDARY_CHAMFER_DEPTH / _math.cos (SLOT_SECONDARY_CHAMFER_ANGLE_RAD)
-    chamfer_secondary = translate ((SLOT_THICKNESS, depth - SLOT_SECONDARY_CHAMFER_DEPTH, HOLDER_HEIGHT)) (
-        multmatrix (((1, 0, 0, 0), (0, 1, 0, 0), (-SLOT_DESCENT / (SLOT_WIDTH + SLOT_THICKNESS), 0, 1, 0), (0, 0, 0, 1))) (
-            rotate ((-SLOT_SECONDARY_CHAMFER_ANGLE_DEG, 0, 0)) (
-                cube ((width, chamfer_secondary_size, chamfer_secondary_size)))))
+    chamfer_secondary = cad.translate ((SLOT_THICKNESS, depth - SLOT_SECONDARY_CHAMFER_DEPTH, HOLDER_HEIGHT)) (
+        cad.multmatrix (((1, 0, 0, 0), (0, 1, 0, 0), (-SLOT_DESCENT / (SLOT_WIDTH + SLOT_THICKNESS), 0, 1, 0), (0, 0, 0, 1))) (
+            cad.rotate ((-SLOT_SECONDARY_CHAMFER_ANGLE_DEG, 0, 0)) (
+                cad.cube ((width, chamfer_secondary_size, chamfer_secondary_size)))))
 
     return body - chamfer_primary - chamfer_secondary
 
 
 def holder_grid (shift):
 
-    holder = union () (
-        translate ((0, 0, 0)) (bracket_grid (shift)),
-        translate ((0, ivar.STAND_DEPTH - SLOT_BRACKET_OVERLAP - SLOT_THICKNESS, 0)) (slots ()),
+    holder = cad.union () (
+        cad.translate ((0, 0, 0)) (bracket_grid (shift)),
+        cad.translate ((0, ivar.STAND_DEPTH - SLOT_BRACKET_OVERLAP - SLOT_THICKNESS, 0)) (slots ()),
     )
 
     return holder
@@ -188,17 +186,17 @@ def holder_grid (shift):
 
 def holder_full (shift):
 
-    holder = union () (
-        translate ((0, 0, 0)) (bracket_full (shift)),
-        translate ((0, ivar.STAND_DEPTH - SLOT_BRACKET_OVERLAP - SLOT_THICKNESS, 0)) (slots ()),
+    holder = cad.union () (
+        cad.translate ((0, 0, 0)) (bracket_full (shift)),
+        cad.translate ((0, ivar.STAND_DEPTH - SLOT_BRACKET_OVERLAP - SLOT_THICKNESS, 0)) (slots ()),
     )
 
     return holder
 
 
-holder_grid (0).save_as_scad ('holder-grid-zero.scad')
-holder_grid (1).save_as_scad ('holder-grid-one.scad')
-holder_grid (2).save_as_scad ('holder-grid-two.scad')
-holder_full (0).save_as_scad ('holder-full-zero.scad')
-holder_full (1).save_as_scad ('holder-full-one.scad')
-holder_full (2).save_as_scad ('holder-full-two.scad')
+part ('holder-grid-zero.scad', holder_grid, 0)
+part ('holder-grid-one.scad', holder_grid, 1)
+part ('holder-grid-two.scad', holder_grid, 2)
+part ('holder-full-zero.scad', holder_full, 0)
+part ('holder-full-one.scad', holder_full, 1)
+part ('holder-full-two.scad', holder_full, 2)
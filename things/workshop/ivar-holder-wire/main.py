@@ -2,15 +2,15 @@
 
 import math as _math
 
-from solid2 import *
-from solid2.extensions.bosl2 import *
+from components import cad
 
 from components.common import *
 
 from helpers import ivar
+from helpers.output import part
 
 
-set_global_fn (111)
+cad.set_global_fn (111)
 
 
 OVERLAP = 0.001
@@ -45,23 +45,23 @@ def wire (diameter):
 
     body = (
         (
-            cyl (
+            cad.cyl (
                 h = BODY_HEIGHT - WIRE_HOLE_DEPTH + OVERLAP * 2,
                 d = diameter,
                 chamfer2 = 0 - WIRE_HOLE_CHAMFER,
-                anchor = BOTTOM,
+                anchor = cad.BOTTOM,
             )
             +
-            cuboid (
+            cad.cuboid (
                 [
                     diameter,
                     BODY_HEIGHT + OVERLAP * 2,
                     WIRE_SLOT_DEPTH + OVERLAP
                 ],
-                edges = [TOP + LEFT, TOP + RIGHT],
+                edges = [cad.TOP + cad.LEFT, cad.TOP + cad.RIGHT],
                 chamfer = 0 - WIRE_SLOT_CHAMFER,
-                anchor = FRONT + TOP,
-                orient = FWD,
+                anchor = cad.FRONT + cad.TOP,
+                orient = cad.FWD,
             )
             .fwd (WIRE_SLOT_DEPTH)
         )
@@ -84,31 +84,31 @@ def comb (hole_size_list):
         wire_list.append (wire (hole_size_list [wire_index]).left (wire_position))
         wire_position += hole_size_list [wire_index] / 2 + WIRE_GAP / 2
         wire_index = (wire_index + 1) % len (hole_size_list)
-    wire_hole = union () (wire_list)
+    wire_hole = cad.union () (wire_list)
 
     wire_slot = (
         (
-            cuboid (
+            cad.cuboid (
                 [
                     slot_length,
                     WIRE_HOLE_WIDTH,
                     WIRE_HOLE_DEPTH / 2 + OVERLAP
                 ],
-                edges = [TOP + LEFT, TOP + FRONT, TOP + BACK],
+                edges = [cad.TOP + cad.LEFT, cad.TOP + cad.FRONT, cad.TOP + cad.BACK],
                 chamfer = 0 - WIRE_SLOT_CHAMFER,
-                anchor = BOTTOM + RIGHT,
+                anchor = cad.BOTTOM + cad.RIGHT,
             )
             .up (BODY_HEIGHT - WIRE_HOLE_DEPTH / 2)
             +
-            cuboid (
+            cad.cuboid (
                 [
                     slot_length,
                     WIRE_HOLE_WIDTH,
                     WIRE_HOLE_DEPTH / 2 + OVERLAP
                 ],
-                edges = [BOTTOM + LEFT, BOTTOM + FRONT, BOTTOM + BACK],
+                edges = [cad.BOTTOM + cad.LEFT, cad.BOTTOM + cad.FRONT, cad.BOTTOM + cad.BACK],
                 chamfer = WIRE_SLOT_CHAMFER,
-                anchor = BOTTOM + RIGHT,
+                anchor = cad.BOTTOM + cad.RIGHT,
             )
             .up (BODY_HEIGHT - WIRE_HOLE_DEPTH)
         )
@@ -122,21 +122,21 @@ def catch ():
 
     pin_body = (
         (
-            cyl (
+            cad.cyl (
                 h = PIN_TIP + PIN_DEPTH + OVERLAP,
                 r = ivar.PIN_RADIUS_SMALL,
                 chamfer2 = PIN_TIP,
-                anchor = BOTTOM,
-                orient = LEFT,
+                anchor = cad.BOTTOM,
+                orient = cad.LEFT,
             )
             &
-            cuboid (
+            cad.cuboid (
                 [
                     PIN_TIP + PIN_DEPTH + OVERLAP,
                     CATCH_WIDTH,
                     ivar.PIN_RADIUS_SMALL * 2
                 ],
-                anchor = RIGHT,
+                anchor = cad.RIGHT,
             )
         )
         .right (OVERLAP)
@@ -146,18 +146,18 @@ def catch ():
     pin_twin = pin_body + pin_body.up (ivar.PIN_DISTANCE_VERTICAL)
 
     bar_body = (
-        cuboid (
+        cad.cuboid (
             [CATCH_THICKNESS, CATCH_WIDTH, BODY_HEIGHT],
-            edges = [RIGHT + FRONT, RIGHT + BACK, TOP + RIGHT],
+            edges = [cad.RIGHT + cad.FRONT, cad.RIGHT + cad.BACK, cad.TOP + cad.RIGHT],
             chamfer = CATCH_CHAMFER,
-            anchor = LEFT + BOTTOM,
+            anchor = cad.LEFT + cad.BOTTOM,
         )
         +
-        cuboid (
+        cad.cuboid (
             [CATCH_THICKNESS + CATCH_CATCH, CATCH_WIDTH, CATCH_CATCH + OVERLAP],
-            edges = [RIGHT + TOP, RIGHT + FRONT, RIGHT + BACK],
+            edges = [cad.RIGHT + cad.TOP, cad.RIGHT + cad.FRONT, cad.RIGHT + cad.BACK],
             chamfer = CATCH_CHAMFER,
-            anchor = LEFT + BOTTOM,
+            anchor = cad.LEFT + cad.BOTTOM,
         )
     )
 
@@ -168,22 +168,22 @@ def holder (hole_size_list):
 
     catch_hole = (
         (
-            cuboid (
+            cad.cuboid (
                 [
                     CATCH_THICKNESS + CATCH_SLACK + OVERLAP,
                     CATCH_WIDTH + CATCH_SLACK,
                     BODY_HEIGHT + OVERLAP * 2
                 ],
-                anchor = LEFT + BOTTOM,
+                anchor = cad.LEFT + cad.BOTTOM,
             )
             +
-            cuboid (
+            cad.cuboid (
                 [
                     CATCH_THICKNESS + CATCH_CATCH + CATCH_SLACK + OVERLAP,
                     CATCH_WIDTH + CATCH_SLACK * 2,
                     CATCH_CATCH + OVERLAP
                 ],
-                anchor = LEFT + BOTTOM,
+                anchor = cad.LEFT + cad.BOTTOM,
             )
         )
         .down (OVERLAP)
@@ -192,11 +192,11 @@ def holder (hole_size_list):
     )
 
     body = (
-        cuboid (
+        cad.cuboid (
             [ivar.STAND_RUNG_LENGTH / 2, ivar.STAND_PIN_HOLE_TO_EDGE * 2, BODY_HEIGHT],
-            edges = [LEFT+BACK, LEFT+FRONT, FRONT+TOP, BACK+TOP, FRONT+BOTTOM, BACK+BOTTOM],
+            edges = [cad.LEFT+cad.BACK, cad.LEFT+cad.FRONT, cad.FRONT+cad.TOP, cad.BACK+cad.TOP, cad.FRONT+cad.BOTTOM, cad.BACK+cad.BOTTOM],
             chamfer = BODY_CHAMFER,
-            anchor = RIGHT + BOTTOM,
+            anchor = cad.RIGHT + cad.BOTTOM,
         )
     )
 
@@ -206,9 +206,9 @@ def holder (hole_size_list):
     return full
 
 
-catch ().save_as_scad ('catch.scad')
+part ('catch.scad', catch)
 
-holder ([WIRE_DIAMETER_ONE]).save_as_scad ('holder_one.scad')
-holder ([WIRE_DIAMETER_TWO]).save_as_scad ('holder_two.scad')
-holder ([WIRE_DIAMETER_TWO, WIRE_DIAMETER_ONE]).save_as_scad ('holder_one_two.scad')
-holder ([WIRE_DIAMETER_TWO, WIRE_DIAMETER_ONE, WIRE_DIAMETER_ONE]).save_as_scad ('holder_one_one_two.scad')
+part ('holder_one.scad', holder, [WIRE_DIAMETER_ONE])
+part ('holder_two.scad', holder, [WIRE_DIAMETER_TWO])
+part ('holder_one_two.scad', holder, [WIRE_DIAMETER_TWO, WIRE_DIAMETER_ONE])
+part ('holder_one_one_two.scad', holder, [WIRE_DIAMETER_TWO, WIRE_DIAMETER_ONE, WIRE_DIAMETER_ONE])
@@ -2,15 +2,15 @@
 
 import math as _math
 
-from solid2 import *
-from solid2.extensions.bosl2 import *
+from components import cad
 
 from components.common import *
 
 from helpers import ivar
+from helpers.output import part
 
 
-set_global_fn (111)
+cad.set_global_fn (111)
 
 
 OVERLAP = 0.001
@@ -52,9 +52,9 @@ def spiral (radius, width, height, threads, direction, offset):
     revolutions = height / circumference / _math.tan (_math.radians (SPIRAL_SLOPE))
     # Generate spiral.
     step = 180 / threads
-    beams = [ rotate ((0, 0, step * thread + offset)) (square ([radius * 2, width], center = True)) for thread in range (threads) ]
-    footprint = union () (*beams)
-    result = linear_extrude (height, convexity = 8, twist = _math.copysign (360 * revolutions, direction), slices = height * 3) (footprint)
+    beams = [ cad.rotate ((0, 0, step * thread + offset)) (cad.square ([radius * 2, width], center = True)) for thread in range (threads) ]
+    footprint = cad.union () (*beams)
+    result = cad.linear_extrude (height, convexity = 8, twist = _math.copysign (360 * revolutions, direction), slices = height * 3) (footprint)
     # Whatever.
     return result
 
@@ -64,8 +64,8 @@ def spool ():
     rotated_height = SPOOL_EDGE / _math.cos (_math.radians (SPOOL_ANGLE))
     rotated_thickness = SPOOL_THICKNESS / _math.sin (_math.radians (SPOOL_ANGLE))
 
-    bottom_outer = cyl (r1 = SPOOL_RADIUS + SPOOL_EDGE, r2 = SPOOL_RADIUS, h = rotated_height, anchor = TOP)
-    bottom_inner = cyl (r1 = SPOOL_RADIUS + SPOOL_EDGE - rotated_thickness, r2 = SPOOL_RADIUS - rotated_thickness, h = rotated_height + 2*OVERLAP, anchor = TOP).up (OVERLAP)
+    bottom_outer = cad.cyl (r1 = SPOOL_RADIUS + SPOOL_EDGE, r2 = SPOOL_RADIUS, h = rotated_height, anchor = cad.TOP)
+    bottom_inner = cad.cyl (r1 = SPOOL_RADIUS + SPOOL_EDGE - rotated_thickness, r2 = SPOOL_RADIUS - rotated_thickness, h = rotated_height + 2*OVERLAP, anchor = cad.TOP).up (OVERLAP)
 
     bottom = bottom_outer - bottom_inner
 
@@ -77,7 +77,7 @@ def spool ():
 
     body_right = spiral (SPOOL_RADIUS, SPOOL_THICKNESS, SPOOL_LENGTH, SPIRAL_WINGS, -1, -offset)
     body_left = spiral (SPOOL_RADIUS, SPOOL_THICKNESS, SPOOL_LENGTH, SPIRAL_WINGS, +1, +offset)
-    body_hole = cyl (r = SPOOL_RADIUS - SPOOL_THICKNESS, h = SPOOL_LENGTH + 2*OVERLAP, anchor = BOTTOM)
+    body_hole = cad.cyl (r = SPOOL_RADIUS - SPOOL_THICKNESS, h = SPOOL_LENGTH + 2*OVERLAP, anchor = cad.BOTTOM)
 
     body = body_left + body_right - body_hole
 
@@ -88,28 +88,28 @@ def clasp (rows, shift):
 
     total_height = max (HOOK_CHAIN_DEPTH + HOOK_THICKNESS, ivar.PIN_RADIUS_SMALL*2 + ivar.PIN_DISTANCE_VERTICAL * (rows-1))
 
-    face_wall = cuboid ((ivar.STAND_WIDTH, HOOK_THICKNESS, total_height), anchor = RIGHT+BACK+BOTTOM)
-    side_wall = cuboid ((HOOK_THICKNESS, ivar.STAND_DEPTH + 2*HOOK_THICKNESS, total_height), anchor = LEFT+FRONT+BOTTOM).fwd (HOOK_THICKNESS)
-    back_wall = cuboid ((HOOK_CATCH_DEPTH, HOOK_THICKNESS, total_height), anchor = RIGHT+FRONT+BOTTOM).back (ivar.STAND_DEPTH)
+    face_wall = cad.cuboid ((ivar.STAND_WIDTH, HOOK_THICKNESS, total_height), anchor = cad.RIGHT+cad.BACK+cad.BOTTOM)
+    side_wall = cad.cuboid ((HOOK_THICKNESS, ivar.STAND_DEPTH + 2*HOOK_THICKNESS, total_height), anchor = cad.LEFT+cad.FRONT+cad.BOTTOM).fwd (HOOK_THICKNESS)
+    back_wall = cad.cuboid ((HOOK_CATCH_DEPTH, HOOK_THICKNESS, total_height), anchor = cad.RIGHT+cad.FRONT+cad.BOTTOM).back (ivar.STAND_DEPTH)
 
-    right_pin = cyl (h = HOOK_PIN_DEPTH_IN + HOOK_PIN_TIP, r = ivar.PIN_RADIUS_SMALL, chamfer2 = HOOK_PIN_TIP, anchor = BOTTOM+BACK, orient = BACK).left (shift + ivar.STAND_PIN_HOLE_TO_EDGE)
-    left_pin = cyl (h = HOOK_PIN_DEPTH_OUT + HOOK_PIN_TIP, r = ivar.PIN_RADIUS_SMALL, chamfer2 = HOOK_PIN_TIP, anchor = BOTTOM+BACK, orient = BACK).left (shift + ivar.STAND_PIN_HOLE_TO_EDGE + ivar.PIN_DISTANCE_HORIZONTAL)
+    right_pin = cad.cyl (h = HOOK_PIN_DEPTH_IN + HOOK_PIN_TIP, r = ivar.PIN_RADIUS_SMALL, chamfer2 = HOOK_PIN_TIP, anchor = cad.BOTTOM+cad.BACK, orient = cad.BACK).left (shift + ivar.STAND_PIN_HOLE_TO_EDGE)
+    left_pin = cad.cyl (h = HOOK_PIN_DEPTH_OUT + HOOK_PIN_TIP, r = ivar.PIN_RADIUS_SMALL, chamfer2 = HOOK_PIN_TIP, anchor = cad.BOTTOM+cad.BACK, orient = cad.BACK).left (shift + ivar.STAND_PIN_HOLE_TO_EDGE + ivar.PIN_DISTANCE_HORIZONTAL)
 
     pins = left_pin + right_pin
 
     pin_list = [ pins.up (ivar.PIN_DISTANCE_VERTICAL * row) for row in range (rows) ]
-    pin_rows = union () (*pin_list)
+    pin_rows = cad.union () (*pin_list)
 
     return face_wall + side_wall + back_wall + pin_rows
 
 
 def hook_chain (rows, shift):
 
-    front_base = cuboid ([ivar.STAND_WIDTH + HOOK_THICKNESS, HOOK_THICKNESS, HOOK_CHAIN_DEPTH], anchor = RIGHT+BACK+BOTTOM, rounding = HOOK_THICKNESS, edges = LEFT+FRONT).right (HOOK_THICKNESS)
-    rise_base = cyl (r = HOOK_CHAIN_RADIUS, h = HOOK_CHAIN_DEPTH, anchor = BOTTOM).left (HOOK_CHAIN_RADIUS - HOOK_THICKNESS).fwd (HOOK_THICKNESS + HOOK_CHAIN_GAP)
-    rise_pin = cyl (r = HOOK_CHAIN_RADIUS, h = HOOK_CHAIN_RISE + OVERLAP, anchor = BOTTOM).left (HOOK_CHAIN_RADIUS - HOOK_THICKNESS).fwd (HOOK_THICKNESS + HOOK_CHAIN_GAP).up (HOOK_CHAIN_DEPTH - OVERLAP)
+    front_base = cad.cuboid ([ivar.STAND_WIDTH + HOOK_THICKNESS, HOOK_THICKNESS, HOOK_CHAIN_DEPTH], anchor = cad.RIGHT+cad.BACK+cad.BOTTOM, rounding = HOOK_THICKNESS, edges = cad.LEFT+cad.FRONT).right (HOOK_THICKNESS)
+    rise_base = cad.cyl (r = HOOK_CHAIN_RADIUS, h = HOOK_CHAIN_DEPTH, anchor = cad.BOTTOM).left (HOOK_CHAIN_RADIUS - HOOK_THICKNESS).fwd (HOOK_THICKNESS + HOOK_CHAIN_GAP)
+    rise_pin = cad.cyl (r = HOOK_CHAIN_RADIUS, h = HOOK_CHAIN_RISE + OVERLAP, anchor = cad.BOTTOM).left (HOOK_CHAIN_RADIUS - HOOK_THICKNESS).fwd (HOOK_THICKNESS + HOOK_CHAIN_GAP).up (HOOK_CHAIN_DEPTH - OVERLAP)
 
-    hook = clasp (rows, shift) + hull () (front_base, rise_base) + rise_pin
+    hook = clasp (rows, shift) + cad.hull () (front_base, rise_base) + rise_pin
 
     return hook
 
@@ -122,30 +122,30 @@ def hook_pole (rows, shift):
     pole_angled_height = HOOK_POLE_DIAMETER * _math.cos (_math.radians (HOOK_POLE_ANGLE))
 
     lower_wall_base = (
-        cuboid ([ivar.STAND_WIDTH + HOOK_THICKNESS, HOOK_THICKNESS, hook_height + HOOK_POLE_RISE - HOOK_POLE_SINK], anchor = RIGHT+BACK+BOTTOM)
+        cad.cuboid ([ivar.STAND_WIDTH + HOOK_THICKNESS, HOOK_THICKNESS, hook_height + HOOK_POLE_RISE - HOOK_POLE_SINK], anchor = cad.RIGHT+cad.BACK+cad.BOTTOM)
         .right (HOOK_THICKNESS)
     )
 
     lower_pole_base = (
         (
-            cyl (d = HOOK_POLE_DIAMETER + 2*HOOK_THICKNESS, h = HOOK_POLE_LENGTH + HOOK_THICKNESS, anchor = BOTTOM)
+            cad.cyl (d = HOOK_POLE_DIAMETER + 2*HOOK_THICKNESS, h = HOOK_POLE_LENGTH + HOOK_THICKNESS, anchor = cad.BOTTOM)
             -
-            cuboid (
+            cad.cuboid (
                 [
                     HOOK_POLE_DIAMETER/2 + HOOK_THICKNESS + OVERLAP,
                     HOOK_POLE_DIAMETER + 2*HOOK_THICKNESS,
                     HOOK_POLE_LENGTH + HOOK_THICKNESS
                 ],
-                anchor = BOTTOM+RIGHT,
+                anchor = cad.BOTTOM+cad.RIGHT,
             )
             +
-            cuboid (
+            cad.cuboid (
                 [
                     HOOK_POLE_RISE,
                     HOOK_POLE_DIAMETER + 2*HOOK_THICKNESS,
                     HOOK_POLE_LENGTH + HOOK_THICKNESS
                 ],
-                anchor = BOTTOM+RIGHT,
+                anchor = cad.BOTTOM+cad.RIGHT,
             )
         )
         .rotate (0, 90, 0 - HOOK_POLE_ANGLE)
@@ -154,22 +154,22 @@ def hook_pole (rows, shift):
         .up (hook_height - HOOK_POLE_SINK)
     )
 
-    lower_base = hull () (lower_wall_base, lower_pole_base)
+    lower_base = cad.hull () (lower_wall_base, lower_pole_base)
 
     upper_wall_base = (
-        cuboid ([HOOK_THICKNESS, HOOK_THICKNESS, HOOK_POLE_SINK], anchor = RIGHT+BACK+TOP)
+        cad.cuboid ([HOOK_THICKNESS, HOOK_THICKNESS, HOOK_POLE_SINK], anchor = cad.RIGHT+cad.BACK+cad.TOP)
         .right (HOOK_THICKNESS)
         .up (hook_height)
     )
 
     upper_pole_base = (
-        cuboid (
+        cad.cuboid (
             [
                 HOOK_POLE_RISE,
                 HOOK_THICKNESS,
                 HOOK_POLE_LENGTH + HOOK_THICKNESS
             ],
-            anchor = BOTTOM+RIGHT+FRONT,
+            anchor = cad.BOTTOM+cad.RIGHT+cad.FRONT,
         )
         .back (HOOK_POLE_DIAMETER/2)
         .rotate (0, 90, 0 - HOOK_POLE_ANGLE)
@@ -178,19 +178,19 @@ def hook_pole (rows, shift):
         .up (hook_height - HOOK_POLE_SINK)
     )
 
-    upper_base = hull () (upper_wall_base, upper_pole_base)
+    upper_base = cad.hull () (upper_wall_base, upper_pole_base)
 
     pole = (
         (
-            cyl (d = HOOK_POLE_DIAMETER, h = HOOK_POLE_LENGTH + OVERLAP, anchor = BOTTOM)
+            cad.cyl (d = HOOK_POLE_DIAMETER, h = HOOK_POLE_LENGTH + OVERLAP, anchor = cad.BOTTOM)
             +
-            cuboid (
+            cad.cuboid (
                 [
                     HOOK_POLE_RISE + OVERLAP,
                     HOOK_POLE_DIAMETER,
                     HOOK_POLE_LENGTH + HOOK_THICKNESS
                 ],
-                anchor = BOTTOM+RIGHT,
+                anchor = cad.BOTTOM+cad.RIGHT,
             )
         )
         .up (HOOK_THICKNESS)
@@ -205,18 +205,18 @@ def hook_pole (rows, shift):
     return hook
 
 
-spool ().save_as_scad ('spool.scad')
+part ('spool.scad', spool)
 
-hook_chain (1, 0).save_as_scad ('hook-chain-one-zero.scad')
-hook_chain (1, 1).save_as_scad ('hook-chain-one-one.scad')
-hook_chain (1, 2).save_as_scad ('hook-chain-one-two.scad')
-hook_chain (2, 0).save_as_scad ('hook-chain-two-zero.scad')
-hook_chain (2, 1).save_as_scad ('hook-chain-two-one.scad')
-hook_chain (2, 2).save_as_scad ('hook-chain-two-two.scad')
+part ('hook-chain-one-zero.scad', hook_chain, 1, 0)
+part ('hook-chain-one-one.scad', hook_chain, 1, 1)
+part ('hook-chain-one-two.scad', hook_chain, 1, 2)
+part ('hook-chain-two-zero.scad', hook_chain, 2, 0)
+part ('hook-chain-two-one.scad', hook_chain, 2, 1)
+part ('hook-chain-two-two.scad', hook_chain, 2, 2)
 
-hook_pole (2, 0).save_as_scad ('hook-pole-two-zero.scad')
-hook_pole (2, 1).save_as_scad ('hook-pole-two-one.scad')
-hook_pole (2, 2).save_as_scad ('hook-pole-two-two.scad')
-hook_pole (3, 0).save_as_scad ('hook-pole-three-zero.scad')
-hook_pole (3, 1).save_as_scad ('hook-pole-three-one.scad')
-hook_pole (3, 2).save_as_scad ('hook-pole-three-two.scad')
+part ('hook-pole-two-zero.scad', hook_pole, 2, 0)
+part ('hook-pole-two-one.scad', hook_pole, 2, 1)
+part ('hook-pole-two-two.scad', hook_pole, 2, 2)
+part ('hook-pole-three-zero.scad', hook_pole, 3, 0)
+part ('hook-pole-three-one.scad', hook_pole, 3, 1)
+part ('hook-pole-three-two.scad', hook_pole, 3, 2)
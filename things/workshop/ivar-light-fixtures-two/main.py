@@ -2,10 +2,11 @@
 
 import math
 
-from solid import *
-from solid.utils import *
+from components import cad_legacy as cad
+from components.cache import memoized
 
 from helpers import ivar
+from helpers.output import part
 
 
 SEGMENTS = 111
@@ -77,57 +78,59 @@ LID_NOTCH_SIZE = 2
 LID_NOTCH_GAP = 2
 
 
+@memoized
 def pin (radius, thickness, length, taper_up, taper_down):
-    column = left (thickness/2) (cube ((thickness, radius, length)))
-    one = rotate ((0, 0, +120)) (column)
-    two = rotate ((0, 0, -120)) (column)
-    middle = cylinder (h = length, r = thickness/2)
-    body = union () (column, one, two, middle)
+    column = cad.left (thickness/2) (cad.cube ((thickness, radius, length)))
+    one = cad.rotate ((0, 0, +120)) (column)
+    two = cad.rotate ((0, 0, -120)) (column)
+    middle = cad.cylinder (h = length, r = thickness/2)
+    body = cad.union () (column, one, two, middle)
     if taper_up:
-        taper = cylinder (h = length, r1 = length + radius/2, r2 = radius/2)
+        taper = cad.cylinder (h = length, r1 = length + radius/2, r2 = radius/2)
         body *= taper
     if taper_down:
-        taper = cylinder (h = length, r1 = radius/2, r2 = length + radius/2)
+        taper = cad.cylinder (h = length, r1 = radius/2, r2 = length + radius/2)
         body *= taper
     return body
 
 
 def cylinder_along_x (length, thickness):
-    body = rotate ((0, 90, 0)) (cylinder (h = length, r = thickness/2))
+    body = cad.rotate ((0, 90, 0)) (cad.cylinder (h = length, r = thickness/2))
     return body
 
 
 def cylinder_along_y (length, thickness):
-    body = rotate ((-90, 0, 0)) (cylinder (h = length, r = thickness/2))
+    body = cad.rotate ((-90, 0, 0)) (cad.cylinder (h = length, r = thickness/2))
     return body
 
 
 def cylinder_along_z (length, thickness):
-    body = cylinder (h = length, r = thickness/2)
+    body = cad.cylinder (h = length, r = thickness/2)
     return body
 
 
 def thorn (radius, length):
-    body = cylinder (h = length, r1 = radius, r2 = 0)
+    body = cad.cylinder (h = length, r1 = radius, r2 = 0)
     return body
 
 
+@memoized
 def holder_profile_lock ():
 
-    lock_arc = intersection () (
-        cylinder (h = BODY_THICKNESS, r = PROFILE_SIZE),
-        cube ((PROFILE_SIZE, PROFILE_SIZE, BODY_THICKNESS)))
-    lock_pin = translate ((PROFILE_THICKNESS, PROFILE_THICKNESS, 0)) (intersection () (
-        cube ((PROFILE_NOTCH_SIZE, PROFILE_NOTCH_SIZE, PROFILE_NOTCH_DEPTH)),
-        rotate ((0, 0, 45))(cube ((PROFILE_NOTCH_SIZE * math.sqrt (2), PROFILE_NOTCH_SIZE * math.sqrt (2), PROFILE_NOTCH_DEPTH * 2), center = True))))
-    lock_bum = translate ((PROFILE_THICKNESS + PROFILE_NOTCH_SIZE/2, PROFILE_THICKNESS + PROFILE_NOTCH_SIZE/2, PROFILE_NOTCH_DEPTH/2)) (
+    lock_arc = cad.intersection () (
+        cad.cylinder (h = BODY_THICKNESS, r = PROFILE_SIZE),
+        cad.cube ((PROFILE_SIZE, PROFILE_SIZE, BODY_THICKNESS)))
+    lock_pin = cad.translate ((PROFILE_THICKNESS, PROFILE_THICKNESS, 0)) (cad.intersection () (
+        cad.cube ((PROFILE_NOTCH_SIZE, PROFILE_NOTCH_SIZE, PROFILE_NOTCH_DEPTH)),
+        cad.rotate ((0, 0, 45))(cad.cube ((PROFILE_NOTCH_SIZE * math.sqrt (2), PROFILE_NOTCH_SIZE * math.sqrt (2), PROFILE_NOTCH_DEPTH * 2), center = True))))
+    lock_bum = cad.translate ((PROFILE_THICKNESS + PROFILE_NOTCH_SIZE/2, PROFILE_THICKNESS + PROFILE_NOTCH_SIZE/2, PROFILE_NOTCH_DEPTH/2)) (
         cylinder_along_z (PROFILE_NOTCH_DEPTH/3, PROFILE_NOTCH_BUMP*2))
-    lock_rim = intersection () (
-        difference () (
-            cylinder (h = PROFILE_SHIELD_DEPTH, r = PROFILE_SHIELD_SIZE + PROFILE_SHIELD_THICKNESS),
-            cylinder (h = PROFILE_SHIELD_DEPTH + OVERLAP, r = PROFILE_SHIELD_SIZE)),
-        translate ((PROFILE_SHIELD_NOTCH, PROFILE_SHIELD_NOTCH, 0)) (
-            cube ((PROFILE_SIZE, PROFILE_SIZE, PROFILE_SHIELD_DEPTH))))
+    lock_rim = cad.intersection () (
+        cad.difference () (
+            cad.cylinder (h = PROFILE_SHIELD_DEPTH, r = PROFILE_SHIELD_SIZE + PROFILE_SHIELD_THICKNESS),
+            cad.cylinder (h = PROFILE_SHIELD_DEPTH + OVERLAP, r = PROFILE_SHIELD_SIZE)),
+        cad.translate ((PROFILE_SHIELD_NOTCH, PROFILE_SHIELD_NOTCH, 0)) (
+            cad.cube ((PROFILE_SIZE, PROFILE_SIZE, PROFILE_SHIELD_DEPTH))))
 
     lock = lock_arc + lock_pin + lock_bum + lock_rim
 
@@ -142,44 +145,44 @@ def holder_wire ():
     hook_width = ivar.STAND_PIN_HOLE_TO_EDGE + PIN_RADIUS
     hook_height = HOLDER_PIPE_SIZE + HOLDER_SHELF_HEIGHT + HOLDER_PIPE_SIZE
 
-    hook = union () (
-        translate ((0, 0, 0 - BODY_THICKNESS)) (
-            cube ((ivar.STAND_DEPTH, hook_height, BODY_THICKNESS))),
-        translate ((0 - BODY_THICKNESS, 0, 0)) (
-            cube ((BODY_THICKNESS, hook_height, hook_width))),
-        translate ((0 - BODY_THICKNESS, HOLDER_PIPE_SIZE + HOLDER_SHELF_HEIGHT, 0 - HOLDER_PIPE_SIZE)) (
-            cube ((BODY_THICKNESS + ivar.STAND_DEPTH + PROFILE_SIZE, BODY_THICKNESS, HOLDER_PIPE_SIZE))),
-        translate ((0 - BODY_THICKNESS, 0, 0 - BODY_THICKNESS)) (
-            cube ((BODY_THICKNESS + OVERLAP, hook_height, BODY_THICKNESS + OVERLAP))))
+    hook = cad.union () (
+        cad.translate ((0, 0, 0 - BODY_THICKNESS)) (
+            cad.cube ((ivar.STAND_DEPTH, hook_height, BODY_THICKNESS))),
+        cad.translate ((0 - BODY_THICKNESS, 0, 0)) (
+            cad.cube ((BODY_THICKNESS, hook_height, hook_width))),
+        cad.translate ((0 - BODY_THICKNESS, HOLDER_PIPE_SIZE + HOLDER_SHELF_HEIGHT, 0 - HOLDER_PIPE_SIZE)) (
+            cad.cube ((BODY_THICKNESS + ivar.STAND_DEPTH + PROFILE_SIZE, BODY_THICKNESS, HOLDER_PIPE_SIZE))),
+        cad.translate ((0 - BODY_THICKNESS, 0, 0 - BODY_THICKNESS)) (
+            cad.cube ((BODY_THICKNESS + OVERLAP, hook_height, BODY_THICKNESS + OVERLAP))))
 
     # Pierce hook side.
     hook_hole_size = PIN_RADIUS*2*PIERCING_SCALE
     hook_hole_offset = HOLDER_PIPE_SIZE + HOLDER_SHELF_HEIGHT - ivar.SHELF_PIERCING_TO_SURFACE
-    hook_hole = translate ((0 - BODY_THICKNESS - OVERLAP, hook_hole_offset, ivar.STAND_PIN_HOLE_TO_EDGE)) (
+    hook_hole = cad.translate ((0 - BODY_THICKNESS - OVERLAP, hook_hole_offset, ivar.STAND_PIN_HOLE_TO_EDGE)) (
         cylinder_along_x (BODY_THICKNESS + OVERLAP*2, hook_hole_size))
-    hook_slot_x = translate ((0 - BODY_THICKNESS - OVERLAP, 0 - OVERLAP, ivar.STAND_PIN_HOLE_TO_EDGE)) (
-        cube ((BODY_THICKNESS + OVERLAP*2, hook_hole_offset + hook_hole_size/2 + OVERLAP, ivar.STAND_WIDTH)))
-    hook_slot_y = translate ((0 - BODY_THICKNESS - OVERLAP, 0 - OVERLAP, ivar.STAND_PIN_HOLE_TO_EDGE - hook_hole_size/2)) (
-        cube ((BODY_THICKNESS + OVERLAP*2, hook_hole_offset + OVERLAP, ivar.STAND_WIDTH)))
+    hook_slot_x = cad.translate ((0 - BODY_THICKNESS - OVERLAP, 0 - OVERLAP, ivar.STAND_PIN_HOLE_TO_EDGE)) (
+        cad.cube ((BODY_THICKNESS + OVERLAP*2, hook_hole_offset + hook_hole_size/2 + OVERLAP, ivar.STAND_WIDTH)))
+    hook_slot_y = cad.translate ((0 - BODY_THICKNESS - OVERLAP, 0 - OVERLAP, ivar.STAND_PIN_HOLE_TO_EDGE - hook_hole_size/2)) (
+        cad.cube ((BODY_THICKNESS + OVERLAP*2, hook_hole_offset + OVERLAP, ivar.STAND_WIDTH)))
     hook -= hook_hole + hook_slot_x + hook_slot_y
 
     # Construct wire cap.
-    cap_lead = translate ((0 - BODY_THICKNESS, 0, 0)) (
-        cube ((BODY_THICKNESS + ivar.STAND_DEPTH, HOLDER_PIPE_SIZE, HOLDER_PIPE_SIZE)))
-    cap_wall = translate ((ivar.STAND_DEPTH, PROFILE_SIZE, 0)) (
-        cube ((PROFILE_SIZE, HOLDER_SHELF_HEIGHT + HOLDER_PIPE_SIZE - PROFILE_SIZE + OVERLAP, HOLDER_PIPE_SIZE)))
-    cap_arc = translate ((ivar.STAND_DEPTH, PROFILE_SIZE, 0)) (
-        rotate ((0, 0, -90)) (
-            intersection () (
-                cylinder (h = HOLDER_PIPE_SIZE, r = PROFILE_SIZE),
-                cube ((PROFILE_SIZE, PROFILE_SIZE, HOLDER_PIPE_SIZE)))))
+    cap_lead = cad.translate ((0 - BODY_THICKNESS, 0, 0)) (
+        cad.cube ((BODY_THICKNESS + ivar.STAND_DEPTH, HOLDER_PIPE_SIZE, HOLDER_PIPE_SIZE)))
+    cap_wall = cad.translate ((ivar.STAND_DEPTH, PROFILE_SIZE, 0)) (
+        cad.cube ((PROFILE_SIZE, HOLDER_SHELF_HEIGHT + HOLDER_PIPE_SIZE - PROFILE_SIZE + OVERLAP, HOLDER_PIPE_SIZE)))
+    cap_arc = cad.translate ((ivar.STAND_DEPTH, PROFILE_SIZE, 0)) (
+        cad.rotate ((0, 0, -90)) (
+            cad.intersection () (
+                cad.cylinder (h = HOLDER_PIPE_SIZE, r = PROFILE_SIZE),
+                cad.cube ((PROFILE_SIZE, PROFILE_SIZE, HOLDER_PIPE_SIZE)))))
     cap = cap_lead + cap_wall + cap_arc
 
-    body = union () (
-        mirror ((0, 0, 1)) (cap),
-        translate ((0, 0, 0)) (hook),
-        translate ((ivar.STAND_DEPTH, PROFILE_SIZE + PROFILE_OFFSET + HOLDER_PIPE_SIZE, 0 - BODY_THICKNESS - HOLDER_WIRE_SIZE)) (
-            rotate ((180, 0, 0)) (lock)))
+    body = cad.union () (
+        cad.mirror ((0, 0, 1)) (cap),
+        cad.translate ((0, 0, 0)) (hook),
+        cad.translate ((ivar.STAND_DEPTH, PROFILE_SIZE + PROFILE_OFFSET + HOLDER_PIPE_SIZE, 0 - BODY_THICKNESS - HOLDER_WIRE_SIZE)) (
+            cad.rotate ((180, 0, 0)) (lock)))
 
     # Construct wire hole.
     bore_helper_shared_x = ivar.STAND_DEPTH + PROFILE_HOLE_OFFSET
@@ -188,12 +191,12 @@ def holder_wire ():
     bore_helper_hole_y = HOLDER_PIPE_SIZE + PROFILE_OFFSET + PROFILE_SIZE - PROFILE_HOLE_OFFSET
     bore_helper_shared_z = 0 - BODY_THICKNESS - HOLDER_WIRE_SIZE/2
 
-    bore_side = translate ((0 - BODY_THICKNESS - OVERLAP, bore_helper_side_y, bore_helper_shared_z)) (cylinder_along_x (BODY_THICKNESS + ivar.STAND_DEPTH + OVERLAP*2, HOLDER_WIRE_SIZE))
-    bore_bent = translate ((ivar.STAND_DEPTH, bore_helper_turn_y, bore_helper_shared_z)) (rotate ((0, 0, -90)) (rotate_extrude (90) (translate ((PROFILE_HOLE_OFFSET, 0, 0)) (circle (HOLDER_WIRE_SIZE / 2)))))
-    bore_turn = translate ((bore_helper_shared_x, bore_helper_turn_y - OVERLAP, bore_helper_shared_z)) (cylinder_along_y (bore_helper_hole_y - bore_helper_turn_y + OVERLAP, HOLDER_WIRE_SIZE))
-    bore_lock = translate ((bore_helper_shared_x, bore_helper_hole_y, 0 - HOLDER_WIRE_SIZE - BODY_THICKNESS*2 - OVERLAP)) (cylinder_along_z (BODY_THICKNESS + HOLDER_WIRE_SIZE/2 + OVERLAP, HOLDER_WIRE_SIZE))
+    bore_side = cad.translate ((0 - BODY_THICKNESS - OVERLAP, bore_helper_side_y, bore_helper_shared_z)) (cylinder_along_x (BODY_THICKNESS + ivar.STAND_DEPTH + OVERLAP*2, HOLDER_WIRE_SIZE))
+    bore_bent = cad.translate ((ivar.STAND_DEPTH, bore_helper_turn_y, bore_helper_shared_z)) (cad.rotate ((0, 0, -90)) (cad.rotate_extrude (90) (cad.translate ((PROFILE_HOLE_OFFSET, 0, 0)) (cad.circle (HOLDER_WIRE_SIZE / 2)))))
+    bore_turn = cad.translate ((bore_helper_shared_x, bore_helper_turn_y - OVERLAP, bore_helper_shared_z)) (cylinder_along_y (bore_helper_hole_y - bore_helper_turn_y + OVERLAP, HOLDER_WIRE_SIZE))
+    bore_lock = cad.translate ((bore_helper_shared_x, bore_helper_hole_y, 0 - HOLDER_WIRE_SIZE - BODY_THICKNESS*2 - OVERLAP)) (cylinder_along_z (BODY_THICKNESS + HOLDER_WIRE_SIZE/2 + OVERLAP, HOLDER_WIRE_SIZE))
 
-    bore_ball_lock_turn = translate ((bore_helper_shared_x, bore_helper_hole_y, bore_helper_shared_z)) (sphere (HOLDER_WIRE_SIZE/2))
+    bore_ball_lock_turn = cad.translate ((bore_helper_shared_x, bore_helper_hole_y, bore_helper_shared_z)) (cad.sphere (HOLDER_WIRE_SIZE/2))
 
     body -= bore_lock + bore_ball_lock_turn + bore_turn + bore_bent + bore_side
 
@@ -208,15 +211,15 @@ def holder_bent ():
     cap_lead_length = BODY_THICKNESS + ivar.STAND_DEPTH
     cap_lead_height = PROFILE_HOLE_OFFSET + HOLDER_WIRE_SIZE / 2 + BODY_THICKNESS
 
-    cap_lead_body = cube ((cap_lead_length, cap_lead_height, HOLDER_PIPE_SIZE))
+    cap_lead_body = cad.cube ((cap_lead_length, cap_lead_height, HOLDER_PIPE_SIZE))
 
-    cap_arc_body = cylinder (h = HOLDER_PIPE_SIZE, r = PROFILE_SIZE)
-    cap_arc_body *= cube ((PROFILE_SIZE, PROFILE_SIZE, HOLDER_PIPE_SIZE))
-    cap_arc_body += translate ((0, 0, HOLDER_PIPE_SIZE - BODY_THICKNESS)) (lock)
+    cap_arc_body = cad.cylinder (h = HOLDER_PIPE_SIZE, r = PROFILE_SIZE)
+    cap_arc_body *= cad.cube ((PROFILE_SIZE, PROFILE_SIZE, HOLDER_PIPE_SIZE))
+    cap_arc_body += cad.translate ((0, 0, HOLDER_PIPE_SIZE - BODY_THICKNESS)) (lock)
 
-    cap_lead_body = translate ((0 - BODY_THICKNESS, 0, 0)) (cap_lead_body)
-    cap_arc_body = rotate ((0, -45, 180)) (cap_arc_body)
-    cap_arc_body = translate ((ivar.STAND_DEPTH, cap_lead_height, 0)) (cap_arc_body)
+    cap_lead_body = cad.translate ((0 - BODY_THICKNESS, 0, 0)) (cap_lead_body)
+    cap_arc_body = cad.rotate ((0, -45, 180)) (cap_arc_body)
+    cap_arc_body = cad.translate ((ivar.STAND_DEPTH, cap_lead_height, 0)) (cap_arc_body)
     cap = cap_lead_body + cap_arc_body
 
     # Pierce wire cap.
@@ -230,44 +233,44 @@ def holder_bent ():
     cap_arc_ball_offset = ivar.STAND_DEPTH + cap_arc_ball_delta_x
 
     cap_lead_hole = cylinder_along_x (BODY_THICKNESS + cap_arc_ball_offset + OVERLAP, HOLDER_WIRE_SIZE)
-    cap_lead_hole = translate ((0 - BODY_THICKNESS - OVERLAP, cap_arc_ball_to_side, cap_arc_ball_to_side)) (cap_lead_hole)
+    cap_lead_hole = cad.translate ((0 - BODY_THICKNESS - OVERLAP, cap_arc_ball_to_side, cap_arc_ball_to_side)) (cap_lead_hole)
     cap -= cap_lead_hole
 
     cap_arc_hole = cylinder_along_z (cap_arc_hole_depth + OVERLAP, HOLDER_WIRE_SIZE)
-    cap_arc_hole = translate ((0, 0, HOLDER_PIPE_SIZE - cap_arc_hole_depth + OVERLAP)) (cap_arc_hole)
-    cap_arc_hole = translate ((0 - PROFILE_HOLE_OFFSET, 0 - PROFILE_HOLE_OFFSET, 0)) (cap_arc_hole)
-    cap_arc_hole = rotate ((0, 45, 0)) (cap_arc_hole)
-    cap_arc_hole = translate ((ivar.STAND_DEPTH, cap_lead_height, 0)) (cap_arc_hole)
+    cap_arc_hole = cad.translate ((0, 0, HOLDER_PIPE_SIZE - cap_arc_hole_depth + OVERLAP)) (cap_arc_hole)
+    cap_arc_hole = cad.translate ((0 - PROFILE_HOLE_OFFSET, 0 - PROFILE_HOLE_OFFSET, 0)) (cap_arc_hole)
+    cap_arc_hole = cad.rotate ((0, 45, 0)) (cap_arc_hole)
+    cap_arc_hole = cad.translate ((ivar.STAND_DEPTH, cap_lead_height, 0)) (cap_arc_hole)
     cap -= cap_arc_hole
 
-    cap_arc_ball = translate ((cap_arc_ball_offset, cap_arc_ball_to_side, cap_arc_ball_to_side)) (sphere (HOLDER_WIRE_SIZE/2))
+    cap_arc_ball = cad.translate ((cap_arc_ball_offset, cap_arc_ball_to_side, cap_arc_ball_to_side)) (cad.sphere (HOLDER_WIRE_SIZE/2))
     cap -= cap_arc_ball
 
-    cap = mirror ((0, 0, 1)) (cap)
+    cap = cad.mirror ((0, 0, 1)) (cap)
 
     # Construct shelf hook.
     hook_width = ivar.STAND_PIN_HOLE_TO_EDGE + PIN_RADIUS
     hook_height = cap_lead_height + HOLDER_SHELF_HEIGHT + HOLDER_PIPE_SIZE
 
-    hook = union () (
-        translate ((0, 0, 0 - BODY_THICKNESS)) (
-            cube ((ivar.STAND_DEPTH, hook_height, BODY_THICKNESS))),
-        translate ((0 - BODY_THICKNESS, 0, 0)) (
-            cube ((BODY_THICKNESS, hook_height, hook_width))),
-        translate ((0 - BODY_THICKNESS, cap_lead_height + HOLDER_SHELF_HEIGHT, 0 - HOLDER_PIPE_SIZE)) (
-            cube ((BODY_THICKNESS + ivar.STAND_DEPTH, BODY_THICKNESS, HOLDER_PIPE_SIZE))),
-        translate ((0 - BODY_THICKNESS, 0, 0 - BODY_THICKNESS)) (
-            cube ((BODY_THICKNESS + OVERLAP, hook_height, BODY_THICKNESS + OVERLAP))))
+    hook = cad.union () (
+        cad.translate ((0, 0, 0 - BODY_THICKNESS)) (
+            cad.cube ((ivar.STAND_DEPTH, hook_height, BODY_THICKNESS))),
+        cad.translate ((0 - BODY_THICKNESS, 0, 0)) (
+            cad.cube ((BODY_THICKNESS, hook_height, hook_width))),
+        cad.translate ((0 - BODY_THICKNESS, cap_lead_height + HOLDER_SHELF_HEIGHT, 0 - HOLDER_PIPE_SIZE)) (
+            cad.cube ((BODY_THICKNESS + ivar.STAND_DEPTH, BODY_THICKNESS, HOLDER_PIPE_SIZE))),
+        cad.translate ((0 - BODY_THICKNESS, 0, 0 - BODY_THICKNESS)) (
+            cad.cube ((BODY_THICKNESS + OVERLAP, hook_height, BODY_THICKNESS + OVERLAP))))
 
     # Pierce hook side.
     hook_hole_size = PIN_RADIUS*2*PIERCING_SCALE
     hook_hole_offset = HOLDER_PIPE_SIZE + HOLDER_SHELF_HEIGHT - ivar.SHELF_PIERCING_TO_SURFACE
-    hook_hole = translate ((0 - BODY_THICKNESS - OVERLAP, hook_hole_offset, ivar.STAND_PIN_HOLE_TO_EDGE)) (
+    hook_hole = cad.translate ((0 - BODY_THICKNESS - OVERLAP, hook_hole_offset, ivar.STAND_PIN_HOLE_TO_EDGE)) (
         cylinder_along_x (BODY_THICKNESS + OVERLAP*2, hook_hole_size))
-    hook_slot_x = translate ((0 - BODY_THICKNESS - OVERLAP, 0 - OVERLAP, ivar.STAND_PIN_HOLE_TO_EDGE)) (
-        cube ((BODY_THICKNESS + OVERLAP*2, hook_hole_offset + hook_hole_size/2 + OVERLAP, ivar.STAND_WIDTH)))
-    hook_slot_y = translate ((0 - BODY_THICKNESS - OVERLAP, 0 - OVERLAP, ivar.STAND_PIN_HOLE_TO_EDGE - hook_hole_size/2)) (
-        cube ((BODY_THICKNESS + OVERLAP*2, hook_hole_offset + OVERLAP, ivar.STAND_WIDTH)))
+    hook_slot_x = cad.translate ((0 - BODY_THICKNESS - OVERLAP, 0 - OVERLAP, ivar.STAND_PIN_HOLE_TO_EDGE)) (
+        cad.cube ((BODY_THICKNESS + OVERLAP*2, hook_hole_offset + hook_hole_size/2 + OVERLAP, ivar.STAND_WIDTH)))
+    hook_slot_y = cad.translate ((0 - BODY_THICKNESS - OVERLAP, 0 - OVERLAP, ivar.STAND_PIN_HOLE_TO_EDGE - hook_hole_size/2)) (
+        cad.cube ((BODY_THICKNESS + OVERLAP*2, hook_hole_offset + OVERLAP, ivar.STAND_WIDTH)))
     hook -= hook_hole + hook_slot_x + hook_slot_y
 
     return hook + cap
@@ -279,20 +282,20 @@ def holder_bent ():
 # But the layers may also peel off when inserted.
 
 def holder_pin_circular ():
-    stalk = up (BODY_THICKNESS) (pin (PIN_RADIUS, PIN_THICKNESS, ivar.PIN_LENGTH + BODY_THICKNESS, True, False))
-    hat = cylinder (h = BODY_THICKNESS + OVERLAP, r = PIN_HAT)
+    stalk = cad.up (BODY_THICKNESS) (pin (PIN_RADIUS, PIN_THICKNESS, ivar.PIN_LENGTH + BODY_THICKNESS, True, False))
+    hat = cad.cylinder (h = BODY_THICKNESS + OVERLAP, r = PIN_HAT)
     return stalk + hat
 
 
 def holder_pin_square ():
-    stalk = up (BODY_THICKNESS) (pin (PIN_RADIUS, PIN_THICKNESS, ivar.PIN_LENGTH + BODY_THICKNESS, True, False))
-    hat = up ((BODY_THICKNESS + OVERLAP) / 2) (cube ((2 * PIN_HAT, 2 * PIN_RADIUS, BODY_THICKNESS + OVERLAP), center = True))
+    stalk = cad.up (BODY_THICKNESS) (pin (PIN_RADIUS, PIN_THICKNESS, ivar.PIN_LENGTH + BODY_THICKNESS, True, False))
+    hat = cad.up ((BODY_THICKNESS + OVERLAP) / 2) (cad.cube ((2 * PIN_HAT, 2 * PIN_RADIUS, BODY_THICKNESS + OVERLAP), center = True))
     return stalk + hat
 
 
 def holder_pin_module ():
 
-    stalk = translate ((ivar.PIN_DISTANCE_HORIZONTAL/2, 0, 0)) (pin (PIN_RADIUS, PIN_THICKNESS, ivar.PIN_LENGTH, True, False))
+    stalk = cad.translate ((ivar.PIN_DISTANCE_HORIZONTAL/2, 0, 0)) (pin (PIN_RADIUS, PIN_THICKNESS, ivar.PIN_LENGTH, True, False))
 
     inner_x_bottom = MODULE_WIDTH_BOTTOM/2
     inner_y_bottom = BODY_THICKNESS
@@ -303,86 +306,88 @@ def holder_pin_module ():
     outer_x_top = inner_x_top + BODY_THICKNESS
     outer_y_top = inner_y_top + BODY_THICKNESS
 
-    sketch = polygon (
+    sketch = cad.polygon (
         [
             (0, outer_y_bottom), (outer_x_bottom, outer_y_bottom), (outer_x_top, outer_y_top), (0, outer_y_top),
             (0, inner_y_bottom), (inner_x_bottom, inner_y_bottom), (inner_x_top, inner_y_top), (0, inner_y_top),
         ],
         [[0, 1, 2, 3], [4, 5, 6, 7]])
-    wrap = linear_extrude (2 * PIN_RADIUS) (sketch)
-    wrap = rotate ((-90, 0, 0)) (wrap)
-    wrap = translate ((0, 0 - PIN_RADIUS, 0)) (wrap)
+    wrap = cad.linear_extrude (2 * PIN_RADIUS) (sketch)
+    wrap = cad.rotate ((-90, 0, 0)) (wrap)
+    wrap = cad.translate ((0, 0 - PIN_RADIUS, 0)) (wrap)
 
     half = stalk + wrap
-    twin = mirror ((1, 0, 0)) (half)
+    twin = cad.mirror ((1, 0, 0)) (half)
 
     return half + twin
 
 
+@memoized
 def box_lid_notches (offset, gap):
 
     side = LID_NOTCH_SIZE + gap
     height = BODY_THICKNESS + LID_NOTCH_DEPTH + gap
 
-    notch_l = translate ((0, - side/2, - side/2)) (cube ((height, side, side)))
-    notch_r = mirror ((1, 0, 0)) (notch_l)
-    notch_b = translate ((- side/2, 0, - side/2)) (cube ((side, height, side)))
-    notch_t = mirror ((0, 1, 0)) (notch_b)
+    notch_l = cad.translate ((0, - side/2, - side/2)) (cad.cube ((height, side, side)))
+    notch_r = cad.mirror ((1, 0, 0)) (notch_l)
+    notch_b = cad.translate ((- side/2, 0, - side/2)) (cad.cube ((side, height, side)))
+    notch_t = cad.mirror ((0, 1, 0)) (notch_b)
 
-    notches = union () (
+    notches = cad.union () (
         # Left side.
-        translate ((offset, WIRE_BOX_LENGTH * 1/4, 0)) (notch_l),
-        translate ((offset, WIRE_BOX_LENGTH * 3/4, 0)) (notch_l),
+        cad.translate ((offset, WIRE_BOX_LENGTH * 1/4, 0)) (notch_l),
+        cad.translate ((offset, WIRE_BOX_LENGTH * 3/4, 0)) (notch_l),
         # Right side.
-        translate ((ivar.STAND_WIDTH - offset, WIRE_BOX_LENGTH * 1/4, 0)) (notch_r),
-        translate ((ivar.STAND_WIDTH - offset, WIRE_BOX_LENGTH * 3/4, 0)) (notch_r),
+        cad.translate ((ivar.STAND_WIDTH - offset, WIRE_BOX_LENGTH * 1/4, 0)) (notch_r),
+        cad.translate ((ivar.STAND_WIDTH - offset, WIRE_BOX_LENGTH * 3/4, 0)) (notch_r),
         # Bottom side.
-        translate ((ivar.STAND_WIDTH * 1/4, offset, 0)) (notch_b),
-        translate ((ivar.STAND_WIDTH * 3/4, offset, 0)) (notch_b),
+        cad.translate ((ivar.STAND_WIDTH * 1/4, offset, 0)) (notch_b),
+        cad.translate ((ivar.STAND_WIDTH * 3/4, offset, 0)) (notch_b),
         # Top side.
-        translate ((ivar.STAND_WIDTH * 1/4, WIRE_BOX_LENGTH - offset, 0)) (notch_t),
-        translate ((ivar.STAND_WIDTH * 3/4, WIRE_BOX_LENGTH - offset, 0)) (notch_t))
+        cad.translate ((ivar.STAND_WIDTH * 1/4, WIRE_BOX_LENGTH - offset, 0)) (notch_t),
+        cad.translate ((ivar.STAND_WIDTH * 3/4, WIRE_BOX_LENGTH - offset, 0)) (notch_t))
 
     return notches
 
 
+@memoized
 def wire_box ():
 
-    base = translate ((0, 0 - WIRE_CATCH_LENGTH, 0)) (
-        cube ((ivar.STAND_WIDTH, WIRE_BOX_LENGTH + WIRE_CATCH_LENGTH, BODY_THICKNESS)))
+    base = cad.translate ((0, 0 - WIRE_CATCH_LENGTH, 0)) (
+        cad.cube ((ivar.STAND_WIDTH, WIRE_BOX_LENGTH + WIRE_CATCH_LENGTH, BODY_THICKNESS)))
 
-    catch_pin = translate ((WIRE_PIN_POS, - WIRE_PIN_POS, 0)) (
-        cylinder (h = BODY_THICKNESS + WIRE_PIN_HEIGHT + OVERLAP, r = WIRE_PIN_SIZE/2))
+    catch_pin = cad.translate ((WIRE_PIN_POS, - WIRE_PIN_POS, 0)) (
+        cad.cylinder (h = BODY_THICKNESS + WIRE_PIN_HEIGHT + OVERLAP, r = WIRE_PIN_SIZE/2))
     base += catch_pin
 
-    catch_wall = translate ((WIRE_CATCH_POS, - WIRE_CATCH_LENGTH, 0)) (
-        cube ((ivar.STAND_WIDTH - WIRE_CATCH_POS, WIRE_CATCH_LENGTH, BODY_THICKNESS + WIRE_CATCH_HEIGHT)))
+    catch_wall = cad.translate ((WIRE_CATCH_POS, - WIRE_CATCH_LENGTH, 0)) (
+        cad.cube ((ivar.STAND_WIDTH - WIRE_CATCH_POS, WIRE_CATCH_LENGTH, BODY_THICKNESS + WIRE_CATCH_HEIGHT)))
     base += catch_wall
 
-    body = difference () (
-        translate ((0, 0, 0)) (cube ((ivar.STAND_WIDTH, WIRE_BOX_LENGTH, WIRE_BOX_HEIGHT - BODY_THICKNESS))),
-        translate ((BODY_THICKNESS, BODY_THICKNESS, - OVERLAP)) (cube ((ivar.STAND_WIDTH - 2 * BODY_THICKNESS, WIRE_BOX_LENGTH - 2 * BODY_THICKNESS, WIRE_BOX_HEIGHT + 2 * OVERLAP))))
+    body = cad.difference () (
+        cad.translate ((0, 0, 0)) (cad.cube ((ivar.STAND_WIDTH, WIRE_BOX_LENGTH, WIRE_BOX_HEIGHT - BODY_THICKNESS))),
+        cad.translate ((BODY_THICKNESS, BODY_THICKNESS, - OVERLAP)) (cad.cube ((ivar.STAND_WIDTH - 2 * BODY_THICKNESS, WIRE_BOX_LENGTH - 2 * BODY_THICKNESS, WIRE_BOX_HEIGHT + 2 * OVERLAP))))
     base += body
 
     # Holes for holding the box.
     piercing_offset_x = ivar.STAND_WIDTH/2 - ivar.STAND_PIN_HOLE_TO_EDGE
     piercing_offset_y = ivar.PIN_DISTANCE_VERTICAL - (MODULE_LENGTH % ivar.PIN_DISTANCE_VERTICAL) / 2
-    piercing_base = translate ((ivar.STAND_WIDTH/2, piercing_offset_y, 0 - OVERLAP)) (
-        scale ((PIERCING_SCALE, PIERCING_SCALE, 1)) (
+    piercing_base = cad.translate ((ivar.STAND_WIDTH/2, piercing_offset_y, 0 - OVERLAP)) (
+        cad.scale ((PIERCING_SCALE, PIERCING_SCALE, 1)) (
             pin (PIN_RADIUS, PIN_THICKNESS, ivar.PIN_LENGTH, True, False)))
-    piercing_one = translate ((0 + piercing_offset_x, 0, 0)) (piercing_base)
-    piercing_two = translate ((0 - piercing_offset_x, 0, 0)) (piercing_base)
+    piercing_one = cad.translate ((0 + piercing_offset_x, 0, 0)) (piercing_base)
+    piercing_two = cad.translate ((0 - piercing_offset_x, 0, 0)) (piercing_base)
     base -= piercing_one + piercing_two
 
     # Holes for power supply wires.
-    hole_lo_one = translate ((WIRE_HOLE_ONE_POS, -OVERLAP, BODY_THICKNESS + WIRE_HOLE_HEIGHT)) (
+    hole_lo_one = cad.translate ((WIRE_HOLE_ONE_POS, -OVERLAP, BODY_THICKNESS + WIRE_HOLE_HEIGHT)) (
         cylinder_along_y (BODY_THICKNESS + 2*OVERLAP, WIRE_HOLE_SIZE))
-    hole_lo_two = translate ((WIRE_HOLE_TWO_POS, -OVERLAP, BODY_THICKNESS + WIRE_HOLE_HEIGHT)) (
+    hole_lo_two = cad.translate ((WIRE_HOLE_TWO_POS, -OVERLAP, BODY_THICKNESS + WIRE_HOLE_HEIGHT)) (
         cylinder_along_y (BODY_THICKNESS + 2*OVERLAP, WIRE_HOLE_SIZE))
     base -= hole_lo_one + hole_lo_two
 
     # Notches for holding the lid.
-    notches = translate ((0, 0, WIRE_BOX_HEIGHT - BODY_THICKNESS - LID_NOTCH_GAP - LID_NOTCH_SIZE / 2)) (
+    notches = cad.translate ((0, 0, WIRE_BOX_HEIGHT - BODY_THICKNESS - LID_NOTCH_GAP - LID_NOTCH_SIZE / 2)) (
         box_lid_notches (0, 0))
     base += notches
 
@@ -394,16 +399,16 @@ def wire_box_lo_power ():
     box = wire_box ()
 
     hole_offset_x = (WIRE_LIGHT_HOLE_SIZE - WIRE_LIGHT_HOLE_OVERLAP)/2
-    hole_base = translate ((ivar.STAND_WIDTH/2, WIRE_BOX_LENGTH - BODY_THICKNESS - OVERLAP, BODY_THICKNESS + WIRE_LIGHT_HOLE_SIZE/2)) (
+    hole_base = cad.translate ((ivar.STAND_WIDTH/2, WIRE_BOX_LENGTH - BODY_THICKNESS - OVERLAP, BODY_THICKNESS + WIRE_LIGHT_HOLE_SIZE/2)) (
         cylinder_along_y (BODY_THICKNESS + OVERLAP*2, WIRE_LIGHT_HOLE_SIZE))
-    hole_one = translate ((0 + hole_offset_x, 0, 0)) (hole_base)
-    hole_two = translate ((0 - hole_offset_x, 0, 0)) (hole_base)
+    hole_one = cad.translate ((0 + hole_offset_x, 0, 0)) (hole_base)
+    hole_two = cad.translate ((0 - hole_offset_x, 0, 0)) (hole_base)
     box -= hole_one + hole_two
 
     pin_offset_x = WIRE_LIGHT_HOLE_SIZE/2 * WIRE_SQUEEZE_SCALE + WIRE_SQUEEZE_SIZE/2
-    pin_base = translate ((ivar.STAND_WIDTH/2, WIRE_BOX_LENGTH*3/4, 0)) (cylinder_along_z (BODY_THICKNESS + WIRE_LIGHT_HOLE_SIZE*3, WIRE_SQUEEZE_SIZE))
-    pin_one = translate ((0 + pin_offset_x, 0, 0)) (pin_base)
-    pin_two = translate ((0 - pin_offset_x, 0, 0)) (pin_base)
+    pin_base = cad.translate ((ivar.STAND_WIDTH/2, WIRE_BOX_LENGTH*3/4, 0)) (cylinder_along_z (BODY_THICKNESS + WIRE_LIGHT_HOLE_SIZE*3, WIRE_SQUEEZE_SIZE))
+    pin_one = cad.translate ((0 + pin_offset_x, 0, 0)) (pin_base)
+    pin_two = cad.translate ((0 - pin_offset_x, 0, 0)) (pin_base)
     box += pin_one + pin_two
 
     return box
@@ -413,14 +418,14 @@ def wire_box_hi_power():
 
     box = wire_box()
 
-    hole = translate ((BODY_THICKNESS + WIRE_POWER_HOLE_SIZE/2, WIRE_BOX_LENGTH - BODY_THICKNESS - OVERLAP, BODY_THICKNESS + WIRE_POWER_HOLE_SIZE/2)) (
+    hole = cad.translate ((BODY_THICKNESS + WIRE_POWER_HOLE_SIZE/2, WIRE_BOX_LENGTH - BODY_THICKNESS - OVERLAP, BODY_THICKNESS + WIRE_POWER_HOLE_SIZE/2)) (
         cylinder_along_y (BODY_THICKNESS + OVERLAP*2, WIRE_POWER_HOLE_SIZE))
     box -= hole
 
     pin_offset_x = WIRE_POWER_HOLE_SIZE/2 * WIRE_SQUEEZE_SCALE + WIRE_SQUEEZE_SIZE/2
-    pin_base = translate ((ivar.STAND_WIDTH/2, WIRE_BOX_LENGTH*3/4, 0)) (cylinder_along_z (BODY_THICKNESS + WIRE_POWER_HOLE_SIZE*3/2, WIRE_SQUEEZE_SIZE))
-    pin_one = translate ((0 + pin_offset_x, 0, 0)) (pin_base)
-    pin_two = translate ((0 - pin_offset_x, 0, 0)) (pin_base)
+    pin_base = cad.translate ((ivar.STAND_WIDTH/2, WIRE_BOX_LENGTH*3/4, 0)) (cylinder_along_z (BODY_THICKNESS + WIRE_POWER_HOLE_SIZE*3/2, WIRE_SQUEEZE_SIZE))
+    pin_one = cad.translate ((0 + pin_offset_x, 0, 0)) (pin_base)
+    pin_two = cad.translate ((0 - pin_offset_x, 0, 0)) (pin_base)
     box += pin_one + pin_two
 
     return box
@@ -428,28 +433,28 @@ def wire_box_hi_power():
 
 def wire_lid ():
 
-    base = translate ((0, 0 - WIRE_CATCH_LENGTH, 0)) (
-        cube ((ivar.STAND_WIDTH, WIRE_BOX_LENGTH + WIRE_CATCH_LENGTH, BODY_THICKNESS)))
+    base = cad.translate ((0, 0 - WIRE_CATCH_LENGTH, 0)) (
+        cad.cube ((ivar.STAND_WIDTH, WIRE_BOX_LENGTH + WIRE_CATCH_LENGTH, BODY_THICKNESS)))
 
-    rim = difference () (
-        translate ((BODY_THICKNESS + LID_SLACK, BODY_THICKNESS + LID_SLACK, 0)) (
-            cube ((ivar.STAND_WIDTH - 2*BODY_THICKNESS - 2*LID_SLACK, WIRE_BOX_LENGTH - 2*BODY_THICKNESS - 2*LID_SLACK, BODY_THICKNESS + 2*LID_NOTCH_GAP + LID_NOTCH_SIZE + LID_SLACK))),
-        translate ((2*BODY_THICKNESS + LID_SLACK, 2*BODY_THICKNESS + LID_SLACK, - OVERLAP)) (
-            cube ((ivar.STAND_WIDTH - 4*BODY_THICKNESS - 2*LID_SLACK, WIRE_BOX_LENGTH - 4*BODY_THICKNESS - 2*LID_SLACK, BODY_THICKNESS + 2*LID_NOTCH_GAP + LID_NOTCH_SIZE + LID_SLACK + 2*OVERLAP))))
+    rim = cad.difference () (
+        cad.translate ((BODY_THICKNESS + LID_SLACK, BODY_THICKNESS + LID_SLACK, 0)) (
+            cad.cube ((ivar.STAND_WIDTH - 2*BODY_THICKNESS - 2*LID_SLACK, WIRE_BOX_LENGTH - 2*BODY_THICKNESS - 2*LID_SLACK, BODY_THICKNESS + 2*LID_NOTCH_GAP + LID_NOTCH_SIZE + LID_SLACK))),
+        cad.translate ((2*BODY_THICKNESS + LID_SLACK, 2*BODY_THICKNESS + LID_SLACK, - OVERLAP)) (
+            cad.cube ((ivar.STAND_WIDTH - 4*BODY_THICKNESS - 2*LID_SLACK, WIRE_BOX_LENGTH - 4*BODY_THICKNESS - 2*LID_SLACK, BODY_THICKNESS + 2*LID_NOTCH_GAP + LID_NOTCH_SIZE + LID_SLACK + 2*OVERLAP))))
     base += rim
 
-    notches = translate ((0, 0, BODY_THICKNESS + LID_NOTCH_GAP + LID_NOTCH_SIZE/2 + LID_SLACK)) (
+    notches = cad.translate ((0, 0, BODY_THICKNESS + LID_NOTCH_GAP + LID_NOTCH_SIZE/2 + LID_SLACK)) (
         box_lid_notches (LID_SLACK, LID_SLACK))
     base -= notches
 
     return base
 
 
-scad_render_to_file (holder_wire (), 'holder_wire.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (holder_bent (), 'holder_bent.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (wire_box_hi_power (), 'wire_box_hi_power.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (wire_box_lo_power (), 'wire_box_lo_power.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (wire_lid (), 'wire_lid.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (holder_pin_module (), 'holder_pin_module.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (holder_pin_square (), 'holder_pin_square.scad', file_header = f'$fn = {SEGMENTS};')
-scad_render_to_file (holder_pin_circular (), 'holder_pin_circular.scad', file_header = f'$fn = {SEGMENTS};')
+part ('holder_wire.scad', holder_wire, file_header = f'$fn = {SEGMENTS};')
+part ('holder_bent.scad', holder_bent, file_header = f'$fn = {SEGMENTS};')
+part ('wire_box_hi_power.scad', wire_box_hi_power, file_header = f'$fn = {SEGMENTS};')
+part ('wire_box_lo_power.scad', wire_box_lo_power, file_header = f'$fn = {SEGMENTS};')
+part ('wire_lid.scad', wire_lid, file_header = f'$fn = {SEGMENTS};')
+part ('holder_pin_module.scad', holder_pin_module, file_header = f'$fn = {SEGMENTS};')
+part ('holder_pin_square.scad', holder_pin_square, file_header = f'$fn = {SEGMENTS};')
+part ('holder_pin_circular.scad', holder_pin_circular, file_header = f'$fn = {SEGMENTS};')
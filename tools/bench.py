@@ -0,0 +1,158 @@
+import argparse as _argparse
+import concurrent.futures as _futures
+import json as _json
+import os as _os
+import pathlib as _pathlib
+import shutil as _shutil
+import statistics as _statistics
+import subprocess as _subprocess
+import sys as _sys
+import tempfile as _tempfile
+import time as _time
+
+from helpers import output as _output
+from tools import build as _build
+from tools import model as _model
+from tools import render as _render
+
+
+BASELINE_FILE = _model.ROOT_PATH / '.bench-baseline.json'
+
+# Relative slowdown reported as a regression.
+THRESHOLD = 0.2
+
+# Differences below this many seconds are noise whatever the ratio.
+MINIMUM_DIFFERENCE = 0.005
+
+# Files the model sources may reference, everything else is generated.
+IGNORED_FILES = [ '*.py', '*.scad', '*.stl', '*.3mf', '*.off', '*.amf', '.*', '__pycache__' ]
+
+
+def _openscad_time (source):
+    start = _time.perf_counter ()
+    try:
+        process = _subprocess.run ([ _render.OPENSCAD, '-o', str (source.with_suffix ('.stl')), str (source) ], capture_output = True)
+    except OSError:
+        return None
+    return _time.perf_counter () - start if process.returncode == 0 else None
+
+
+def _cold_time (model, directory):
+
+    # A fresh interpreter, as when a model runs on its own,
+    # measures the import cost the warm workers hide.
+
+    environment = { **_os.environ, 'PYTHONPATH': str (_model.ROOT_PATH) }
+    start = _time.perf_counter ()
+    process = _subprocess.run ([ _sys.executable, '-m', _model.model_module (model) ], cwd = directory, env = environment, capture_output = True)
+    return _time.perf_counter () - start if process.returncode == 0 else None
+
+
+def measure (pool, model, repetitions, openscad, cold):
+
+    # The outputs go to a scratch directory, with copies of the files
+    # the generated sources may reference, so the tree stays untouched.
+
+    with _tempfile.TemporaryDirectory () as directory:
+        _shutil.copytree (model, directory, ignore = _shutil.ignore_patterns (*IGNORED_FILES), dirs_exist_ok = True)
+
+        samples = { 'build': [], 'emit': [] }
+        for _ in range (repetitions):
+            result = pool.submit (_model.run, model, directory).result ()
+            if not result.success:
+                return result, None
+            samples ['build'].append (sum (output ['build_time'] for output in result.outputs))
+            samples ['emit'].append (sum (output ['render_time'] for output in result.outputs))
+
+        if cold:
+            samples ['cold'] = [ _cold_time (model, directory) for _ in range (repetitions) ]
+
+        timings = { key: None if None in values else _statistics.median (values) for key, values in samples.items () }
+
+        if openscad:
+            times = [ _openscad_time (source) for source in sorted (_pathlib.Path (directory).glob ('*.scad')) ]
+            timings ['openscad'] = None if None in times else sum (times)
+
+    return result, timings
+
+
+def regressions (timings, baseline, threshold):
+    for key, value in timings.items ():
+        previous = baseline.get (key)
+        if value is None or previous is None:
+            continue
+        if value - previous > max (previous * threshold, MINIMUM_DIFFERENCE):
+            yield key, previous, value
+
+
+def format_timings (label, timings, baseline):
+    columns = []
+    for key, value in timings.items ():
+        text = f'{key} {value:8.3f} s' if value is not None else f'{key} {"-":>8}  '
+        previous = baseline.get (key)
+        if value is not None and previous:
+            text += f' {(value - previous) / previous:+6.0%}'
+        columns.append (text)
+    return f'{label:48}  ' + '  '.join (columns)
+
+
+def main ():
+
+    parser = _argparse.ArgumentParser (description = 'Time the construction and emission of every model and compare with a baseline.')
+    parser.add_argument ('-n', '--repetitions', type = int, default = 5, help = 'runs per model, the median is reported')
+    parser.add_argument ('-o', '--openscad', action = 'store_true', help = 'also time an OpenSCAD render of every output')
+    parser.add_argument ('-c', '--cold', action = 'store_true', help = 'also time complete runs in a fresh interpreter')
+    parser.add_argument ('-b', '--baseline', default = BASELINE_FILE, help = 'baseline file, defaults to .bench-baseline.json')
+    parser.add_argument ('-s', '--save', action = 'store_true', help = 'store the results as the new baseline')
+    parser.add_argument ('-t', '--threshold', type = float, default = THRESHOLD, help = 'relative slowdown reported as a regression')
+    parser.add_argument ('models', nargs = '*', help = 'model directories, defaults to every model')
+    arguments = parser.parse_args ()
+
+    # Every output must be built, the scratch directories start empty
+    # but later repetitions would hit the cache otherwise.
+    _os.environ [_output.FORCE_VARIABLE] = '1'
+
+    if arguments.openscad and _render.openscad_version () is None:
+        print (f'OpenSCAD could not be run as {_render.OPENSCAD!r}, set OPENSCAD to its path, renders are not timed', file = _sys.stderr, flush = True)
+        arguments.openscad = False
+
+    baseline_path = _pathlib.Path (arguments.baseline)
+    try:
+        baseline = _json.loads (baseline_path.read_text ())
+    except (OSError, ValueError):
+        baseline = {}
+
+    models = [ _pathlib.Path (model).resolve () for model in arguments.models ] or _model.find_models ()
+    results = {}
+    found = []
+    failed = []
+
+    # Models run one at a time, parallel runs would disturb the timing.
+    with _futures.ProcessPoolExecutor (max_workers = 1, mp_context = _build.process_context (), max_tasks_per_child = 1) as pool:
+        for model in models:
+            result, timings = measure (pool, model, arguments.repetitions, arguments.openscad, arguments.cold)
+            if timings is None:
+                failed.append (result.model)
+                print (f'{result.model:48}  FAIL', flush = True)
+                continue
+            results [result.model] = timings
+            previous = baseline.get (result.model, {})
+            print (format_timings (result.model, timings, previous), flush = True)
+            found.extend (( result.model, *regression ) for regression in regressions (timings, previous, arguments.threshold))
+
+    if found:
+        print ()
+    for label, key, previous, value in found:
+        print (f'REGRESSION {label} {key} {previous:.3f} s -> {value:.3f} s')
+
+    print (f'\n{len (results)} models, {len (failed)} failed, {len (found)} regressions', flush = True)
+
+    if arguments.save:
+        baseline.update (results)
+        baseline_path.write_text (_json.dumps (baseline, indent = 4, sort_keys = True))
+
+    return 0 if not found and not failed else 1
+
+
+if __name__ == '__main__':
+    _sys.exit (main ())
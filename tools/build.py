@@ -0,0 +1,131 @@
+import argparse as _argparse
+import asyncio as _asyncio
+import concurrent.futures as _futures
+import csv as _csv
+import json as _json
+import multiprocessing as _multiprocessing
+import os as _os
+import pathlib as _pathlib
+import sys as _sys
+import time as _time
+
+from helpers import output as _output
+from helpers import tree as _tree
+from tools import model as _model
+
+
+REPORT_FIELDS = [ 'model', 'output', 'cached', 'build_time', 'render_time', 'size', 'depth', *_tree.CATEGORIES, 'nodes', 'emitted_nodes' ]
+
+
+def process_context ():
+
+    # Every model gets a fresh worker process because the solid libraries
+    # keep global state (default segments, collected includes) that would
+    # otherwise leak from one model into the next. The fork server keeps
+    # the libraries imported, so that the workers start warm.
+
+    context = _multiprocessing.get_context ('forkserver')
+    context.set_forkserver_preload ([ *_model.PRELOAD_MODULES, 'tools.model' ])
+    return context
+
+
+def build (models, jobs = None):
+    with _futures.ProcessPoolExecutor (max_workers = jobs or _os.cpu_count (), mp_context = process_context (), max_tasks_per_child = 1) as pool:
+        futures = [ pool.submit (_model.run, model) for model in models ]
+        for future in _futures.as_completed (futures):
+            yield future.result ()
+
+
+def _run_into (connection, model):
+    connection.send (_model.run (model))
+    connection.close ()
+
+
+async def build_async (model, context = None):
+
+    # The build runs in its own process, so that cancelling it
+    # kills the build rather than waiting for it to finish.
+
+    context = context or process_context ()
+    receiver, sender = context.Pipe (duplex = False)
+    process = context.Process (target = _run_into, args = ( sender, model ), daemon = True)
+    process.start ()
+    sender.close ()
+
+    loop = _asyncio.get_running_loop ()
+    ready = loop.create_future ()
+    loop.add_reader (receiver.fileno (), lambda: ready.done () or ready.set_result (None))
+
+    try:
+        await ready
+        try:
+            return receiver.recv ()
+        except EOFError:
+            process.join ()
+            return _model.Result (_model.model_label (model), False, 0.0, f'build process exited with code {process.exitcode}\n', [])
+    except BaseException:
+        process.kill ()
+        raise
+    finally:
+        loop.remove_reader (receiver.fileno ())
+        receiver.close ()
+        process.join ()
+
+
+def print_summary (results, duration, file = _sys.stdout):
+
+    results = sorted (results, key = lambda result: result.model)
+
+    for result in results:
+        print (_model.format_result (result), file = file)
+
+    for result in results:
+        if not result.success:
+            print (f'\n--- {result.model}\n{result.output.rstrip ()}', file = file)
+
+    failures = sum (1 for result in results if not result.success)
+    print (f'\n{len (results)} models, {failures} failed, {duration:.2f} s wall time', file = file, flush = True)
+
+
+def write_report (results, path):
+
+    # One row per output, the format follows the file suffix.
+
+    path = _pathlib.Path (path)
+    rows = [ { 'model': result.model, **output } for result in sorted (results, key = lambda result: result.model) for output in result.outputs ]
+
+    with open (path, 'w', newline = '') as file:
+        if path.suffix == '.csv':
+            writer = _csv.DictWriter (file, REPORT_FIELDS)
+            writer.writeheader ()
+            writer.writerows (rows)
+        else:
+            _json.dump (rows, file, indent = 4)
+
+
+def main ():
+
+    parser = _argparse.ArgumentParser (description = 'Build models in parallel.')
+    parser.add_argument ('-j', '--jobs', type = int, default = None, help = 'number of worker processes, defaults to core count')
+    parser.add_argument ('-F', '--force', action = 'store_true', help = 'build outputs even when they are current')
+    parser.add_argument ('-r', '--report', default = None, help = 'write output measurements to a json or csv file')
+    parser.add_argument ('models', nargs = '*', help = 'model directories, defaults to every model')
+    arguments = parser.parse_args ()
+
+    if arguments.force:
+        _os.environ [_output.FORCE_VARIABLE] = '1'
+
+    models = arguments.models or _model.find_models ()
+
+    start = _time.perf_counter ()
+    results = list (build (models, arguments.jobs))
+    print_summary (results, _time.perf_counter () - start)
+
+    if arguments.report:
+        write_report (results, arguments.report)
+
+    return 0 if all (result.success for result in results) else 1
+
+
+if __name__ == '__main__':
+    _sys.exit (main ())
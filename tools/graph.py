@@ -0,0 +1,69 @@
+import ast as _ast
+import pathlib as _pathlib
+
+from tools import model as _model
+
+
+def module_path (name):
+    path = _model.ROOT_PATH.joinpath (*name.split ('.')).with_suffix ('.py')
+    return path if path.is_file () else None
+
+
+def is_shared (name):
+    return name.split ('.') [0] in _model.SHARED_PACKAGES
+
+
+# The imports last read from every file, kept while a file does not parse.
+_imports = {}
+
+
+def imports (path):
+
+    # Only imports of shared modules matter, the libraries do not change.
+    # A file saved in the middle of an edit keeps its last known imports,
+    # the file itself still counts as changed and its build reports the error.
+
+    try:
+        tree = _ast.parse (_pathlib.Path (path).read_text (), str (path))
+    except ( SyntaxError, ValueError, OSError ):
+        return _imports.get (path, set ())
+
+    names = set ()
+
+    for node in _ast.walk (tree):
+        if isinstance (node, _ast.Import):
+            names.update (alias.name for alias in node.names)
+        elif isinstance (node, _ast.ImportFrom) and node.module and not node.level:
+            names.add (node.module)
+            # Handle from package import module too.
+            names.update (f'{node.module}.{alias.name}' for alias in node.names)
+
+    paths = [ module_path (name) for name in names if is_shared (name) ]
+    _imports [path] = { path for path in paths if path }
+    return _imports [path]
+
+
+def dependencies (model):
+
+    # Transitive closure, shared modules import each other too.
+
+    pending = [ _pathlib.Path (model).resolve () / _model.MAIN_FILE ]
+    visited = set ()
+
+    while pending:
+        path = pending.pop ()
+        for dependency in imports (path):
+            if dependency not in visited:
+                visited.add (dependency)
+                pending.append (dependency)
+
+    return visited
+
+
+def sources (model):
+    return { _pathlib.Path (model).resolve () / _model.MAIN_FILE } | dependencies (model)
+
+
+def dependents (models, changed):
+    changed = { _pathlib.Path (path).resolve () for path in changed }
+    return [ model for model in models if sources (model) & changed ]
@@ -0,0 +1,100 @@
+import collections as _collections
+import contextlib as _contextlib
+import io as _io
+import os as _os
+import pathlib as _pathlib
+import runpy as _runpy
+import sys as _sys
+import time as _time
+import traceback as _traceback
+
+
+ROOT_PATH = _pathlib.Path (__file__).resolve ().parent.parent
+THINGS_PATH = ROOT_PATH / 'things'
+
+MAIN_NAME = 'main'
+MAIN_FILE = f'{MAIN_NAME}.py'
+
+# Heavy libraries worth importing once per long-lived process. Only modules
+# that register nothing globally on import belong here, the BOSL2 extension
+# adds its includes to every file rendered afterwards.
+PRELOAD_MODULES = [ 'numpy', 'solid', 'solid.utils', 'solid2' ]
+
+# Project packages that models import and that may change between runs.
+SHARED_PACKAGES = [ 'components', 'helpers' ]
+
+
+# Module where models record measurements of their outputs.
+REPORT_MODULE = 'helpers.output'
+
+
+Result = _collections.namedtuple ('Result', [ 'model', 'success', 'duration', 'output', 'outputs' ])
+
+
+def find_models (root = THINGS_PATH):
+    return sorted (path.parent for path in root.rglob (MAIN_FILE))
+
+
+def model_module (model):
+    relative = _pathlib.Path (model).resolve ().relative_to (ROOT_PATH)
+    return '.'.join (( *relative.parts, MAIN_NAME ))
+
+
+def model_label (model):
+    return str (_pathlib.Path (model).resolve ().relative_to (THINGS_PATH))
+
+
+def forget_shared ():
+    for name in list (_sys.modules):
+        if name.split ('.') [0] in SHARED_PACKAGES:
+            del _sys.modules [name]
+
+
+def format_result (result):
+
+    # Outputs that were built also tell how much the emitted tree shrank.
+
+    status = 'ok' if result.success else 'FAIL'
+    text = f'{status:4} {result.duration:8.2f} s  {result.model}'
+
+    built = [ output for output in result.outputs if output.get ('emitted_nodes') is not None ]
+    nodes = sum (output ['nodes'] or 0 for output in built)
+    if nodes:
+        emitted = sum (output ['emitted_nodes'] for output in built)
+        text = f'{text:60}  {nodes:7} -> {emitted:7} nodes {(emitted - nodes) / nodes:+6.0%}'
+
+    return text
+
+
+def run (model, directory = None):
+
+    # Models write their outputs relative to the current directory,
+    # which is the model directory unless another one is given.
+    # The module is executed the same way python -m would do it,
+    # with shared modules imported afresh in case they changed.
+
+    model = _pathlib.Path (model).resolve ()
+    output = _io.StringIO ()
+    success = False
+
+    if str (ROOT_PATH) not in _sys.path:
+        _sys.path.insert (0, str (ROOT_PATH))
+
+    forget_shared ()
+
+    previous = _os.getcwd ()
+    start = _time.perf_counter ()
+    try:
+        _os.chdir (directory or model)
+        with _contextlib.redirect_stdout (output), _contextlib.redirect_stderr (output):
+            _runpy.run_module (model_module (model), run_name = '__main__', alter_sys = True)
+        success = True
+    except BaseException:
+        output.write (_traceback.format_exc ())
+    finally:
+        _os.chdir (previous)
+    duration = _time.perf_counter () - start
+
+    outputs = getattr (_sys.modules.get (REPORT_MODULE), 'report', [])
+
+    return Result (model_label (model), success, duration, output.getvalue (), outputs)
@@ -0,0 +1,194 @@
+import argparse as _argparse
+import asyncio as _asyncio
+import collections as _collections
+import hashlib as _hashlib
+import json as _json
+import os as _os
+import pathlib as _pathlib
+import re as _re
+import signal as _signal
+import subprocess as _subprocess
+import sys as _sys
+import time as _time
+
+from helpers import output as _output
+from tools import model as _model
+
+
+OPENSCAD = _os.environ.get ('OPENSCAD', 'openscad')
+
+FORMATS = [ 'stl', '3mf', 'off', 'amf' ]
+
+RENDER_CACHE_FILE = '.render-cache.json'
+
+# Files referenced from the source that influence the rendered mesh.
+REFERENCE_PATTERNS = [ _re.compile (r'(?:use|include)\s*<([^>]+)>'), _re.compile (r'file\s*=\s*"([^"]+)"') ]
+
+
+Job = _collections.namedtuple ('Job', [ 'source', 'target' ])
+Outcome = _collections.namedtuple ('Outcome', [ 'job', 'success', 'cached', 'attempts', 'duration', 'output' ])
+
+
+def model_outputs (model):
+
+    # The outputs are those the model registered in its build cache.
+
+    model = _pathlib.Path (model).resolve ()
+    try:
+        names = _json.loads ((model / _output.CACHE_FILE).read_text ())
+    except (OSError, ValueError):
+        return []
+    return [ model / name for name in sorted (names) if (model / name).exists () ]
+
+
+def make_jobs (sources, formats):
+    return [ Job (source, source.with_suffix (f'.{suffix}')) for source in sources for suffix in formats ]
+
+
+def openscad_version ():
+    try:
+        process = _subprocess.run ([ OPENSCAD, '--version' ], capture_output = True, text = True)
+    except OSError:
+        return None
+    return (process.stdout + process.stderr).strip ()
+
+
+def render_key (job, version):
+
+    digest = _hashlib.sha256 ()
+    digest.update (f'{version}\n{job.target.suffix}\n'.encode ())
+
+    text = job.source.read_text (encoding = 'utf-8')
+    digest.update (text.encode ())
+
+    for pattern in REFERENCE_PATTERNS:
+        for reference in pattern.findall (text):
+            path = job.source.parent / reference
+            if path.is_file ():
+                digest.update (path.read_bytes ())
+
+    return digest.hexdigest ()
+
+
+def _load_cache (directory):
+    try:
+        return _json.loads ((directory / RENDER_CACHE_FILE).read_text ())
+    except (OSError, ValueError):
+        return {}
+
+
+def _store_cache (directory, cache):
+    (directory / RENDER_CACHE_FILE).write_text (_json.dumps (cache, indent = 4, sort_keys = True))
+
+
+async def _run_openscad (job, timeout):
+
+    # Render into a temporary file so that a killed or failed run
+    # never leaves a truncated mesh behind.
+
+    partial = job.target.with_name (f'.{job.target.stem}.partial{job.target.suffix}')
+    try:
+        process = await _asyncio.create_subprocess_exec (
+            OPENSCAD, '-o', str (partial), str (job.source),
+            stdout = _asyncio.subprocess.PIPE, stderr = _asyncio.subprocess.STDOUT,
+            start_new_session = True)
+    except OSError as error:
+        return False, f'OpenSCAD could not be run as {OPENSCAD!r}, set OPENSCAD to its path: {error}\n'
+
+    try:
+        output, _ = await _asyncio.wait_for (process.communicate (), timeout)
+    except BaseException:
+        # Kill the whole session in case the run spawned helpers.
+        _os.killpg (process.pid, _signal.SIGKILL)
+        await process.wait ()
+        partial.unlink (missing_ok = True)
+        raise
+
+    if process.returncode != 0 or not partial.exists ():
+        partial.unlink (missing_ok = True)
+        return False, output.decode (errors = 'replace')
+
+    _os.replace (partial, job.target)
+    return True, output.decode (errors = 'replace')
+
+
+async def render_job (job, limit, timeout, retries, version):
+
+    key = render_key (job, version)
+    if _load_cache (job.source.parent).get (job.target.name) == key and job.target.exists ():
+        return Outcome (job, True, True, 0, 0.0, '')
+
+    async with limit:
+        start = _time.perf_counter ()
+        attempts = 0
+        success = False
+        output = ''
+        while not success and attempts <= retries:
+            attempts += 1
+            try:
+                success, output = await _run_openscad (job, timeout)
+            except _asyncio.TimeoutError:
+                output = f'timed out after {timeout} s'
+        duration = _time.perf_counter () - start
+
+    if success:
+        cache = _load_cache (job.source.parent)
+        cache [job.target.name] = key
+        _store_cache (job.source.parent, cache)
+
+    return Outcome (job, success, False, attempts, duration, output)
+
+
+async def render (jobs, concurrency = None, timeout = None, retries = 0):
+    limit = _asyncio.Semaphore (concurrency or _os.cpu_count ())
+    version = openscad_version ()
+    return await _asyncio.gather (*[ render_job (job, limit, timeout, retries, version) for job in jobs ])
+
+
+def format_outcome (outcome):
+    status = 'ok' if outcome.success else 'FAIL'
+    note = 'cached' if outcome.cached else f'{outcome.attempts} attempts' if outcome.attempts > 1 else ''
+    return f'{status:4} {outcome.duration:8.2f} s  {outcome.job.target.relative_to (_model.ROOT_PATH)}  {note}'.rstrip ()
+
+
+def print_summary (outcomes, duration, file = _sys.stdout):
+
+    outcomes = sorted (outcomes, key = lambda outcome: outcome.job.target)
+
+    for outcome in outcomes:
+        print (format_outcome (outcome), file = file)
+
+    for outcome in outcomes:
+        if not outcome.success:
+            print (f'\n--- {outcome.job.target.relative_to (_model.ROOT_PATH)}\n{outcome.output.rstrip ()}', file = file)
+
+    failures = sum (1 for outcome in outcomes if not outcome.success)
+    cached = sum (1 for outcome in outcomes if outcome.cached)
+    print (f'\n{len (outcomes)} renders, {cached} cached, {failures} failed, {duration:.2f} s wall time', file = file, flush = True)
+
+
+def main ():
+
+    parser = _argparse.ArgumentParser (description = 'Render model outputs to meshes with parallel OpenSCAD runs.')
+    parser.add_argument ('-f', '--format', action = 'append', choices = FORMATS, help = 'mesh format, can be repeated, defaults to stl')
+    parser.add_argument ('-j', '--jobs', type = int, default = None, help = 'concurrent OpenSCAD runs, defaults to core count')
+    parser.add_argument ('-t', '--timeout', type = float, default = None, help = 'seconds before a run is killed')
+    parser.add_argument ('-r', '--retries', type = int, default = 0, help = 'repeated attempts after a failed run')
+    parser.add_argument ('paths', nargs = '*', help = 'model directories or scad files, defaults to every model')
+    arguments = parser.parse_args ()
+
+    sources = []
+    for path in map (_pathlib.Path, arguments.paths or _model.find_models ()):
+        sources.extend ([ path.resolve () ] if path.suffix == '.scad' else model_outputs (path))
+
+    jobs = make_jobs (sources, arguments.format or [ 'stl' ])
+
+    start = _time.perf_counter ()
+    outcomes = _asyncio.run (render (jobs, arguments.jobs, arguments.timeout, arguments.retries))
+    print_summary (outcomes, _time.perf_counter () - start)
+
+    return 0 if all (outcome.success for outcome in outcomes) else 1
+
+
+if __name__ == '__main__':
+    _sys.exit (main ())
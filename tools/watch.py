@@ -0,0 +1,166 @@
+import argparse as _argparse
+import asyncio as _asyncio
+import os as _os
+import pathlib as _pathlib
+import sys as _sys
+import time as _time
+
+from tools import build as _build
+from tools import graph as _graph
+from tools import model as _model
+from tools import render as _render
+
+
+SHARED_PATHS = [ _model.ROOT_PATH / package for package in _model.SHARED_PACKAGES ]
+
+# Seconds without further events that end a burst of changes.
+DEBOUNCE = 0.2
+
+
+async def _events (directories, recursive, queue):
+
+    # Watch directories rather than files, editors often save by renaming.
+    command = [ 'inotifywait', '--monitor', '--quiet', '--event', 'close_write,moved_to', '--format', '%w%f' ]
+    if recursive:
+        command.append ('--recursive')
+    command.extend (str (directory) for directory in directories)
+
+    try:
+        process = await _asyncio.create_subprocess_exec (*command, stdout = _asyncio.subprocess.PIPE)
+        try:
+            async for line in process.stdout:
+                queue.put_nowait (_pathlib.Path (line.decode ().rstrip ('\n')).resolve ())
+        finally:
+            if process.returncode is None:
+                process.kill ()
+            await process.wait ()
+    finally:
+        # Tell the consumer there will be no more events.
+        queue.put_nowait (None)
+
+
+async def bursts (directories, recursive = False, delay = DEBOUNCE):
+
+    # A save often touches several files in quick succession,
+    # every burst of events is reported as one set of changed paths.
+
+    queue = _asyncio.Queue ()
+    reader = _asyncio.create_task (_events (directories, recursive, queue))
+
+    try:
+        while True:
+            changed = { await queue.get () }
+            while None not in changed:
+                try:
+                    changed.add (await _asyncio.wait_for (queue.get (), delay))
+                except _asyncio.TimeoutError:
+                    break
+            if None in changed:
+                await reader
+                return
+            yield changed
+    finally:
+        reader.cancel ()
+
+
+def make_limits ():
+    return _asyncio.Semaphore (_os.cpu_count ()), _asyncio.Semaphore (_os.cpu_count ())
+
+
+async def update (model, limits, formats, version):
+
+    # Build the model and render its outputs, cancelling the task
+    # kills whichever of the two is running at the moment.
+
+    builds, renders = limits
+
+    async with builds:
+        result = await _build.build_async (model)
+
+    if not result.success or not formats:
+        return result
+
+    jobs = _render.make_jobs (_render.model_outputs (model), formats)
+    outcomes = await _asyncio.gather (*[ _render.render_job (job, renders, None, 0, version) for job in jobs ])
+
+    for outcome in outcomes:
+        print (_render.format_outcome (outcome), flush = True)
+
+    failures = [ outcome for outcome in outcomes if not outcome.success ]
+    if failures:
+        output = ''.join (f'{outcome.job.target.name}: {outcome.output.rstrip ()}\n' for outcome in failures)
+        result = result._replace (success = False, output = result.output + output)
+
+    return result
+
+
+def describe (paths):
+    if len (paths) == 1:
+        return str (next (iter (paths)).relative_to (_model.ROOT_PATH))
+    return f'{len (paths)} files'
+
+
+async def rebuild (models, tasks, running):
+
+    start = _time.perf_counter ()
+    done = await _asyncio.gather (*tasks, return_exceptions = True)
+
+    for model, task in zip (models, tasks):
+        if running.get (model) is task:
+            del running [model]
+
+    for outcome in done:
+        if isinstance (outcome, BaseException) and not isinstance (outcome, _asyncio.CancelledError):
+            raise outcome
+
+    results = [ outcome for outcome in done if isinstance (outcome, _model.Result) ]
+    if results:
+        _build.print_summary (results, _time.perf_counter () - start)
+    if len (results) < len (models):
+        print (f'{len (models) - len (results)} stale builds cancelled', flush = True)
+
+
+async def serve (formats):
+
+    # Every change rebuilds exactly the models whose sources include the changed files,
+    # a newer change supersedes whatever is still running for the same model.
+
+    limits = make_limits ()
+    version = _render.openscad_version () if formats else None
+    running = {}
+    batches = set ()
+
+    def schedule (models):
+        for model in models:
+            if model in running:
+                running.pop (model).cancel ()
+        tasks = [ _asyncio.create_task (update (model, limits, formats, version)) for model in models ]
+        running.update (zip (models, tasks))
+        batch = _asyncio.create_task (rebuild (models, tasks, running))
+        batches.add (batch)
+        batch.add_done_callback (batches.discard)
+
+    schedule (_model.find_models ())
+
+    async for paths in bursts ([ _model.THINGS_PATH, *SHARED_PATHS ], recursive = True):
+        paths = { path for path in paths if path.suffix == '.py' }
+        models = _graph.dependents (_model.find_models (), paths)
+        if models:
+            print (f'\n{describe (paths)} changed, rebuilding {len (models)} models', flush = True)
+            schedule (models)
+
+
+def main ():
+
+    parser = _argparse.ArgumentParser (description = 'Rebuild models whenever their sources or shared modules change.')
+    parser.add_argument ('-f', '--format', action = 'append', choices = _render.FORMATS, help = 'also render the outputs to meshes, can be repeated')
+    arguments = parser.parse_args ()
+
+    try:
+        _asyncio.run (serve (arguments.format or []))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    _sys.exit (main ())
@@ -0,0 +1,57 @@
+import argparse as _argparse
+import asyncio as _asyncio
+import pathlib as _pathlib
+import sys as _sys
+
+from tools import graph as _graph
+from tools import model as _model
+from tools import render as _render
+from tools import watch as _watch
+
+
+def report (result):
+    if result.output:
+        print (result.output, end = '' if result.output.endswith ('\n') else '\n')
+    print (_model.format_result (result), flush = True)
+
+
+async def _update (model, limits, formats, version):
+    try:
+        report (await _watch.update (model, limits, formats, version))
+    except _asyncio.CancelledError:
+        print ('stale build cancelled', flush = True)
+        raise
+
+
+async def serve (model, formats):
+
+    # The libraries stay imported in the fork server, each build runs in
+    # a warm process that is killed when a newer revision arrives.
+
+    model = _pathlib.Path (model).resolve ()
+    limits = _watch.make_limits ()
+    version = _render.openscad_version () if formats else None
+
+    task = _asyncio.create_task (_update (model, limits, formats, version))
+
+    async for paths in _watch.bursts ([ model, *_watch.SHARED_PATHS ]):
+        if paths & _graph.sources (model):
+            task.cancel ()
+            task = _asyncio.create_task (_update (model, limits, formats, version))
+
+
+def main ():
+
+    parser = _argparse.ArgumentParser (description = 'Rebuild a model whenever its source or the shared modules it imports change.')
+    parser.add_argument ('-f', '--format', action = 'append', choices = _render.FORMATS, help = 'also render the outputs to meshes, can be repeated')
+    parser.add_argument ('model', help = 'model directory')
+    arguments = parser.parse_args ()
+
+    try:
+        _asyncio.run (serve (arguments.model, arguments.format or []))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    _sys.exit (main ())